@@ -7,6 +7,10 @@ from typing import Any
 
 from .prompt_utils import build_agent_context
 
+DEFAULT_MARGIN_FLOOR_PCT = 20.0
+SUPERVISOR_REVIEW_DISCOUNT_PCT = 10.0
+EXECUTIVE_APPROVAL_DISCOUNT_PCT = 20.0
+
 
 @dataclass
 class DiscountSupervisor:
@@ -32,7 +36,7 @@ class DiscountSupervisor:
 
     def evaluate(self, payload: dict[str, Any]) -> dict[str, Any]:
         client_context = payload.get("client_context", {})
-        floor = float(payload.get("minimum_margin_pct", 20))
+        floor = float(payload.get("minimum_margin_pct", DEFAULT_MARGIN_FLOOR_PCT))
         max_discount = float(client_context.get("max_discount_pct", 100))
         current_margin = float(payload.get("current_margin_pct", 0))
         requested = float(payload.get("requested_discount_pct", 0))
@@ -48,10 +52,10 @@ class DiscountSupervisor:
                 f"Reject {requested:.1f}% discount for {payload.get('product_name', 'product')}: "
                 f"margin drops to {post_discount_margin:.1f}% below floor {floor:.1f}%."
             )
-        elif requested > 20 or (post_discount_margin < floor and override):
+        elif requested > EXECUTIVE_APPROVAL_DISCOUNT_PCT or (post_discount_margin < floor and override):
             action = "executive_approval_required"
             text = "Escalate to executive approver due to high discount risk."
-        elif requested > 10:
+        elif requested > SUPERVISOR_REVIEW_DISCOUNT_PCT:
             action = "supervisor_review_required"
             text = "Request supervisor review before publishing this discount."
         else:
@@ -0,0 +1,107 @@
+"""Per-client promotion rules compiled to arrays for evaluating whole carts or catalogs at once.
+
+Applies the same policy as ``DiscountSupervisor.evaluate`` (max discount, margin floor, review tiers,
+strategic override) plus category exclusions, one numpy pass per batch of lines instead of one call per
+line. Kept out of the package ``__init__`` so the API's agent imports stay free of numpy.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from .discount_supervisor import (
+    DEFAULT_MARGIN_FLOOR_PCT,
+    EXECUTIVE_APPROVAL_DISCOUNT_PCT,
+    SUPERVISOR_REVIEW_DISCOUNT_PCT,
+)
+
+APPROVE = "approve_discount"
+SUPERVISOR_REVIEW = "supervisor_review_required"
+EXECUTIVE_APPROVAL = "executive_approval_required"
+REJECT = "reject_discount"
+
+
+def _to_float(value: Any, default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass(frozen=True)
+class PromotionRules:
+    max_discount_pct: float = 100.0
+    margin_floor_pct: float = DEFAULT_MARGIN_FLOOR_PCT
+    excluded_categories: frozenset[str] = frozenset()
+    # Ascending (threshold, action) pairs: a discount above a threshold needs that action's approval.
+    review_tiers: tuple[tuple[float, str], ...] = (
+        (SUPERVISOR_REVIEW_DISCOUNT_PCT, SUPERVISOR_REVIEW),
+        (EXECUTIVE_APPROVAL_DISCOUNT_PCT, EXECUTIVE_APPROVAL),
+    )
+
+    @classmethod
+    def from_profile(cls, profile: dict[str, Any]) -> PromotionRules:
+        excluded = profile.get("discount_excluded_categories") or ""
+        if isinstance(excluded, str):
+            excluded = excluded.split(",")
+        return cls(
+            max_discount_pct=_to_float(profile.get("max_discount_pct"), 100.0),
+            margin_floor_pct=_to_float(profile.get("minimum_margin_pct"), DEFAULT_MARGIN_FLOOR_PCT),
+            excluded_categories=frozenset(str(category).strip().lower() for category in excluded if str(category).strip()),
+        )
+
+
+@dataclass(frozen=True)
+class CompiledPromotionRules:
+    max_discount_pct: float
+    margin_floor_pct: float
+    excluded_categories: np.ndarray
+    tier_thresholds: np.ndarray
+    actions: np.ndarray
+
+    def evaluate(
+        self,
+        current_margin_pct,
+        requested_discount_pct,
+        categories=None,
+        strategic_override=None,
+    ) -> dict[str, np.ndarray]:
+        """Evaluate every line at once; returns ``action`` and ``post_discount_margin`` arrays."""
+        margin = np.asarray(current_margin_pct, dtype=float)
+        requested = np.asarray(requested_discount_pct, dtype=float)
+        margin, requested = np.broadcast_arrays(margin, requested)
+        override = (
+            np.zeros(requested.shape, dtype=bool)
+            if strategic_override is None
+            else np.broadcast_to(np.asarray(strategic_override, dtype=bool), requested.shape)
+        )
+        post_margin = margin - requested
+        below_floor = post_margin < self.margin_floor_pct
+
+        rejected = (requested > self.max_discount_pct) | below_floor
+        if categories is not None and self.excluded_categories.size:
+            normalized = np.char.lower(np.char.strip(np.asarray(categories, dtype=str)))
+            rejected |= np.isin(normalized, self.excluded_categories) & (requested > 0)
+        rejected &= ~override
+
+        # Index 0 approves; index i means the discount exceeds the i-th review threshold.
+        tier = np.searchsorted(self.tier_thresholds, requested, side="left")
+        tier = np.where(override & below_floor, len(self.tier_thresholds), tier)
+        action = np.where(rejected, REJECT, self.actions[tier])
+        return {"action": action, "post_discount_margin": post_margin}
+
+
+@lru_cache(maxsize=256)
+def compile_rules(rules: PromotionRules) -> CompiledPromotionRules:
+    tiers = sorted(rules.review_tiers)
+    return CompiledPromotionRules(
+        max_discount_pct=rules.max_discount_pct,
+        margin_floor_pct=rules.margin_floor_pct,
+        excluded_categories=np.array(sorted(rules.excluded_categories), dtype=str),
+        tier_thresholds=np.array([threshold for threshold, _ in tiers], dtype=float),
+        actions=np.array([APPROVE, *(action for _, action in tiers)]),
+    )
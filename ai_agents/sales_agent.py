@@ -28,6 +28,7 @@ class SalesAgent:
                 "current_margin_pct": {"type": "number"},
                 "requested_discount_pct": {"type": "number"},
                 "campaign_goal": {"type": "string"},
+                "bundle_products": {"type": "array", "items": {"type": "string"}},
             },
             "additionalProperties": False,
         }
@@ -40,6 +41,7 @@ class SalesAgent:
         requested_discount = float(payload.get("requested_discount_pct", 0))
         stock_days_cover = float(payload.get("stock_days_cover", 30))
         product_name = payload.get("product_name", "product")
+        bundle_products = [name for name in payload.get("bundle_products") or [] if name][:3]
         margin_after_discount = current_margin - requested_discount
 
         if margin_after_discount < 20:
@@ -48,6 +50,8 @@ class SalesAgent:
                 f"Avoid discounting {product_name}; margin falls to "
                 f"{margin_after_discount:.1f}%. Recommend value-add upsell."
             )
+            if bundle_products:
+                text += f" Customers often add {', '.join(bundle_products)}."
         elif stock_days_cover <= 3:
             action = "push_sales_with_urgency"
             text = (
@@ -57,4 +61,8 @@ class SalesAgent:
         else:
             action = "standard_sales_push"
             text = f"Promote {product_name} with benefit-led messaging; no aggressive urgency needed."
-        return {"action": action, "text": text, "metadata": {"margin_after_discount": margin_after_discount}}
+        return {
+            "action": action,
+            "text": text,
+            "metadata": {"margin_after_discount": margin_after_discount, "bundle_products": bundle_products},
+        }
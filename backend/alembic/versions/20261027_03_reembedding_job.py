@@ -0,0 +1,44 @@
+"""add shadow embedding column and re-embedding checkpoints
+
+Revision ID: 20261027_03
+Revises: 20261027_02
+Create Date: 2026-10-27 00:20:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_03'
+down_revision: str | None = '20261027_02'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('product_images', sa.Column('embedding_next', Vector(1536), nullable=True))
+    op.create_table(
+        'reembedding_checkpoints',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('model', sa.String(length=120), nullable=False),
+        sa.Column('status', sa.Enum('running', 'completed', name='reembedding_status'), nullable=False),
+        sa.Column('last_image_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('processed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_reembedding_checkpoints_model'), 'reembedding_checkpoints', ['model'], unique=True)
+    op.create_index(op.f('ix_reembedding_checkpoints_status'), 'reembedding_checkpoints', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_reembedding_checkpoints_status'), table_name='reembedding_checkpoints')
+    op.drop_index(op.f('ix_reembedding_checkpoints_model'), table_name='reembedding_checkpoints')
+    op.drop_table('reembedding_checkpoints')
+    op.execute('DROP TYPE IF EXISTS reembedding_status')
+    op.drop_column('product_images', 'embedding_next')
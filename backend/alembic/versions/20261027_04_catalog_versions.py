@@ -0,0 +1,31 @@
+"""add per-tenant catalog versions
+
+Revision ID: 20261027_04
+Revises: 20261027_03
+Create Date: 2026-10-27 00:30:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_04'
+down_revision: str | None = '20261027_03'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'catalog_versions',
+        sa.Column('client_id', sa.String(length=100), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('client_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('catalog_versions')
@@ -0,0 +1,46 @@
+"""add product import jobs
+
+Revision ID: 20261027_05
+Revises: 20261027_04
+Create Date: 2026-10-27 00:40:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_05'
+down_revision: str | None = '20261027_04'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+product_import_status = sa.Enum('queued', 'running', 'completed', 'failed', name='product_import_status')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'product_import_jobs',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('client_id', sa.String(length=100), nullable=False),
+        sa.Column('status', product_import_status, nullable=False, server_default='queued'),
+        sa.Column('total_rows', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('processed_rows', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('failed_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('errors_json', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_product_import_jobs_client_id', 'product_import_jobs', ['client_id'])
+    op.create_index('ix_product_import_jobs_status', 'product_import_jobs', ['status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_product_import_jobs_status', table_name='product_import_jobs')
+    op.drop_index('ix_product_import_jobs_client_id', table_name='product_import_jobs')
+    op.drop_table('product_import_jobs')
+    product_import_status.drop(op.get_bind(), checkfirst=True)
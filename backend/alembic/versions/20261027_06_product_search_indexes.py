@@ -0,0 +1,30 @@
+"""add trigram indexes for product search
+
+Revision ID: 20261027_06
+Revises: 20261027_05
+Create Date: 2026-10-27 00:50:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_06'
+down_revision: str | None = '20261027_05'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in ('name', 'sku', 'category'):
+        op.execute(
+            f'CREATE INDEX IF NOT EXISTS ix_products_{column}_trgm '
+            f'ON products USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def downgrade() -> None:
+    for column in ('category', 'sku', 'name'):
+        op.drop_index(f'ix_products_{column}_trgm', table_name='products')
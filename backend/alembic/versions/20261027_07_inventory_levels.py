@@ -0,0 +1,69 @@
+"""add inventory levels and stock reservations
+
+Revision ID: 20261027_07
+Revises: 20261027_06
+Create Date: 2026-10-27 01:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_07'
+down_revision: str | None = '20261027_06'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+stock_reservation_status = sa.Enum('active', 'consumed', 'released', 'expired', name='stock_reservation_status')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'inventory_levels',
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('on_hand', sa.Numeric(12, 3), nullable=False, server_default='0'),
+        sa.Column('reserved', sa.Numeric(12, 3), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('product_id'),
+    )
+    op.create_table(
+        'stock_reservations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Numeric(12, 3), nullable=False),
+        sa.Column('status', stock_reservation_status, nullable=False, server_default='active'),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='RESTRICT'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_stock_reservations_order_id', 'stock_reservations', ['order_id'])
+    op.create_index('ix_stock_reservations_product_id', 'stock_reservations', ['product_id'])
+    op.create_index('ix_stock_reservations_status_expires_at', 'stock_reservations', ['status', 'expires_at'])
+
+    # Products that already have movement history start out tracked at their net quantity.
+    op.execute(
+        """
+        INSERT INTO inventory_levels (product_id, on_hand, reserved, updated_at)
+        SELECT product_id,
+               SUM(CASE WHEN movement_type IN ('out', 'return_out') THEN -quantity ELSE quantity END),
+               0,
+               now()
+        FROM stock_movements
+        GROUP BY product_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stock_reservations_status_expires_at', table_name='stock_reservations')
+    op.drop_index('ix_stock_reservations_product_id', table_name='stock_reservations')
+    op.drop_index('ix_stock_reservations_order_id', table_name='stock_reservations')
+    op.drop_table('stock_reservations')
+    stock_reservation_status.drop(op.get_bind(), checkfirst=True)
+    op.drop_table('inventory_levels')
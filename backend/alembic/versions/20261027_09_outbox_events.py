@@ -0,0 +1,44 @@
+"""add outbox events for sales posting
+
+Revision ID: 20261027_09
+Revises: 20261027_08
+Create Date: 2026-10-27 01:20:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_09'
+down_revision: str | None = '20261027_08'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('topic', sa.String(length=60), nullable=False),
+        sa.Column('payload_json', sa.Text(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_outbox_events_pending',
+        'outbox_events',
+        ['topic', 'id'],
+        postgresql_where=sa.text('processed_at IS NULL'),
+    )
+    op.create_index('ix_outbox_events_processed_at', 'outbox_events', ['processed_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_events_processed_at', table_name='outbox_events')
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events')
+    op.drop_table('outbox_events')
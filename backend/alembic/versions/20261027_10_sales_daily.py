@@ -0,0 +1,49 @@
+"""add sales_daily rollup
+
+Revision ID: 20261027_10
+Revises: 20261027_09
+Create Date: 2026-10-27 01:40:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_10'
+down_revision: str | None = '20261027_09'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sales_daily',
+        sa.Column('client_id', sa.String(length=100), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('sale_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('units', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('revenue', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('cost', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('client_id', 'day', 'product_id'),
+    )
+    op.create_index('ix_sales_daily_product_id', 'sales_daily', ['product_id'])
+    op.execute(
+        """
+        INSERT INTO sales_daily (client_id, day, product_id, sale_count, units, revenue, cost, updated_at)
+        SELECT s.client_id, s.sale_date::date, s.product_id, count(*), sum(s.qty),
+               sum(s.qty * s.selling_price), sum(s.qty * p.unit_cost), now()
+        FROM sales s
+        JOIN products p ON p.id = s.product_id
+        GROUP BY s.client_id, s.sale_date::date, s.product_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sales_daily_product_id', table_name='sales_daily')
+    op.drop_table('sales_daily')
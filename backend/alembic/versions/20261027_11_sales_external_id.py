@@ -0,0 +1,27 @@
+"""add client-supplied external id to sales
+
+Revision ID: 20261027_11
+Revises: 20261027_10
+Create Date: 2026-10-27 02:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_11'
+down_revision: str | None = '20261027_10'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('sales', sa.Column('external_id', sa.String(length=100), nullable=True))
+    op.create_unique_constraint('uq_sales_client_external_id', 'sales', ['client_id', 'external_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_sales_client_external_id', 'sales', type_='unique')
+    op.drop_column('sales', 'external_id')
@@ -0,0 +1,37 @@
+"""add product associations for frequently-bought-together
+
+Revision ID: 20261027_12
+Revises: 20261027_11
+Create Date: 2026-10-27 02:20:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_12'
+down_revision: str | None = '20261027_11'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'product_associations',
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('associated_product_id', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('pair_count', sa.Integer(), nullable=False),
+        sa.Column('confidence', sa.Float(), nullable=False),
+        sa.Column('lift', sa.Float(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['associated_product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('product_id', 'associated_product_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('product_associations')
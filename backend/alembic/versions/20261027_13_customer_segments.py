@@ -0,0 +1,41 @@
+"""add customer RFM segments
+
+Revision ID: 20261027_13
+Revises: 20261027_12
+Create Date: 2026-10-27 02:40:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_13'
+down_revision: str | None = '20261027_12'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'customer_segments',
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('last_activity_date', sa.Date(), nullable=True),
+        sa.Column('recency_days', sa.Integer(), nullable=True),
+        sa.Column('frequency', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('monetary', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('recency_score', sa.Integer(), nullable=False),
+        sa.Column('frequency_score', sa.Integer(), nullable=False),
+        sa.Column('monetary_score', sa.Integer(), nullable=False),
+        sa.Column('segment', sa.String(length=30), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('customer_id'),
+    )
+    op.create_index('ix_customer_segments_segment', 'customer_segments', ['segment'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_customer_segments_segment', table_name='customer_segments')
+    op.drop_table('customer_segments')
@@ -0,0 +1,70 @@
+"""add billing runs, document sequences and order invoice link
+
+Revision ID: 20261027_14
+Revises: 20261027_13
+Create Date: 2026-10-27 03:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_14'
+down_revision: str | None = '20261027_13'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+billing_run_status = sa.Enum('queued', 'running', 'completed', 'failed', name='billing_run_status')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'document_sequences',
+        sa.Column('name', sa.String(length=40), nullable=False),
+        sa.Column('next_value', sa.BigInteger(), nullable=False, server_default='1'),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    # Continue numbering after any invoices created before sequences existed.
+    op.execute(
+        """
+        INSERT INTO document_sequences (name, next_value)
+        SELECT 'invoice', count(*) + 1 FROM invoices
+        """
+    )
+
+    op.create_table(
+        'billing_runs',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('issue_date', sa.Date(), nullable=False),
+        sa.Column('status', billing_run_status, nullable=False, server_default='queued'),
+        sa.Column('invoices_created', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('orders_billed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('amount_billed', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('last_customer_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_billing_runs_status', 'billing_runs', ['status'])
+
+    op.add_column('orders', sa.Column('invoice_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('fk_orders_invoice_id', 'orders', 'invoices', ['invoice_id'], ['id'], ondelete='SET NULL')
+    op.create_index('ix_orders_invoice_id', 'orders', ['invoice_id'])
+    op.execute(
+        "CREATE INDEX ix_orders_unbilled ON orders (customer_id, id) WHERE status = 'fulfilled' AND invoice_id IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_orders_unbilled')
+    op.drop_index('ix_orders_invoice_id', table_name='orders')
+    op.drop_constraint('fk_orders_invoice_id', 'orders', type_='foreignkey')
+    op.drop_column('orders', 'invoice_id')
+    op.drop_index('ix_billing_runs_status', table_name='billing_runs')
+    op.drop_table('billing_runs')
+    billing_run_status.drop(op.get_bind(), checkfirst=True)
+    op.drop_table('document_sequences')
@@ -0,0 +1,27 @@
+"""add return timestamps and the return_items lookup index
+
+Revision ID: 20261027_15
+Revises: 20261027_14
+Create Date: 2026-10-27 03:20:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_15'
+down_revision: str | None = '20261027_14'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE returns ADD COLUMN IF NOT EXISTS created_at TIMESTAMP NOT NULL DEFAULT now()')
+    op.execute('CREATE INDEX IF NOT EXISTS ix_returns_created_at ON returns (created_at)')
+    op.execute('CREATE INDEX IF NOT EXISTS ix_return_items_order_item_id ON return_items (order_item_id)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_returns_created_at')
+    op.execute('ALTER TABLE returns DROP COLUMN IF EXISTS created_at')
@@ -0,0 +1,38 @@
+"""add per-customer balance snapshots for statement opening balances
+
+Revision ID: 20261027_16
+Revises: 20261027_15
+Create Date: 2026-10-27 03:40:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_16'
+down_revision: str | None = '20261027_15'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'customer_balance_snapshots',
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('balance_date', sa.Date(), nullable=False),
+        sa.Column('balance', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('customer_id', 'balance_date'),
+    )
+    # The statement range query walks both ledgers by customer and date.
+    op.execute('CREATE INDEX IF NOT EXISTS ix_invoices_customer_issue_date ON invoices (customer_id, issue_date)')
+    op.execute('CREATE INDEX IF NOT EXISTS ix_payments_customer_payment_date ON payments (customer_id, payment_date)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_payments_customer_payment_date')
+    op.execute('DROP INDEX IF EXISTS ix_invoices_customer_issue_date')
+    op.drop_table('customer_balance_snapshots')
@@ -0,0 +1,66 @@
+"""add per-customer receivable balance projection
+
+Revision ID: 20261027_17
+Revises: 20261027_16
+Create Date: 2026-10-27 04:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_17'
+down_revision: str | None = '20261027_16'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'customer_balances',
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('invoiced_total', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('paid_total', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('outstanding', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('open_invoices', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('oldest_open_due_date', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('customer_id'),
+    )
+    op.create_index('ix_customer_balances_outstanding', 'customer_balances', ['outstanding'])
+    op.create_index('ix_customer_balances_oldest_open_due_date', 'customer_balances', ['oldest_open_due_date'])
+    op.execute(
+        """
+        INSERT INTO customer_balances (
+            customer_id, invoiced_total, paid_total, outstanding, open_invoices, oldest_open_due_date, updated_at
+        )
+        SELECT c.id,
+               COALESCE(i.amount, 0),
+               COALESCE(p.amount, 0),
+               COALESCE(i.amount, 0) - COALESCE(p.amount, 0),
+               COALESCE(i.open_invoices, 0),
+               i.oldest_due,
+               now()
+        FROM customers c
+        LEFT JOIN (
+            SELECT customer_id,
+                   SUM(total_amount) AS amount,
+                   COUNT(*) FILTER (WHERE status <> 'paid' AND total_amount > COALESCE(paid_amount, 0)) AS open_invoices,
+                   MIN(due_date) FILTER (WHERE status <> 'paid' AND total_amount > COALESCE(paid_amount, 0)) AS oldest_due
+            FROM invoices
+            GROUP BY customer_id
+        ) i ON i.customer_id = c.id
+        LEFT JOIN (
+            SELECT customer_id, SUM(amount) AS amount FROM payments GROUP BY customer_id
+        ) p ON p.customer_id = c.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_customer_balances_oldest_open_due_date', table_name='customer_balances')
+    op.drop_index('ix_customer_balances_outstanding', table_name='customer_balances')
+    op.drop_table('customer_balances')
@@ -0,0 +1,36 @@
+"""link users directly to their customer record
+
+Revision ID: 20261027_18
+Revises: 20261027_17
+Create Date: 2026-10-27 04:20:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261027_18'
+down_revision: str | None = '20261027_17'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('customer_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('fk_users_customer_id', 'users', 'customers', ['customer_id'], ['id'], ondelete='SET NULL')
+    op.create_index('ix_users_customer_id', 'users', ['customer_id'])
+    op.execute(
+        """
+        UPDATE users SET customer_id = c.id
+        FROM customers c
+        WHERE c.email = users.email AND users.customer_id IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_customer_id', table_name='users')
+    op.drop_constraint('fk_users_customer_id', 'users', type_='foreignkey')
+    op.drop_column('users', 'customer_id')
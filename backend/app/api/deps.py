@@ -1,7 +1,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from backend.app.core.config import settings
 from backend.app.db.session import get_db
@@ -23,7 +23,8 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     except JWTError as exc:
         raise credentials_exception from exc
 
-    user = db.query(User).filter(User.username == username).first()
+    # Roles and the linked customer id come back with the user, so portal and RBAC checks add no queries.
+    user = db.query(User).options(joinedload(User.roles)).filter(User.username == username).first()
     if not user:
         raise credentials_exception
     return user
@@ -1,14 +1,27 @@
+import json
+from dataclasses import asdict
 from datetime import datetime
+from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from backend.app.core.config import settings
 from backend.app.core.security import verify_password
 from backend.app.db.session import get_db
 from backend.app.models.product import Product
 from backend.app.models.sale import Sale
 from backend.app.models.user import User
+from backend.app.services.catalog_cache import catalog_cache
+from backend.app.services.group_commit import get_sale_writer
+from backend.app.services.product_search import ProductSearchService
+from backend.app.services.sales_ingest import ingest_sales, parse_sales_rows
+from backend.app.services.sales_posting import record_sale_event
+from backend.app.services.sales_rollup import add_sale_to_rollup, get_sales_summary
+from backend.app.services.stock_reservation import take_stock
 
 router = APIRouter(tags=['ui'])
 
@@ -56,9 +69,22 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.get('/products')
-def get_products(client_id: str, db: Session = Depends(get_db)):
-    products = db.query(Product).filter(Product.client_id == client_id).order_by(Product.id.desc()).all()
-    return products
+def get_products(client_id: str, if_none_match: str | None = Header(default=None), db: Session = Depends(get_db)):
+    def load_body() -> bytes:
+        products = db.query(Product).filter(Product.client_id == client_id).order_by(Product.id.desc()).all()
+        return json.dumps(jsonable_encoder(products)).encode('utf-8')
+
+    return catalog_cache.response(db, client_id, if_none_match, load_body)
+
+
+@router.get('/products/search')
+def search_products(
+    client_id: str,
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    return ProductSearchService().search(db, client_id, q, limit=limit)
 
 
 @router.post('/products', status_code=status.HTTP_201_CREATED)
@@ -74,6 +100,7 @@ def create_product(payload: ProductCreateRequest, db: Session = Depends(get_db))
         description='',
     )
     db.add(product)
+    catalog_cache.bump(db, payload.client_id)
     db.commit()
     db.refresh(product)
     return product
@@ -85,13 +112,15 @@ def get_sales(client_id: str, db: Session = Depends(get_db)):
     return sales
 
 
-@router.post('/sales', status_code=status.HTTP_201_CREATED)
-def create_sale(payload: SaleCreateRequest, db: Session = Depends(get_db)):
+@router.get('/sales/summary')
+def get_sales_summary_view(client_id: str, days: int = Query(default=30, ge=1, le=366), db: Session = Depends(get_db)):
+    return get_sales_summary(db, client_id, days)
+
+
+def _record_sale(db: Session, payload: SaleCreateRequest) -> dict:
     product = db.query(Product).filter(Product.id == payload.product_id, Product.client_id == payload.client_id).first()
     if not product:
         raise HTTPException(status_code=404, detail='Product not found')
-    if payload.qty <= 0:
-        raise HTTPException(status_code=400, detail='Quantity should be > 0')
 
     sale = Sale(
         client_id=payload.client_id,
@@ -101,11 +130,45 @@ def create_sale(payload: SaleCreateRequest, db: Session = Depends(get_db)):
         sale_date=datetime.utcnow(),
     )
     db.add(sale)
+    db.flush()
+    take_stock(
+        db,
+        {sale.product_id: Decimal(sale.qty)},
+        reference_type='sale',
+        reference_id=str(sale.id),
+        reason='sale',
+        record_movements=False,
+    )
+    record_sale_event(db, sale, product.unit_cost)
+    add_sale_to_rollup(db, sale, product.unit_cost)
+    return jsonable_encoder(sale)
+
+
+@router.post('/sales', status_code=status.HTTP_201_CREATED)
+def create_sale(payload: SaleCreateRequest, db: Session = Depends(get_db)):
+    if payload.qty <= 0:
+        raise HTTPException(status_code=400, detail='Quantity should be > 0')
+    if settings.group_commit_enabled:
+        return get_sale_writer().submit(lambda writer_db: _record_sale(writer_db, payload)).result(timeout=30)
+
+    sale = _record_sale(db, payload)
     db.commit()
-    db.refresh(sale)
     return sale
 
 
+def _ingest_and_commit(db: Session, rows: list[dict]) -> dict:
+    result = ingest_sales(db, rows)
+    db.commit()
+    return asdict(result)
+
+
+@router.post('/sales/bulk')
+async def bulk_ingest_sales(request: Request, db: Session = Depends(get_db)):
+    """Merge a day's POS sales, sent as CSV (``text/csv``) or NDJSON, deduplicated on ``external_id``."""
+    rows = parse_sales_rows(request.headers.get('content-type'), await request.body())
+    return await run_in_threadpool(_ingest_and_commit, db, rows)
+
+
 @router.get('/clients')
 def get_clients(db: Session = Depends(get_db)):
     rows = db.query(User.client_id).distinct().all()
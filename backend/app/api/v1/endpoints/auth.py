@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from backend.app.core.security import create_access_token, hash_password, verify_password
 from backend.app.db.session import get_db
+from backend.app.models.customer import Customer
 from backend.app.models.user import User
 from backend.app.schemas.auth import LoginRequest, Token, UserCreate
 
@@ -14,7 +16,12 @@ def register(payload: UserCreate, db: Session = Depends(get_db)):
     exists = db.query(User).filter((User.username == payload.username) | (User.email == payload.email)).first()
     if exists:
         raise HTTPException(status_code=409, detail='User already exists')
-    user = User(username=payload.username, email=payload.email, password_hash=hash_password(payload.password))
+    user = User(
+        username=payload.username,
+        email=payload.email,
+        password_hash=hash_password(payload.password),
+        customer_id=db.scalar(select(Customer.id).where(Customer.email == payload.email)),
+    )
     db.add(user)
     db.commit()
     token = create_access_token(payload.username)
@@ -4,12 +4,15 @@ from sqlalchemy.orm import Session
 from backend.app.core.config import settings
 from backend.app.db.session import get_db
 from backend.app.models.conversation import Conversation
+from backend.app.models.product import Product
 from backend.app.schemas.chat import (
     WhatsAppInbound,
     WhatsAppOutbound,
     WhatsAppTemplateCatalog,
     WhatsAppWebhookProcessResult,
 )
+from backend.app.services.customer_segments import segment_for_phone
+from backend.app.services.product_associations import frequently_bought_together
 from backend.app.services.whatsapp import WhatsAppService
 
 router = APIRouter(prefix='/chat', tags=['chat'])
@@ -81,7 +84,18 @@ def whatsapp_inbound(payload: WhatsAppInbound, db: Session = Depends(get_db)):
     inbound = Conversation(customer_phone=payload.from_phone, direction='inbound', message_text=payload.text)
     db.add(inbound)
 
-    orchestration_result = whatsapp_service.route_to_orchestrator(payload.model_dump())
+    message = payload.model_dump()
+    segment = segment_for_phone(db, payload.from_phone)
+    if segment:
+        message['customer_segment'] = segment.segment
+    if payload.product_id is not None:
+        product = db.query(Product).filter(Product.id == payload.product_id).first()
+        if product:
+            message['product_name'] = product.name
+            message['bundle_products'] = [
+                associated.name for _, associated in frequently_bought_together(db, product.id, limit=3)
+            ]
+    orchestration_result = whatsapp_service.route_to_orchestrator(message)
     reply_text = whatsapp_service.build_reply_text(orchestration_result)
 
     outbound = Conversation(customer_phone=payload.from_phone, direction='outbound', message_text=reply_text)
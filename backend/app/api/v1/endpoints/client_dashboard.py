@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from backend.app.api.deps import get_current_user
@@ -13,14 +15,16 @@ from backend.app.schemas.client import (
 )
 from backend.app.services.client_dashboard_service import (
     get_client_dashboard,
+    get_client_invoice,
     get_client_statement,
+    get_full_client_statement,
     list_client_invoices,
     list_client_orders,
-    statement_pdf_stub,
     submit_payment_confirmation,
     submit_return_request,
     submit_support_message,
 )
+from backend.app.services.pdf_documents import invoice_document, pdf_response, statement_document
 
 router = APIRouter(prefix='/client', tags=['client-dashboard'])
 
@@ -48,26 +52,40 @@ def client_invoices(db: Session = Depends(get_db), user=Depends(_require_client)
 
 
 @router.get('/invoices/{invoice_id}/download')
-def download_invoice(invoice_id: int, db: Session = Depends(get_db), user=Depends(_require_client)):
-    invoices = {inv.id: inv for inv in list_client_invoices(db, user)}
-    if invoice_id not in invoices:
-        raise HTTPException(status_code=404, detail='Invoice not found')
-    return {
-        'file_name': f"invoice_{invoices[invoice_id].invoice_number}.pdf",
-        'content_type': 'application/pdf',
-        'stub': 'Invoice PDF generation placeholder',
-    }
+def download_invoice(
+    invoice_id: int,
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+    user=Depends(_require_client),
+):
+    invoice = get_client_invoice(db, user, invoice_id)
+    data, title, lines = invoice_document(db, invoice)
+    return pdf_response(data, title, lines, f'invoice_{invoice.invoice_number}.pdf', if_none_match)
 
 
 @router.get('/statement', response_model=ClientStatementResponse)
-def client_statement(db: Session = Depends(get_db), user=Depends(_require_client)):
-    return get_client_statement(db, user)
+def client_statement(
+    date_from: date | None = Query(default=None, alias='from'),
+    date_to: date | None = Query(default=None, alias='to'),
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+    user=Depends(_require_client),
+):
+    return get_client_statement(db, user, date_from, date_to, limit, offset)
 
 
 @router.get('/statement/download')
-def download_statement(db: Session = Depends(get_db), user=Depends(_require_client)):
-    statement = get_client_statement(db, user)
-    return statement_pdf_stub(statement)
+def download_statement(
+    date_from: date | None = Query(default=None, alias='from'),
+    date_to: date | None = Query(default=None, alias='to'),
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+    user=Depends(_require_client),
+):
+    statement = get_full_client_statement(db, user, date_from, date_to)
+    data, title, lines = statement_document(statement)
+    return pdf_response(data, title, lines, f"statement_{statement['customer_id']}.pdf", if_none_match)
 
 
 @router.post('/payment-confirmation')
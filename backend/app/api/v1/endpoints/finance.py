@@ -1,13 +1,17 @@
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from backend.app.api.deps import get_current_user
 from backend.app.core.rbac import require_roles
 from backend.app.db.session import get_db
+from backend.app.models.billing_run import BillingRun
 from backend.app.schemas.finance import (
+    ArAgingReport,
     BalanceSheetReport,
+    BillingRunCreate,
+    BillingRunRead,
     CashflowReport,
     EmployeeCreate,
     EmployeeRead,
@@ -21,6 +25,9 @@ from backend.app.schemas.finance import (
     PayrollRead,
     ProfitLossReport,
 )
+from backend.app.services.billing import billing_run_report, create_billing_run, run_billing, run_billing_job
+from backend.app.services.customer_balances import ar_aging, rebuild_customer_balances
+from backend.app.services.pdf_documents import run_month_end_statements
 from backend.app.services.finance_service import (
     approve_and_pay_payroll,
     create_employee,
@@ -104,6 +111,61 @@ def get_balance_sheet(as_of_date: date, db: Session = Depends(get_db), _=Depends
     return generate_balance_sheet(db, as_of_date)
 
 
+@router.get('/reports/ar-aging', response_model=ArAgingReport)
+def get_ar_aging(as_of_date: date | None = None, db: Session = Depends(get_db), _=Depends(_assert_finance_read_access)):
+    return ar_aging(db, as_of_date)
+
+
+@router.post('/customer-balances/rebuild')
+def rebuild_balances(db: Session = Depends(get_db), _=Depends(require_roles('admin', 'owner'))):
+    customers = rebuild_customer_balances(db)
+    db.commit()
+    return {'customers': customers}
+
+
+@router.post('/statements/pregenerate', status_code=202)
+def pregenerate_statements(
+    background_tasks: BackgroundTasks,
+    month_end: date | None = None,
+    _=Depends(require_roles('admin', 'owner')),
+):
+    background_tasks.add_task(run_month_end_statements, month_end)
+    return {'status': 'queued', 'month_end': month_end}
+
+
 @router.get('/dashboard', response_model=FinanceDashboardSummary)
 def get_finance_dashboard(db: Session = Depends(get_db), _=Depends(_assert_finance_read_access)):
     return finance_dashboard_summary(db)
+
+
+@router.post('/billing-runs', response_model=BillingRunRead)
+def start_billing_run(
+    payload: BillingRunCreate,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    db: Session = Depends(get_db),
+    _=Depends(require_roles('admin', 'owner')),
+):
+    run = create_billing_run(db, payload.issue_date)
+    if background:
+        background_tasks.add_task(run_billing_job, run.id)
+        return billing_run_report(run)
+    return billing_run_report(run_billing(db, run))
+
+
+@router.post('/billing-runs/{run_id}/resume', response_model=BillingRunRead)
+def resume_billing_run(run_id: str, db: Session = Depends(get_db), _=Depends(require_roles('admin', 'owner'))):
+    run = db.get(BillingRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail='Billing run not found')
+    if run.status == 'completed':
+        raise HTTPException(status_code=409, detail='Billing run already completed')
+    return billing_run_report(run_billing(db, run))
+
+
+@router.get('/billing-runs/{run_id}', response_model=BillingRunRead)
+def get_billing_run(run_id: str, db: Session = Depends(get_db), _=Depends(_assert_finance_read_access)):
+    run = db.get(BillingRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail='Billing run not found')
+    return billing_run_report(run)
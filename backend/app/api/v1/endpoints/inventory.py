@@ -3,9 +3,11 @@ from sqlalchemy.orm import Session
 
 from backend.app.api.deps import get_current_user
 from backend.app.db.session import get_db
+from backend.app.models.inventory import InventoryLevel
 from backend.app.models.product import Product
 from backend.app.models.stock_movement import StockMovement
-from backend.app.schemas.inventory import InventoryAdjustmentRequest, StockMovementRead
+from backend.app.schemas.inventory import InventoryAdjustmentRequest, InventoryLevelRead, StockMovementRead
+from backend.app.services.stock_reservation import MOVEMENT_SIGNS, apply_movement
 
 router = APIRouter(prefix='/inventory', tags=['inventory'])
 
@@ -15,8 +17,11 @@ def create_adjustment(payload: InventoryAdjustmentRequest, db: Session = Depends
     product = db.query(Product).filter(Product.id == payload.product_id).first()
     if not product:
         raise HTTPException(status_code=404, detail='Product not found')
+    if payload.movement_type not in MOVEMENT_SIGNS:
+        raise HTTPException(status_code=400, detail='Unknown movement type')
     movement = StockMovement(**payload.model_dump())
     db.add(movement)
+    apply_movement(db, payload.product_id, payload.movement_type, payload.quantity)
     db.commit()
     db.refresh(movement)
     return movement
@@ -25,3 +30,8 @@ def create_adjustment(payload: InventoryAdjustmentRequest, db: Session = Depends
 @router.get('/movements', response_model=list[StockMovementRead])
 def list_movements(db: Session = Depends(get_db), _=Depends(get_current_user)):
     return db.query(StockMovement).order_by(StockMovement.id.desc()).all()
+
+
+@router.get('/levels', response_model=list[InventoryLevelRead])
+def list_levels(db: Session = Depends(get_db), _=Depends(get_current_user)):
+    return db.query(InventoryLevel).order_by(InventoryLevel.product_id.asc()).all()
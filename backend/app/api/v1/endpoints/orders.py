@@ -1,5 +1,3 @@
-from decimal import Decimal
-
 from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.orm import Session
 
@@ -7,48 +5,28 @@ from backend.app.api.deps import get_current_user
 from backend.app.core.config import settings
 from backend.app.db.session import get_db
 from backend.app.models.order import Order, OrderItem
-from backend.app.schemas.order import OrderCreate, OrderPatch, OrderRead
+from backend.app.schemas.order import OrderBatchCreate, OrderBatchResult, OrderCreate, OrderPatch, OrderRead
+from backend.app.services import order_service, stock_reservation
 
 router = APIRouter(prefix='/orders', tags=['orders'])
 
 
-def _recompute(order: Order, db: Session) -> None:
-    items = db.query(OrderItem).filter(OrderItem.order_id == order.id).all()
-    subtotal = sum((item.line_total for item in items), Decimal('0'))
-    order.subtotal = subtotal
-    order.total_amount = subtotal + Decimal(order.tax_amount) - Decimal(order.discount_amount)
-
-
 @router.post('', response_model=OrderRead)
 def create_order(payload: OrderCreate, db: Session = Depends(get_db), _=Depends(get_current_user)):
-    order = Order(
-        order_number=payload.order_number,
-        customer_id=payload.customer_id,
-        tax_amount=payload.tax_amount,
-        discount_amount=payload.discount_amount,
-        currency=payload.currency,
-    )
-    db.add(order)
-    db.flush()
-
-    for item in payload.items:
-        line_total = item.quantity * item.unit_price
-        db.add(
-            OrderItem(
-                order_id=order.id,
-                product_id=item.product_id,
-                quantity=item.quantity,
-                unit_price=item.unit_price,
-                line_total=line_total,
-            )
-        )
-
-    _recompute(order, db)
+    order = order_service.create_order(db, payload)
     db.commit()
     db.refresh(order)
     return order
 
 
+@router.post('/batch', response_model=OrderBatchResult)
+def create_orders_batch(payload: OrderBatchCreate, db: Session = Depends(get_db), _=Depends(get_current_user)):
+    results = order_service.create_order_batch(db, payload.orders)
+    db.commit()
+    created = sum(1 for result in results if result['status'] == 'created')
+    return {'created': created, 'failed': len(results) - created, 'results': results}
+
+
 @router.get('', response_model=list[OrderRead])
 def list_orders(db: Session = Depends(get_db), _=Depends(get_current_user)):
     return db.query(Order).order_by(Order.id.desc()).all()
@@ -65,14 +43,18 @@ def patch_order(
     if x_2fa_code != getattr(settings, 'order_edit_2fa_code', '123456'):
         raise HTTPException(status_code=403, detail='2FA verification failed')
 
-    order = db.query(Order).filter(Order.id == order_id).first()
+    order = db.query(Order).filter(Order.id == order_id).with_for_update().first()
     if not order:
         raise HTTPException(status_code=404, detail='Order not found')
 
-    for key, value in payload.model_dump(exclude_none=True).items():
+    changes = payload.model_dump(exclude_none=True)
+    status = changes.pop('status', None)
+    for key, value in changes.items():
         setattr(order, key, value)
+    if status is not None:
+        order_service.change_status(db, order, status)
 
-    _recompute(order, db)
+    order_service.recompute_total(order)
     db.commit()
     db.refresh(order)
     return order
@@ -83,6 +65,7 @@ def delete_order(order_id: int, db: Session = Depends(get_db), _=Depends(get_cur
     order = db.query(Order).filter(Order.id == order_id).first()
     if not order:
         raise HTTPException(status_code=404, detail='Order not found')
+    stock_reservation.release_order_stock(db, order.id)
     db.query(OrderItem).filter(OrderItem.order_id == order.id).delete()
     db.delete(order)
     db.commit()
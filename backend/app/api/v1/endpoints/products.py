@@ -1,27 +1,47 @@
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+import json
+
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, Header, HTTPException, Query, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from backend.app.api.deps import get_current_user
 from backend.app.db.session import get_db
 from backend.app.models.product import Product
 from backend.app.models.product_image import ProductImage
+from backend.app.models.product_import_job import ProductImportJob
+from backend.app.models.user import User
 from backend.app.schemas.product import (
+    ProductAssociationRead,
+    ProductBulkUpsertResult,
     ProductCreate,
     ProductImageMatchRead,
     ProductImageRead,
+    ProductImportJobRead,
     ProductRead,
     ProductUpdate,
 )
+from backend.app.services.catalog_cache import ALL_TENANTS, catalog_cache
 from backend.app.services.image_embeddings import OpenAIImageEmbeddingService
 from backend.app.services.image_matching import ImageMatchingService
 from backend.app.services.image_storage import S3ImageStorageService
+from backend.app.services.product_associations import frequently_bought_together
+from backend.app.services.product_import import create_import_job, parse_product_rows, run_import_job, upsert_products
+from backend.app.services.product_search import ProductSearchService
 
 router = APIRouter(prefix='/products', tags=['products'])
 
 
 @router.get('', response_model=list[ProductRead])
-def list_products(db: Session = Depends(get_db), _=Depends(get_current_user)):
-    return db.query(Product).order_by(Product.id.desc()).all()
+def list_products(
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    def load_body() -> bytes:
+        products = db.query(Product).order_by(Product.id.desc()).all()
+        return json.dumps([ProductRead.model_validate(p).model_dump(mode='json') for p in products]).encode('utf-8')
+
+    return catalog_cache.response(db, ALL_TENANTS, if_none_match, load_body)
 
 
 @router.post('', response_model=ProductRead)
@@ -30,11 +50,61 @@ def create_product(payload: ProductCreate, db: Session = Depends(get_db), _=Depe
         raise HTTPException(status_code=409, detail='SKU already exists')
     product = Product(**payload.model_dump())
     db.add(product)
+    db.flush()
+    catalog_cache.bump(db, product.client_id)
     db.commit()
     db.refresh(product)
     return product
 
 
+@router.post('/bulk', response_model=ProductBulkUpsertResult)
+async def bulk_upsert_products(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    rows = parse_product_rows(request.headers.get('content-type'), await request.body())
+    if background:
+        job = await run_in_threadpool(create_import_job, db, user.client_id, len(rows))
+        background_tasks.add_task(run_import_job, job.id, user.client_id, rows)
+        return ProductBulkUpsertResult(status='queued', job_id=job.id, total_rows=len(rows))
+
+    result = await run_in_threadpool(upsert_products, db, user.client_id, rows)
+    return ProductBulkUpsertResult(
+        status='completed',
+        total_rows=result.total_rows,
+        created=result.created,
+        updated=result.updated,
+        failed=result.failed,
+        errors=result.errors,
+    )
+
+
+@router.get('/bulk/{job_id}', response_model=ProductImportJobRead)
+def get_bulk_upsert_job(job_id: str, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+    job = (
+        db.query(ProductImportJob)
+        .filter(ProductImportJob.id == job_id, ProductImportJob.client_id == user.client_id)
+        .first()
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail='Import job not found')
+    return job
+
+
+@router.get('/search', response_model=list[ProductRead])
+def search_products(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=20, ge=1, le=100),
+    include_inactive: bool = False,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    return ProductSearchService().search(db, user.client_id, q, limit=limit, include_inactive=include_inactive)
+
+
 @router.get('/{product_id}', response_model=ProductRead)
 def get_product(product_id: int, db: Session = Depends(get_db), _=Depends(get_current_user)):
     product = db.query(Product).filter(Product.id == product_id).first()
@@ -43,6 +113,27 @@ def get_product(product_id: int, db: Session = Depends(get_db), _=Depends(get_cu
     return product
 
 
+@router.get('/{product_id}/associations', response_model=list[ProductAssociationRead])
+def get_product_associations(
+    product_id: int,
+    limit: int = Query(default=5, ge=1, le=50),
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    return [
+        ProductAssociationRead(
+            product_id=product.id,
+            sku=product.sku,
+            name=product.name,
+            unit_price=product.unit_price,
+            pair_count=association.pair_count,
+            confidence=association.confidence,
+            lift=association.lift,
+        )
+        for association, product in frequently_bought_together(db, product_id, limit)
+    ]
+
+
 @router.patch('/{product_id}', response_model=ProductRead)
 def patch_product(product_id: int, payload: ProductUpdate, db: Session = Depends(get_db), _=Depends(get_current_user)):
     product = db.query(Product).filter(Product.id == product_id).first()
@@ -50,6 +141,7 @@ def patch_product(product_id: int, payload: ProductUpdate, db: Session = Depends
         raise HTTPException(status_code=404, detail='Product not found')
     for key, value in payload.model_dump(exclude_none=True).items():
         setattr(product, key, value)
+    catalog_cache.bump(db, product.client_id)
     db.commit()
     db.refresh(product)
     return product
@@ -60,6 +152,7 @@ def delete_product(product_id: int, db: Session = Depends(get_db), _=Depends(get
     product = db.query(Product).filter(Product.id == product_id).first()
     if not product:
         raise HTTPException(status_code=404, detail='Product not found')
+    catalog_cache.bump(db, product.client_id)
     db.delete(product)
     db.commit()
     return None
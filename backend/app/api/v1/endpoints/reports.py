@@ -1,14 +1,22 @@
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from backend.app.api.deps import get_current_user
 from backend.app.db.session import get_db
 from backend.app.models.accounting import Account, JournalLine
+from backend.app.models.customer_segment import CustomerSegment
 from backend.app.models.product import Product
 from backend.app.models.stock_movement import StockMovement
-from backend.app.schemas.report import ProfitLossResponse, StockAgingResponse, StockAgingRow
+from backend.app.schemas.report import (
+    CustomerSegmentRead,
+    ProfitLossResponse,
+    SalesPostingMetrics,
+    StockAgingResponse,
+    StockAgingRow,
+)
+from backend.app.services.sales_posting import sales_posting_metrics
 
 router = APIRouter(prefix='/reports', tags=['reports'])
 
@@ -45,3 +53,30 @@ def stock_aging(as_of_date: str, db: Session = Depends(get_db), _=Depends(get_cu
         rows.append(StockAgingRow(product_id=product.id, sku=product.sku, qty_estimate=total))
 
     return StockAgingResponse(as_of_date=as_of_date, rows=rows)
+
+
+@router.get('/sales-posting', response_model=SalesPostingMetrics)
+def sales_posting(db: Session = Depends(get_db), _=Depends(get_current_user)):
+    return sales_posting_metrics(db)
+
+
+@router.get('/customer-segments', response_model=list[CustomerSegmentRead])
+def list_customer_segments(
+    segment: str | None = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    query = db.query(CustomerSegment)
+    if segment:
+        query = query.filter(CustomerSegment.segment == segment)
+    return query.order_by(CustomerSegment.customer_id.asc()).offset(offset).limit(limit).all()
+
+
+@router.get('/customer-segments/{customer_id}', response_model=CustomerSegmentRead)
+def get_customer_segment(customer_id: int, db: Session = Depends(get_db), _=Depends(get_current_user)):
+    row = db.get(CustomerSegment, customer_id)
+    if not row:
+        raise HTTPException(status_code=404, detail='Customer segment not found')
+    return row
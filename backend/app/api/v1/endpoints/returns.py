@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from backend.app.api.deps import get_current_user
 from backend.app.db.session import get_db
 from backend.app.models.return_order import ReturnItem, ReturnOrder
-from backend.app.schemas.return_order import ReturnCreate, ReturnRead
+from backend.app.schemas.return_order import ReturnCreate, ReturnRead, ReturnsSummary
+from backend.app.services.returns_analytics import get_returns_summary
+from backend.app.services.sales_rollup import ALL_CLIENTS
 
 router = APIRouter(prefix='/returns', tags=['returns'])
 
@@ -31,3 +33,13 @@ def create_return(payload: ReturnCreate, db: Session = Depends(get_db), _=Depend
 @router.get('', response_model=list[ReturnRead])
 def list_returns(db: Session = Depends(get_db), _=Depends(get_current_user)):
     return db.query(ReturnOrder).order_by(ReturnOrder.id.desc()).all()
+
+
+@router.get('/summary', response_model=ReturnsSummary)
+def returns_summary(
+    client_id: str = ALL_CLIENTS,
+    days: int = Query(default=30, ge=1, le=366),
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    return get_returns_summary(db, client_id, days)
@@ -1,14 +1,26 @@
 from backend.app.db.base_class import Base
 from backend.app.models.accounting import Account, JournalEntry, JournalLine
+from backend.app.models.billing_run import BillingRun
+from backend.app.models.catalog_version import CatalogVersion
 from backend.app.models.client import Invoice, Payment, PaymentConfirmation, SupportMessage
 from backend.app.models.conversation import Conversation
 from backend.app.models.customer import Customer
+from backend.app.models.customer_balance import CustomerBalance, CustomerBalanceSnapshot
+from backend.app.models.customer_segment import CustomerSegment
+from backend.app.models.document_sequence import DocumentSequence
 from backend.app.models.finance import AuditLog, CashTransaction, Employee, Expense, Income, Payroll
+from backend.app.models.idempotency_key import IdempotencyKey
+from backend.app.models.inventory import InventoryLevel, StockReservation
 from backend.app.models.order import Order, OrderItem
+from backend.app.models.outbox import OutboxEvent
 from backend.app.models.product import Product
+from backend.app.models.product_association import ProductAssociation
 from backend.app.models.product_image import ProductImage
+from backend.app.models.product_import_job import ProductImportJob
+from backend.app.models.reembedding_checkpoint import ReembeddingCheckpoint
 from backend.app.models.return_order import ReturnItem, ReturnOrder
 from backend.app.models.sale import Sale
+from backend.app.models.sales_daily import SalesDaily
 from backend.app.models.session_log import SessionLog
 from backend.app.models.stock_movement import StockMovement
 from backend.app.models.user import Permission, Role, User
@@ -19,8 +31,13 @@ __all__ = [
     'Role',
     'Permission',
     'Product',
+    'CatalogVersion',
     'ProductImage',
+    'ProductImportJob',
+    'ReembeddingCheckpoint',
     'StockMovement',
+    'InventoryLevel',
+    'StockReservation',
     'Customer',
     'Order',
     'OrderItem',
@@ -33,6 +50,7 @@ __all__ = [
     'Payroll',
     'CashTransaction',
     'AuditLog',
+    'IdempotencyKey',
     'Invoice',
     'Payment',
     'PaymentConfirmation',
@@ -42,4 +60,12 @@ __all__ = [
     'ReturnOrder',
     'ReturnItem',
     'Sale',
+    'OutboxEvent',
+    'SalesDaily',
+    'ProductAssociation',
+    'CustomerSegment',
+    'DocumentSequence',
+    'BillingRun',
+    'CustomerBalanceSnapshot',
+    'CustomerBalance',
 ]
@@ -0,0 +1,13 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def is_postgresql(db: Session) -> bool:
+    return db.get_bind().dialect.name == 'postgresql'
+
+
+def upsert_insert(db: Session, table):
+    """Return an INSERT construct that supports ``on_conflict_do_*`` for the session's dialect."""
+    if is_postgresql(db):
+        return postgresql.insert(table)
+    return sqlite.insert(table)
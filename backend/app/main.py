@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -5,9 +7,36 @@ from backend.app.api.ui_api import router as ui_router
 from backend.app.api.v1.router import api_router
 from backend.app.core.config import settings
 from backend.app.middleware.auth import AuthContextMiddleware
+from backend.app.middleware.idempotency import IdempotencyMiddleware
+from backend.app.services.background import start_background_workers
+from backend.app.services.group_commit import stop_sale_writer
+from backend.app.services.pdf_documents import pdf_renderer
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    workers = start_background_workers() if settings.background_workers_enabled else []
+    try:
+        yield
+    finally:
+        for worker in workers:
+            worker.stop()
+        stop_sale_writer()
+        pdf_renderer.shutdown()
+
 
-app = FastAPI(title=settings.app_name, version='1.0.0')
+app = FastAPI(title=settings.app_name, version='1.0.0', lifespan=lifespan)
 app.add_middleware(AuthContextMiddleware)
+app.add_middleware(
+    IdempotencyMiddleware,
+    paths={
+        f'{settings.api_v1_prefix}/orders',
+        f'{settings.api_v1_prefix}/orders/batch',
+        f'{settings.api_v1_prefix}/finance/expenses',
+        f'{settings.api_v1_prefix}/returns',
+        '/sales',
+    },
+)
 
 cors_origins = [origin.strip() for origin in settings.cors_origins.split(',') if origin.strip()]
 if cors_origins:
@@ -0,0 +1,97 @@
+import asyncio
+import hashlib
+import time
+
+from fastapi.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from backend.app.core.config import settings
+from backend.app.db.session import get_db
+from backend.app.services import idempotency
+
+
+def _with_session(provider, fn, *args):
+    sessions = provider()
+    db = next(sessions)
+    try:
+        return fn(db, *args)
+    finally:
+        sessions.close()
+
+
+def _replay(stored: idempotency.StoredResponse) -> Response:
+    return Response(
+        content=stored.body,
+        status_code=stored.status_code,
+        media_type=stored.content_type,
+        headers={'Idempotent-Replayed': 'true'},
+    )
+
+
+class IdempotencyMiddleware(BaseHTTPMiddleware):
+    """Execute a POST carrying an ``Idempotency-Key`` at most once and replay its response to retries.
+
+    A duplicate that arrives while the first request is still running polls until that request finishes.
+    5xx responses are not stored, so the client can retry them.
+    """
+
+    def __init__(self, app, paths: set[str]) -> None:
+        super().__init__(app)
+        self.paths = paths
+
+    async def dispatch(self, request: Request, call_next):
+        key = request.headers.get('Idempotency-Key')
+        if request.method != 'POST' or not key or request.url.path not in self.paths:
+            return await call_next(request)
+        if len(key) > 255:
+            return JSONResponse({'detail': 'Idempotency-Key must be at most 255 characters'}, status_code=400)
+
+        body = await request.body()
+        request_hash = hashlib.sha256(body).hexdigest()
+        scope = hashlib.sha256(
+            f"{request.url.path}\n{request.headers.get('Authorization', '')}".encode('utf-8')
+        ).hexdigest()
+        provider = request.app.dependency_overrides.get(get_db, get_db)
+
+        deadline = time.monotonic() + settings.idempotency_wait_seconds
+        delay = 0.05
+        while True:
+            state, stored = await run_in_threadpool(_with_session, provider, idempotency.begin, scope, key, request_hash)
+            if stored.request_hash != request_hash:
+                return JSONResponse(
+                    {'detail': 'Idempotency-Key was reused with a different request body'},
+                    status_code=422,
+                )
+            if state == idempotency.COMPLETED:
+                return _replay(stored)
+            if state == idempotency.CLAIMED:
+                break
+            if time.monotonic() >= deadline:
+                return JSONResponse(
+                    {'detail': 'A request with this Idempotency-Key is still in progress'},
+                    status_code=409,
+                    headers={'Retry-After': '1'},
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+        try:
+            response = await call_next(request)
+            content = b''.join([chunk async for chunk in response.body_iterator])
+        except Exception:
+            await run_in_threadpool(_with_session, provider, idempotency.abandon, scope, key)
+            raise
+
+        if response.status_code >= 500:
+            await run_in_threadpool(_with_session, provider, idempotency.abandon, scope, key)
+        else:
+            content_type = response.headers.get('content-type')
+            stored = idempotency.StoredResponse(request_hash, response.status_code, content_type, content)
+            await run_in_threadpool(_with_session, provider, idempotency.complete, scope, key, stored)
+        return Response(
+            content=content,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+        )
@@ -0,0 +1,27 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, Enum, Numeric, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class BillingRun(Base):
+    __tablename__ = 'billing_runs'
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    issue_date: Mapped[date] = mapped_column(Date, nullable=False)
+    status: Mapped[str] = mapped_column(
+        Enum('queued', 'running', 'completed', 'failed', name='billing_run_status'),
+        default='queued',
+        index=True,
+    )
+    invoices_created: Mapped[int] = mapped_column(default=0, nullable=False)
+    orders_billed: Mapped[int] = mapped_column(default=0, nullable=False)
+    amount_billed: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=0, nullable=False)
+    last_customer_id: Mapped[int] = mapped_column(default=0, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import Date, DateTime, Enum, ForeignKey, Numeric, String, Text
+from sqlalchemy import Date, DateTime, Enum, ForeignKey, Index, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.app.db.base_class import Base
@@ -9,6 +9,7 @@ from backend.app.db.base_class import Base
 
 class Invoice(Base):
     __tablename__ = 'invoices'
+    __table_args__ = (Index('ix_invoices_customer_issue_date', 'customer_id', 'issue_date'),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     invoice_number: Mapped[str] = mapped_column(String(40), unique=True, index=True)
@@ -24,6 +25,7 @@ class Invoice(Base):
 
 class Payment(Base):
     __tablename__ = 'payments'
+    __table_args__ = (Index('ix_payments_customer_payment_date', 'customer_id', 'payment_date'),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     customer_id: Mapped[int] = mapped_column(ForeignKey('customers.id', ondelete='RESTRICT'), index=True)
@@ -0,0 +1,32 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, ForeignKey, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class CustomerBalanceSnapshot(Base):
+    """A customer's receivable balance at the close of ``balance_date`` (invoices minus payments)."""
+
+    __tablename__ = 'customer_balance_snapshots'
+
+    customer_id: Mapped[int] = mapped_column(ForeignKey('customers.id', ondelete='CASCADE'), primary_key=True)
+    balance_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    balance: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class CustomerBalance(Base):
+    """Current receivable position per customer, kept in step with every invoice and payment write."""
+
+    __tablename__ = 'customer_balances'
+
+    customer_id: Mapped[int] = mapped_column(ForeignKey('customers.id', ondelete='CASCADE'), primary_key=True)
+    invoiced_total: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    paid_total: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    outstanding: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0, index=True)
+    open_invoices: Mapped[int] = mapped_column(nullable=False, default=0)
+    oldest_open_due_date: Mapped[date | None] = mapped_column(Date, index=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
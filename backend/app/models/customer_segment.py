@@ -0,0 +1,22 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, ForeignKey, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class CustomerSegment(Base):
+    __tablename__ = 'customer_segments'
+
+    customer_id: Mapped[int] = mapped_column(ForeignKey('customers.id', ondelete='CASCADE'), primary_key=True)
+    last_activity_date: Mapped[date | None] = mapped_column(Date)
+    recency_days: Mapped[int | None] = mapped_column()
+    frequency: Mapped[int] = mapped_column(nullable=False, default=0)
+    monetary: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    recency_score: Mapped[int] = mapped_column(nullable=False)
+    frequency_score: Mapped[int] = mapped_column(nullable=False)
+    monetary_score: Mapped[int] = mapped_column(nullable=False)
+    segment: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
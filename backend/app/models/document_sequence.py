@@ -0,0 +1,11 @@
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class DocumentSequence(Base):
+    __tablename__ = 'document_sequences'
+
+    name: Mapped[str] = mapped_column(String(40), primary_key=True)
+    next_value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class IdempotencyKey(Base):
+    __tablename__ = 'idempotency_keys'
+
+    scope: Mapped[str] = mapped_column(String(64), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(
+        Enum('in_progress', 'completed', name='idempotency_status'),
+        default='in_progress',
+    )
+    status_code: Mapped[int | None] = mapped_column()
+    content_type: Mapped[str | None] = mapped_column(String(100))
+    response_body: Mapped[bytes | None] = mapped_column(LargeBinary)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
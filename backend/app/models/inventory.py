@@ -0,0 +1,32 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class InventoryLevel(Base):
+    __tablename__ = 'inventory_levels'
+
+    product_id: Mapped[int] = mapped_column(ForeignKey('products.id', ondelete='CASCADE'), primary_key=True)
+    on_hand: Mapped[Decimal] = mapped_column(Numeric(12, 3), nullable=False, default=0)
+    reserved: Mapped[Decimal] = mapped_column(Numeric(12, 3), nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class StockReservation(Base):
+    __tablename__ = 'stock_reservations'
+    __table_args__ = (Index('ix_stock_reservations_status_expires_at', 'status', 'expires_at'),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    order_id: Mapped[int] = mapped_column(ForeignKey('orders.id', ondelete='CASCADE'), index=True)
+    product_id: Mapped[int] = mapped_column(ForeignKey('products.id', ondelete='RESTRICT'), index=True)
+    quantity: Mapped[Decimal] = mapped_column(Numeric(12, 3), nullable=False)
+    status: Mapped[str] = mapped_column(
+        Enum('active', 'consumed', 'released', 'expired', name='stock_reservation_status'),
+        default='active',
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
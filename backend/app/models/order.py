@@ -22,6 +22,7 @@ class Order(Base):
     discount_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=0)
     total_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=0)
     currency: Mapped[str] = mapped_column(String(3), default='USD')
+    invoice_id: Mapped[int | None] = mapped_column(ForeignKey('invoices.id', ondelete='SET NULL'), index=True)
 
 
 class OrderItem(Base):
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class OutboxEvent(Base):
+    __tablename__ = 'outbox_events'
+    __table_args__ = (
+        Index(
+            'ix_outbox_events_pending',
+            'topic',
+            'id',
+            postgresql_where=text('processed_at IS NULL'),
+            sqlite_where=text('processed_at IS NULL'),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    topic: Mapped[str] = mapped_column(String(60), nullable=False)
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False)
+    attempts: Mapped[int] = mapped_column(default=0, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime, index=True)
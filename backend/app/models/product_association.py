@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class ProductAssociation(Base):
+    __tablename__ = 'product_associations'
+
+    product_id: Mapped[int] = mapped_column(ForeignKey('products.id', ondelete='CASCADE'), primary_key=True)
+    associated_product_id: Mapped[int] = mapped_column(ForeignKey('products.id', ondelete='CASCADE'), primary_key=True)
+    rank: Mapped[int] = mapped_column(nullable=False)
+    pair_count: Mapped[int] = mapped_column(nullable=False)
+    confidence: Mapped[float] = mapped_column(Float, nullable=False)
+    lift: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
@@ -18,6 +18,7 @@ class ProductImage(Base):
     s3_key: Mapped[str] = mapped_column(String(1024), unique=True)
     s3_url: Mapped[str] = mapped_column(String(1024))
     embedding: Mapped[list[float]] = mapped_column(Vector(1536))
+    embedding_next: Mapped[list[float] | None] = mapped_column(Vector(1536), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     product = relationship('Product', back_populates='images')
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class ProductImportJob(Base):
+    __tablename__ = 'product_import_jobs'
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    client_id: Mapped[str] = mapped_column(String(100), index=True)
+    status: Mapped[str] = mapped_column(
+        Enum('queued', 'running', 'completed', 'failed', name='product_import_status'),
+        default='queued',
+        index=True,
+    )
+    total_rows: Mapped[int] = mapped_column(default=0, nullable=False)
+    processed_rows: Mapped[int] = mapped_column(default=0, nullable=False)
+    created_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    updated_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    failed_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    errors_json: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime)
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class ReembeddingCheckpoint(Base):
+    __tablename__ = 'reembedding_checkpoints'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    model: Mapped[str] = mapped_column(String(120), unique=True, index=True)
+    status: Mapped[str] = mapped_column(
+        Enum('running', 'completed', name='reembedding_status'),
+        default='running',
+        index=True,
+    )
+    last_image_id: Mapped[int] = mapped_column(default=0, nullable=False)
+    processed: Mapped[int] = mapped_column(default=0, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime)
@@ -0,0 +1,20 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, ForeignKey, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base_class import Base
+
+
+class SalesDaily(Base):
+    __tablename__ = 'sales_daily'
+
+    client_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    product_id: Mapped[int] = mapped_column(ForeignKey('products.id', ondelete='CASCADE'), primary_key=True, index=True)
+    sale_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    units: Mapped[int] = mapped_column(default=0, nullable=False)
+    revenue: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=0, nullable=False)
+    cost: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
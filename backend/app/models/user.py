@@ -27,6 +27,7 @@ class User(Base):
     username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     client_id: Mapped[str] = mapped_column(String(100), index=True, default='demo_client')
+    customer_id: Mapped[int | None] = mapped_column(ForeignKey('customers.id', ondelete='SET NULL'), index=True)
     password_hash: Mapped[str] = mapped_column(String(255))
     role: Mapped[str] = mapped_column(String(50), default='employee')
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -7,6 +7,7 @@ class WhatsAppInbound(BaseModel):
     from_phone: str
     text: str
     message_id: str
+    product_id: int | None = None
 
 
 class WhatsAppOutbound(BaseModel):
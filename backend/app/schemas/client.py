@@ -32,8 +32,13 @@ class ClientDashboardResponse(BaseModel):
 class ClientStatementResponse(BaseModel):
     generated_at: datetime
     customer_id: int
+    period_start: date | None = None
+    period_end: date
     opening_balance: Decimal
     closing_balance: Decimal
+    total_lines: int
+    limit: int
+    offset: int
     lines: list[dict]
 
 
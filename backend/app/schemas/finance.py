@@ -122,3 +122,38 @@ class FinanceDashboardSummary(BaseModel):
     revenue_this_month: Decimal
     expenses_this_month: Decimal
     net_profit_this_month: Decimal
+
+
+class BillingRunCreate(BaseModel):
+    issue_date: date | None = None
+
+
+class BillingRunRead(BaseModel):
+    id: str
+    status: str
+    issue_date: date
+    invoices_created: int
+    orders_billed: int
+    amount_billed: Decimal
+    error: str | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    elapsed_seconds: float
+    invoices_per_second: float
+
+
+class ArAgingRow(BaseModel):
+    customer_id: int
+    customer_name: str
+    outstanding: Decimal
+    open_invoices: int
+    oldest_open_due_date: date | None = None
+    days_past_due: int
+    bucket: str
+
+
+class ArAgingReport(BaseModel):
+    as_of_date: date
+    buckets: dict[str, Decimal]
+    total_outstanding: Decimal
+    rows: list[ArAgingRow]
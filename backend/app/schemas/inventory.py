@@ -17,3 +17,12 @@ class StockMovementRead(InventoryAdjustmentRequest):
 
     class Config:
         from_attributes = True
+
+
+class InventoryLevelRead(BaseModel):
+    product_id: int
+    on_hand: Decimal
+    reserved: Decimal
+
+    class Config:
+        from_attributes = True
@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class OrderItemIn(BaseModel):
@@ -18,6 +18,23 @@ class OrderCreate(BaseModel):
     items: list[OrderItemIn]
 
 
+class OrderBatchCreate(BaseModel):
+    orders: list[OrderCreate] = Field(min_length=1, max_length=1000)
+
+
+class OrderBatchItemResult(BaseModel):
+    order_number: str
+    status: str
+    order_id: int | None = None
+    detail: str | None = None
+
+
+class OrderBatchResult(BaseModel):
+    created: int
+    failed: int
+    results: list[OrderBatchItemResult]
+
+
 class OrderPatch(BaseModel):
     status: str | None = None
     tax_amount: Decimal | None = None
@@ -1,4 +1,6 @@
+from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
 from pydantic import BaseModel
 
@@ -54,3 +56,37 @@ class ProductImageMatchRead(BaseModel):
     image_url: str
     similarity_score: float
 
+
+class ProductBulkUpsertResult(BaseModel):
+    status: str
+    job_id: str | None = None
+    total_rows: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: list[dict[str, Any]] = []
+
+
+class ProductImportJobRead(BaseModel):
+    id: str
+    status: str
+    total_rows: int
+    processed_rows: int
+    created_count: int
+    updated_count: int
+    failed_count: int
+    created_at: datetime
+    finished_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class ProductAssociationRead(BaseModel):
+    product_id: int
+    sku: str
+    name: str
+    unit_price: Decimal
+    pair_count: int
+    confidence: float
+    lift: float
@@ -1,3 +1,4 @@
+from datetime import date, datetime
 from decimal import Decimal
 
 from pydantic import BaseModel
@@ -20,3 +21,32 @@ class StockAgingRow(BaseModel):
 class StockAgingResponse(BaseModel):
     as_of_date: str
     rows: list[StockAgingRow]
+
+
+class SalesPostingMetrics(BaseModel):
+    pending_events: int
+    failed_events: int
+    lag_seconds: float
+    posted_last_minute: int
+    events_per_second: float
+    worker_batches: int
+    worker_events: int
+    last_batch_size: int
+    last_batch_seconds: float
+    last_posted_at: datetime | None = None
+
+
+class CustomerSegmentRead(BaseModel):
+    customer_id: int
+    last_activity_date: date | None = None
+    recency_days: int | None = None
+    frequency: int
+    monetary: Decimal
+    recency_score: int
+    frequency_score: int
+    monetary_score: int
+    segment: str
+    computed_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -1,3 +1,4 @@
+from datetime import date, datetime
 from decimal import Decimal
 
 from pydantic import BaseModel
@@ -24,3 +25,34 @@ class ReturnRead(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ReturnProductSummary(BaseModel):
+    product_id: int
+    product_name: str | None = None
+    returned_units: Decimal
+    refund_value: Decimal
+    units_sold: int
+    return_rate: float
+
+
+class ReturnPeriodSummary(BaseModel):
+    day: date
+    return_count: int
+    returned_units: Decimal
+    refund_value: Decimal
+    units_sold: int
+    return_rate: float
+
+
+class ReturnsSummary(BaseModel):
+    client_id: str
+    window_start: date
+    window_end: date
+    generated_at: datetime
+    returned_units: Decimal
+    refund_value: Decimal
+    units_sold: int
+    return_rate: float
+    products: list[ReturnProductSummary]
+    periods: list[ReturnPeriodSummary]
@@ -0,0 +1,71 @@
+import logging
+import threading
+from collections.abc import Callable
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicWorker:
+    """Run ``task`` every ``interval_seconds`` on a daemon thread until stopped."""
+
+    def __init__(self, name: str, interval_seconds: float, task: Callable[[], object]) -> None:
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.task = task
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.task()
+            except Exception:
+                logger.exception('background worker %s failed', self.name)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+def start_background_workers() -> list[PeriodicWorker]:
+    from backend.app.services.customer_segments import run_customer_segmentation
+    from backend.app.services.idempotency import purge_expired_keys
+    from backend.app.services.pdf_documents import run_month_end_close
+    from backend.app.services.product_associations import run_product_associations
+    from backend.app.services.sales_posting import run_sales_posting
+    from backend.app.services.stock_reservation import sweep_expired_reservations
+
+    workers = [
+        PeriodicWorker(
+            'stock-reservation-sweeper',
+            settings.stock_reservation_sweep_interval_seconds,
+            sweep_expired_reservations,
+        ),
+        PeriodicWorker('idempotency-key-purge', 3600.0, purge_expired_keys),
+        PeriodicWorker('sales-posting', settings.sales_posting_interval_seconds, run_sales_posting),
+        PeriodicWorker(
+            'product-associations',
+            settings.product_associations_interval_seconds,
+            run_product_associations,
+        ),
+        PeriodicWorker(
+            'customer-segmentation',
+            settings.customer_segments_interval_seconds,
+            run_customer_segmentation,
+        ),
+        PeriodicWorker(
+            'month-end-close',
+            settings.customer_balance_snapshot_interval_seconds,
+            run_month_end_close,
+        ),
+    ]
+    for worker in workers:
+        worker.start()
+    return workers
@@ -0,0 +1,179 @@
+"""Billing runs: invoice every fulfilled, un-invoiced order, one invoice per customer.
+
+A run walks customers in ``customer_id`` order, ``chunk_size`` customers per transaction. Each chunk
+locks its orders with one query, takes a block of invoice numbers from the ``invoice`` sequence,
+bulk-inserts the invoices, the order links and one accounts-receivable journal entry per invoice, and
+refreshes the billed customers' balances. The run row records the last customer billed, so a failed
+or interrupted run resumes where it stopped.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.db.session import SessionLocal
+from backend.app.models.accounting import JournalEntry, JournalLine
+from backend.app.models.billing_run import BillingRun
+from backend.app.models.client import Invoice
+from backend.app.models.order import Order
+from backend.app.services.customer_balances import refresh_customer_balances
+from backend.app.services.document_sequences import reserve_numbers
+from backend.app.services.finance_service import ACCOUNT_CODES, _get_account_by_code, ensure_default_chart_of_accounts
+
+logger = logging.getLogger(__name__)
+
+INVOICE_SEQUENCE = 'invoice'
+
+
+def create_billing_run(db: Session, issue_date: date | None = None) -> BillingRun:
+    run = BillingRun(id=str(uuid4()), issue_date=issue_date or date.today(), status='queued')
+    db.add(run)
+    db.commit()
+    return run
+
+
+def _bill_chunk(db: Session, run: BillingRun, chunk_size: int, accounts: tuple[int, int]) -> int:
+    customers = (
+        select(Order.customer_id)
+        .where(Order.status == 'fulfilled', Order.invoice_id.is_(None), Order.customer_id > run.last_customer_id)
+        .distinct()
+        .order_by(Order.customer_id.asc())
+        .limit(chunk_size)
+    )
+    orders = (
+        db.query(Order.id, Order.customer_id, Order.total_amount)
+        .filter(Order.status == 'fulfilled', Order.invoice_id.is_(None), Order.customer_id.in_(customers))
+        .order_by(Order.customer_id.asc(), Order.id.asc())
+        .with_for_update()
+        .all()
+    )
+    if not orders:
+        return 0
+
+    by_customer: dict[int, list] = defaultdict(list)
+    for order in orders:
+        by_customer[order.customer_id].append(order)
+
+    first_number = reserve_numbers(db, INVOICE_SEQUENCE, len(by_customer))
+    due_date = run.issue_date + timedelta(days=settings.invoice_payment_terms_days)
+    now = datetime.utcnow()
+    invoices = []
+    for offset, (customer_id, customer_orders) in enumerate(by_customer.items()):
+        invoices.append(
+            {
+                'invoice_number': f'INV-{first_number + offset:08d}',
+                'customer_id': customer_id,
+                'order_id': customer_orders[0].id if len(customer_orders) == 1 else None,
+                'issue_date': run.issue_date,
+                'due_date': due_date,
+                'total_amount': sum((Decimal(order.total_amount or 0) for order in customer_orders), Decimal('0')),
+                'paid_amount': Decimal('0'),
+                'status': 'open',
+                'created_at': now,
+            }
+        )
+    invoice_ids = db.scalars(insert(Invoice).returning(Invoice.id, sort_by_parameter_order=True), invoices).all()
+    db.execute(
+        update(Order),
+        [
+            {'id': order.id, 'invoice_id': invoice_id}
+            for invoice_id, customer_orders in zip(invoice_ids, by_customer.values())
+            for order in customer_orders
+        ],
+    )
+    refresh_customer_balances(db, by_customer)
+
+    receivable_id, revenue_id = accounts
+    billable = [invoice for invoice in invoices if invoice['total_amount']]
+    if billable:
+        entry_ids = db.scalars(
+            insert(JournalEntry).returning(JournalEntry.id, sort_by_parameter_order=True),
+            [
+                {
+                    'entry_date': run.issue_date.isoformat(),
+                    'description': f"Invoice {invoice['invoice_number']}",
+                    'reference_type': 'invoice',
+                    'reference_id': invoice['invoice_number'],
+                    'created_by': None,
+                    'created_at': now,
+                    'is_reversal': False,
+                }
+                for invoice in billable
+            ],
+        ).all()
+        db.execute(
+            insert(JournalLine),
+            [
+                line
+                for entry_id, invoice in zip(entry_ids, billable)
+                for line in (
+                    {'journal_entry_id': entry_id, 'account_id': receivable_id, 'debit': invoice['total_amount'], 'credit': 0},
+                    {'journal_entry_id': entry_id, 'account_id': revenue_id, 'debit': 0, 'credit': invoice['total_amount']},
+                )
+            ],
+        )
+
+    run.invoices_created += len(invoices)
+    run.orders_billed += len(orders)
+    run.amount_billed = Decimal(run.amount_billed or 0) + sum(invoice['total_amount'] for invoice in invoices)
+    run.last_customer_id = max(by_customer)
+    db.commit()
+    return len(invoices)
+
+
+def run_billing(db: Session, run: BillingRun, chunk_size: int | None = None) -> BillingRun:
+    """Bill until no un-invoiced fulfilled orders remain; safe to call again on a failed run."""
+    chunk_size = chunk_size or settings.billing_run_chunk_size
+    run.status = 'running'
+    run.error = None
+    run.started_at = run.started_at or datetime.utcnow()
+    db.commit()
+    try:
+        ensure_default_chart_of_accounts(db)
+        accounts = (
+            _get_account_by_code(db, ACCOUNT_CODES['accounts_receivable']).id,
+            _get_account_by_code(db, ACCOUNT_CODES['revenue']).id,
+        )
+        while _bill_chunk(db, run, chunk_size, accounts):
+            pass
+    except Exception as exc:
+        db.rollback()
+        logger.exception('billing run %s failed', run.id)
+        run.status = 'failed'
+        run.error = str(exc)[:1000]
+    else:
+        run.status = 'completed'
+    run.finished_at = datetime.utcnow()
+    db.commit()
+    return run
+
+
+def run_billing_job(run_id: str) -> None:
+    db = SessionLocal()
+    try:
+        run_billing(db, db.get(BillingRun, run_id))
+    finally:
+        db.close()
+
+
+def billing_run_report(run: BillingRun) -> dict:
+    elapsed = ((run.finished_at or datetime.utcnow()) - run.started_at).total_seconds() if run.started_at else 0.0
+    return {
+        'id': run.id,
+        'status': run.status,
+        'issue_date': run.issue_date,
+        'invoices_created': run.invoices_created,
+        'orders_billed': run.orders_billed,
+        'amount_billed': run.amount_billed,
+        'error': run.error,
+        'started_at': run.started_at,
+        'finished_at': run.finished_at,
+        'elapsed_seconds': elapsed,
+        'invoices_per_second': run.invoices_created / elapsed if elapsed > 0 else 0.0,
+    }
@@ -0,0 +1,114 @@
+import hashlib
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from fastapi import Response, status
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.db.dialect import upsert_insert
+from backend.app.models.catalog_version import CatalogVersion
+
+ALL_TENANTS = '*'
+
+
+@dataclass
+class CatalogSnapshot:
+    version: int
+    etag: str
+    body: bytes
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(',')}
+    return '*' in candidates or etag in candidates
+
+
+class CatalogCache:
+    """Per-tenant serialized catalog keyed on the persisted catalog version.
+
+    Versions are re-read from ``catalog_versions`` at most once per ``version_ttl_seconds``
+    so writes made by other API workers become visible within that window; writes made
+    through this process invalidate immediately on commit.
+    """
+
+    def __init__(self, version_ttl_seconds: float | None = None) -> None:
+        self.version_ttl_seconds = (
+            settings.catalog_version_ttl_seconds if version_ttl_seconds is None else version_ttl_seconds
+        )
+        self._lock = threading.Lock()
+        self._versions: dict[str, tuple[int, float]] = {}
+        self._snapshots: dict[str, CatalogSnapshot] = {}
+
+    def cached(self, scope: str) -> CatalogSnapshot | None:
+        """Return the snapshot for ``scope`` if its version is known to be current."""
+        with self._lock:
+            known = self._versions.get(scope)
+            snapshot = self._snapshots.get(scope)
+        if known is None or snapshot is None:
+            return None
+        version, checked_at = known
+        if time.monotonic() - checked_at > self.version_ttl_seconds or snapshot.version != version:
+            return None
+        return snapshot
+
+    def current_version(self, db: Session, scope: str) -> int:
+        with self._lock:
+            known = self._versions.get(scope)
+        if known is not None and time.monotonic() - known[1] <= self.version_ttl_seconds:
+            return known[0]
+        version = db.query(CatalogVersion.version).filter(CatalogVersion.client_id == scope).scalar() or 0
+        with self._lock:
+            self._versions[scope] = (version, time.monotonic())
+        return version
+
+    def store(self, scope: str, version: int, body: bytes) -> CatalogSnapshot:
+        snapshot = CatalogSnapshot(version=version, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"', body=body)
+        with self._lock:
+            self._snapshots[scope] = snapshot
+        return snapshot
+
+    def invalidate(self, *scopes: str) -> None:
+        with self._lock:
+            for scope in scopes:
+                self._versions.pop(scope, None)
+                self._snapshots.pop(scope, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._versions.clear()
+            self._snapshots.clear()
+
+    def bump(self, db: Session, client_id: str) -> None:
+        """Increment the tenant and global catalog versions inside the caller's transaction."""
+        scopes = [client_id, ALL_TENANTS]
+        now = datetime.utcnow()
+        stmt = upsert_insert(db, CatalogVersion).values(
+            [{'client_id': scope, 'version': 1, 'updated_at': now} for scope in scopes]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CatalogVersion.client_id],
+            set_={'version': CatalogVersion.version + 1, 'updated_at': now},
+        )
+        db.execute(stmt)
+        self.invalidate(*scopes)
+        event.listen(db, 'after_commit', lambda _session: self.invalidate(*scopes), once=True)
+
+    def response(self, db: Session, scope: str, if_none_match: str | None, load_body: Callable[[], bytes]) -> Response:
+        snapshot = self.cached(scope)
+        if snapshot is None:
+            version = self.current_version(db, scope)
+            snapshot = self.cached(scope) or self.store(scope, version, load_body())
+        headers = {'ETag': snapshot.etag, 'Cache-Control': 'no-cache'}
+        if etag_matches(if_none_match, snapshot.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=snapshot.body, media_type='application/json', headers=headers)
+
+
+catalog_cache = CatalogCache()
@@ -1,8 +1,8 @@
-from datetime import datetime
+from datetime import date
 from decimal import Decimal
 
 from fastapi import HTTPException
-from sqlalchemy import and_, func
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 from backend.app.models.client import Invoice, Payment, PaymentConfirmation, SupportMessage
@@ -10,22 +10,28 @@ from backend.app.models.customer import Customer
 from backend.app.models.order import Order
 from backend.app.models.return_order import ReturnOrder
 from backend.app.models.user import User
+from backend.app.services.customer_balances import available_credit, get_customer_balance
+from backend.app.services.customer_statements import customer_statement, full_statement
 
 
-def _resolve_customer(db: Session, user: User) -> Customer:
-    customer = db.query(Customer).filter(Customer.email == user.email).first()
-    if not customer:
-        raise HTTPException(status_code=404, detail='No customer profile linked to this user')
-    return customer
+def _resolve_customer_id(db: Session, user: User) -> int:
+    """The customer id carried on the authenticated user; unlinked users are matched by email once."""
+    if user.customer_id is None:
+        user.customer_id = db.scalar(select(Customer.id).where(Customer.email == user.email))
+        if user.customer_id is None:
+            raise HTTPException(status_code=404, detail='No customer profile linked to this user')
+        db.commit()
+    return user.customer_id
 
 
 def get_client_dashboard(db: Session, user: User) -> dict:
-    customer = _resolve_customer(db, user)
-    orders = db.query(Order).filter(Order.customer_id == customer.id).order_by(Order.id.desc()).limit(20).all()
-    invoices = db.query(Invoice).filter(Invoice.customer_id == customer.id).order_by(Invoice.id.desc()).limit(20).all()
-    payments = db.query(Payment).filter(Payment.customer_id == customer.id).order_by(Payment.id.desc()).limit(20).all()
+    customer_id = _resolve_customer_id(db, user)
+    orders = db.query(Order).filter(Order.customer_id == customer_id).order_by(Order.id.desc()).limit(20).all()
+    invoices = db.query(Invoice).filter(Invoice.customer_id == customer_id).order_by(Invoice.id.desc()).limit(20).all()
+    payments = db.query(Payment).filter(Payment.customer_id == customer_id).order_by(Payment.id.desc()).limit(20).all()
 
-    outstanding = sum((Decimal(inv.total_amount) - Decimal(inv.paid_amount) for inv in invoices), Decimal('0'))
+    balance = get_customer_balance(db, customer_id)
+    outstanding = Decimal(balance.outstanding) if balance else Decimal('0')
     recent_transactions = [
         {
             'type': 'invoice',
@@ -82,59 +88,62 @@ def get_client_dashboard(db: Session, user: User) -> dict:
             }
             for p in payments
         ],
-        'available_credit_limit': Decimal('10000.00') - outstanding,
+        'available_credit_limit': available_credit(balance),
         'recent_transactions': recent_transactions,
     }
 
 
 def list_client_orders(db: Session, user: User) -> list[dict]:
-    customer = _resolve_customer(db, user)
-    orders = db.query(Order).filter(Order.customer_id == customer.id).order_by(Order.id.desc()).all()
+    customer_id = _resolve_customer_id(db, user)
+    orders = db.query(Order).filter(Order.customer_id == customer_id).order_by(Order.id.desc()).all()
     return [{'id': o.id, 'number': o.order_number, 'status': o.status, 'total': str(o.total_amount)} for o in orders]
 
 
 def list_client_invoices(db: Session, user: User) -> list[Invoice]:
-    customer = _resolve_customer(db, user)
-    return db.query(Invoice).filter(Invoice.customer_id == customer.id).order_by(Invoice.id.desc()).all()
+    customer_id = _resolve_customer_id(db, user)
+    return db.query(Invoice).filter(Invoice.customer_id == customer_id).order_by(Invoice.id.desc()).all()
 
 
-def get_client_statement(db: Session, user: User) -> dict:
-    customer = _resolve_customer(db, user)
-    invoices = db.query(Invoice).filter(Invoice.customer_id == customer.id).all()
-    payments = db.query(Payment).filter(Payment.customer_id == customer.id).all()
+def get_client_invoice(db: Session, user: User, invoice_id: int) -> Invoice:
+    customer_id = _resolve_customer_id(db, user)
+    invoice = db.query(Invoice).filter(Invoice.id == invoice_id, Invoice.customer_id == customer_id).first()
+    if not invoice:
+        raise HTTPException(status_code=404, detail='Invoice not found')
+    return invoice
 
-    invoice_total = sum((Decimal(i.total_amount) for i in invoices), Decimal('0'))
-    payment_total = sum((Decimal(p.amount) for p in payments), Decimal('0'))
-    closing = invoice_total - payment_total
 
-    lines = [
-        {'type': 'invoice', 'id': i.id, 'date': i.issue_date.isoformat(), 'debit': str(i.total_amount), 'credit': '0.00'}
-        for i in invoices
-    ] + [
-        {'type': 'payment', 'id': p.id, 'date': p.payment_date.isoformat(), 'debit': '0.00', 'credit': str(p.amount)}
-        for p in payments
-    ]
+def get_client_statement(
+    db: Session,
+    user: User,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> dict:
+    customer_id = _resolve_customer_id(db, user)
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail='from must be on or before to')
+    return customer_statement(db, customer_id, date_from, date_to, limit, offset)
 
-    return {
-        'generated_at': datetime.utcnow(),
-        'customer_id': customer.id,
-        'opening_balance': Decimal('0.00'),
-        'closing_balance': closing,
-        'lines': sorted(lines, key=lambda x: x['date']),
-    }
+
+def get_full_client_statement(db: Session, user: User, date_from: date | None = None, date_to: date | None = None) -> dict:
+    customer_id = _resolve_customer_id(db, user)
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail='from must be on or before to')
+    return full_statement(db, customer_id, date_from, date_to)
 
 
 def submit_payment_confirmation(db: Session, user: User, invoice_id: int | None, amount: Decimal, note: str | None):
-    customer = _resolve_customer(db, user)
-    record = PaymentConfirmation(customer_id=customer.id, invoice_id=invoice_id, amount=amount, note=note)
+    customer_id = _resolve_customer_id(db, user)
+    record = PaymentConfirmation(customer_id=customer_id, invoice_id=invoice_id, amount=amount, note=note)
     db.add(record)
     db.commit()
     return {'status': 'submitted', 'confirmation_id': record.id}
 
 
 def submit_return_request(db: Session, user: User, order_id: int, reason: str):
-    customer = _resolve_customer(db, user)
-    order = db.query(Order).filter(and_(Order.id == order_id, Order.customer_id == customer.id)).first()
+    customer_id = _resolve_customer_id(db, user)
+    order = db.query(Order).filter(and_(Order.id == order_id, Order.customer_id == customer_id)).first()
     if not order:
         raise HTTPException(status_code=404, detail='Order not found')
     request = ReturnOrder(order_id=order.id, reason=reason, status='requested')
@@ -144,16 +153,8 @@ def submit_return_request(db: Session, user: User, order_id: int, reason: str):
 
 
 def submit_support_message(db: Session, user: User, subject: str, message: str):
-    customer = _resolve_customer(db, user)
-    support = SupportMessage(customer_id=customer.id, subject=subject, message=message)
+    customer_id = _resolve_customer_id(db, user)
+    support = SupportMessage(customer_id=customer_id, subject=subject, message=message)
     db.add(support)
     db.commit()
     return {'status': 'submitted', 'support_message_id': support.id}
-
-
-def statement_pdf_stub(statement_data: dict) -> dict:
-    return {
-        'file_name': f"statement_{statement_data['customer_id']}.pdf",
-        'content_type': 'application/pdf',
-        'stub': 'PDF generation placeholder',
-    }
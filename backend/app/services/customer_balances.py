@@ -0,0 +1,141 @@
+"""Per-customer receivable projection kept in ``customer_balances``.
+
+Every flush that writes an ``Invoice`` or ``Payment`` through the ORM recomputes the touched customers'
+rows in the same transaction with one upsert; bulk writers that bypass the unit of work (billing runs)
+call ``refresh_customer_balances`` themselves. ``rebuild_customer_balances`` recomputes every row.
+The portal dashboard, credit figures and AR aging then read one row per customer.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import and_, case, delete, event, func, inspect, insert, literal, select
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.db.dialect import upsert_insert
+from backend.app.models.client import Invoice, Payment
+from backend.app.models.customer import Customer
+from backend.app.models.customer_balance import CustomerBalance
+
+BALANCE_COLUMNS = (
+    'customer_id',
+    'invoiced_total',
+    'paid_total',
+    'outstanding',
+    'open_invoices',
+    'oldest_open_due_date',
+    'updated_at',
+)
+AGING_BUCKETS = (('current', 0), ('1_30', 30), ('31_60', 60), ('61_90', 90))
+
+
+def _balance_source(customer_ids: list[int] | None = None):
+    is_open = and_(Invoice.status != 'paid', Invoice.total_amount > func.coalesce(Invoice.paid_amount, 0))
+    invoiced = select(
+        Invoice.customer_id,
+        func.sum(Invoice.total_amount).label('amount'),
+        func.count(case((is_open, Invoice.id))).label('open_invoices'),
+        func.min(case((is_open, Invoice.due_date))).label('oldest_due'),
+    ).group_by(Invoice.customer_id)
+    paid = select(Payment.customer_id, func.sum(Payment.amount).label('amount')).group_by(Payment.customer_id)
+    if customer_ids is not None:
+        invoiced = invoiced.where(Invoice.customer_id.in_(customer_ids))
+        paid = paid.where(Payment.customer_id.in_(customer_ids))
+    invoiced, paid = invoiced.subquery('invoiced'), paid.subquery('paid')
+
+    source = (
+        select(
+            Customer.id,
+            func.coalesce(invoiced.c.amount, 0),
+            func.coalesce(paid.c.amount, 0),
+            func.coalesce(invoiced.c.amount, 0) - func.coalesce(paid.c.amount, 0),
+            func.coalesce(invoiced.c.open_invoices, 0),
+            invoiced.c.oldest_due,
+            literal(datetime.utcnow()),
+        )
+        .outerjoin(invoiced, invoiced.c.customer_id == Customer.id)
+        .outerjoin(paid, paid.c.customer_id == Customer.id)
+    )
+    if customer_ids is not None:
+        source = source.where(Customer.id.in_(customer_ids))
+    return source
+
+
+def refresh_customer_balances(db: Session, customer_ids) -> None:
+    """Recompute the given customers' rows inside the caller's transaction."""
+    customer_ids = sorted(set(customer_ids))
+    if not customer_ids:
+        return
+    stmt = upsert_insert(db, CustomerBalance).from_select(BALANCE_COLUMNS, _balance_source(customer_ids))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CustomerBalance.customer_id],
+        set_={column: stmt.excluded[column] for column in BALANCE_COLUMNS if column != 'customer_id'},
+    )
+    db.execute(stmt)
+
+
+def rebuild_customer_balances(db: Session) -> int:
+    """Replace every row with one INSERT ... SELECT; the caller commits."""
+    db.execute(delete(CustomerBalance))
+    db.execute(insert(CustomerBalance).from_select(BALANCE_COLUMNS, _balance_source()))
+    return db.scalar(select(func.count()).select_from(CustomerBalance))
+
+
+@event.listens_for(Session, 'after_flush')
+def _refresh_after_flush(session: Session, _flush_context) -> None:
+    customer_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (Invoice, Payment)):
+            customer_ids.add(obj.customer_id)
+            customer_ids.update(inspect(obj).attrs.customer_id.history.deleted or ())
+    customer_ids.discard(None)
+    if customer_ids:
+        refresh_customer_balances(session, customer_ids)
+
+
+def get_customer_balance(db: Session, customer_id: int) -> CustomerBalance | None:
+    return db.get(CustomerBalance, customer_id)
+
+
+def available_credit(balance: CustomerBalance | None) -> Decimal:
+    outstanding = Decimal(balance.outstanding) if balance else Decimal('0')
+    return settings.customer_credit_limit - outstanding
+
+
+def _aging_bucket(days_past_due: int) -> str:
+    for bucket, limit in AGING_BUCKETS:
+        if days_past_due <= limit:
+            return bucket
+    return 'over_90'
+
+
+def ar_aging(db: Session, as_of: date | None = None) -> dict:
+    """Age each customer's outstanding balance by its oldest open due date."""
+    as_of = as_of or date.today()
+    rows = (
+        db.query(CustomerBalance, Customer.full_name)
+        .join(Customer, Customer.id == CustomerBalance.customer_id)
+        .filter(CustomerBalance.outstanding > 0)
+        .order_by(CustomerBalance.oldest_open_due_date.asc(), CustomerBalance.customer_id.asc())
+        .all()
+    )
+    totals = {bucket: Decimal('0') for bucket, _ in AGING_BUCKETS} | {'over_90': Decimal('0')}
+    lines = []
+    for balance, name in rows:
+        due = balance.oldest_open_due_date
+        days_past_due = max((as_of - due).days, 0) if due else 0
+        bucket = _aging_bucket(days_past_due)
+        totals[bucket] += Decimal(balance.outstanding)
+        lines.append(
+            {
+                'customer_id': balance.customer_id,
+                'customer_name': name,
+                'outstanding': balance.outstanding,
+                'open_invoices': balance.open_invoices,
+                'oldest_open_due_date': due,
+                'days_past_due': days_past_due,
+                'bucket': bucket,
+            }
+        )
+    return {'as_of_date': as_of, 'buckets': totals, 'total_outstanding': sum(totals.values(), Decimal('0')), 'rows': lines}
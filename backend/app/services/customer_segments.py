@@ -0,0 +1,160 @@
+"""Nightly RFM (recency, frequency, monetary) segmentation of customers.
+
+One ``INSERT ... SELECT`` aggregates orders, invoices and payments per customer, scores each dimension
+1-5 by its quintile among customers with any activity in it (``cume_dist``), and labels the segment.
+Customers with no activity in a dimension score 1 there. Lookups at message time read one row by key.
+"""
+
+import logging
+from datetime import date, datetime
+
+from sqlalchemy import Date, Integer, and_, case, cast, delete, exists, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from backend.app.db.dialect import is_postgresql
+from backend.app.db.session import SessionLocal
+from backend.app.models.client import Invoice, Payment
+from backend.app.models.customer import Customer
+from backend.app.models.customer_segment import CustomerSegment
+from backend.app.models.order import Order
+
+logger = logging.getLogger(__name__)
+
+ORDER_STATUSES = ('confirmed', 'fulfilled')
+
+
+def _quintile(value, has_value):
+    rank = func.cume_dist().over(partition_by=has_value, order_by=value.asc())
+    return case(
+        (~has_value, 1),
+        (rank <= 0.2, 1),
+        (rank <= 0.4, 2),
+        (rank <= 0.6, 3),
+        (rank <= 0.8, 4),
+        else_=5,
+    )
+
+
+def rebuild_customer_segments(db: Session, as_of: date | None = None) -> int:
+    """Replace every customer's segment; the caller commits. Returns the number of customers scored."""
+    as_of = as_of or datetime.utcnow().date()
+    orders = (
+        select(Order.customer_id, func.count(Order.id).label('orders'))
+        .where(Order.status.in_(ORDER_STATUSES))
+        .group_by(Order.customer_id)
+        .subquery('order_totals')
+    )
+    invoices = (
+        select(
+            Invoice.customer_id,
+            func.max(Invoice.issue_date).label('last_invoice'),
+            # Invoices raised against orders (directly or by a billing run) are already counted through them.
+            func.count(
+                case((and_(Invoice.order_id.is_(None), ~exists().where(Order.invoice_id == Invoice.id)), Invoice.id))
+            ).label('standalone_invoices'),
+        )
+        .group_by(Invoice.customer_id)
+        .subquery('invoice_totals')
+    )
+    payments = (
+        select(
+            Payment.customer_id,
+            func.max(Payment.payment_date).label('last_payment'),
+            func.sum(Payment.amount).label('paid'),
+        )
+        .group_by(Payment.customer_id)
+        .subquery('payment_totals')
+    )
+
+    newest = func.greatest if is_postgresql(db) else func.max
+    last_activity = newest(
+        func.coalesce(invoices.c.last_invoice, payments.c.last_payment),
+        func.coalesce(payments.c.last_payment, invoices.c.last_invoice),
+    )
+    if is_postgresql(db):
+        recency_days = literal(as_of, Date) - last_activity
+    else:
+        recency_days = cast(func.julianday(literal(as_of, Date)) - func.julianday(last_activity), Integer)
+    frequency = func.coalesce(orders.c.orders, 0) + func.coalesce(invoices.c.standalone_invoices, 0)
+    monetary = func.coalesce(payments.c.paid, 0)
+    base = (
+        select(
+            Customer.id.label('customer_id'),
+            last_activity.label('last_activity_date'),
+            recency_days.label('recency_days'),
+            frequency.label('frequency'),
+            monetary.label('monetary'),
+        )
+        .outerjoin(orders, orders.c.customer_id == Customer.id)
+        .outerjoin(invoices, invoices.c.customer_id == Customer.id)
+        .outerjoin(payments, payments.c.customer_id == Customer.id)
+        .subquery('activity')
+    )
+
+    scored = select(
+        base,
+        _quintile(base.c.last_activity_date, base.c.last_activity_date.is_not(None)).label('recency_score'),
+        _quintile(base.c.frequency, base.c.frequency > 0).label('frequency_score'),
+        _quintile(base.c.monetary, base.c.monetary > 0).label('monetary_score'),
+    ).subquery('scored')
+    r, f, m = scored.c.recency_score, scored.c.frequency_score, scored.c.monetary_score
+    segment = case(
+        (and_(r >= 4, f >= 4, m >= 4), 'champion'),
+        (and_(r >= 3, f >= 4), 'loyal'),
+        (and_(r >= 4, f <= 1), 'new'),
+        (r >= 4, 'promising'),
+        (and_(r <= 2, f >= 3), 'at_risk'),
+        (r <= 2, 'hibernating'),
+        else_='needs_attention',
+    )
+    source = select(
+        scored.c.customer_id,
+        scored.c.last_activity_date,
+        scored.c.recency_days,
+        scored.c.frequency,
+        scored.c.monetary,
+        r,
+        f,
+        m,
+        segment,
+        literal(datetime.utcnow()),
+    )
+
+    db.execute(delete(CustomerSegment))
+    db.execute(
+        insert(CustomerSegment).from_select(
+            [
+                'customer_id',
+                'last_activity_date',
+                'recency_days',
+                'frequency',
+                'monetary',
+                'recency_score',
+                'frequency_score',
+                'monetary_score',
+                'segment',
+                'computed_at',
+            ],
+            source,
+        )
+    )
+    return db.scalar(select(func.count()).select_from(CustomerSegment))
+
+
+def run_customer_segmentation() -> None:
+    db = SessionLocal()
+    try:
+        scored = rebuild_customer_segments(db)
+        db.commit()
+        logger.info('scored %s customers', scored)
+    finally:
+        db.close()
+
+
+def segment_for_phone(db: Session, phone_e164: str) -> CustomerSegment | None:
+    return (
+        db.query(CustomerSegment)
+        .join(Customer, Customer.id == CustomerSegment.customer_id)
+        .filter(Customer.phone_e164 == phone_e164)
+        .first()
+    )
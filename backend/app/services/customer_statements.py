@@ -0,0 +1,195 @@
+"""Customer statements over a date range and the balance snapshots that anchor them.
+
+A statement is one ``UNION ALL`` of the customer's invoices (debits) and payments (credits) dated after
+the latest snapshot before ``date_from`` and up to ``date_to``. Window sums over that set give each
+line's running balance, the opening and closing balances and the line count, and the requested page
+is cut with ``LIMIT``/``OFFSET``. Snapshots are written for every customer at each month end, so the
+union never reaches further back than one month before the range.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import Numeric, case, delete, false, func, insert, literal, select, true, type_coerce, union_all
+from sqlalchemy.orm import Session
+
+from backend.app.db.session import SessionLocal
+from backend.app.models.client import Invoice, Payment
+from backend.app.models.customer import Customer
+from backend.app.models.customer_balance import CustomerBalanceSnapshot
+
+logger = logging.getLogger(__name__)
+
+FULL_STATEMENT_PAGE_SIZE = 1000
+
+
+def _money(value) -> Decimal:
+    return Decimal(value or 0).quantize(Decimal('0.01'))
+
+
+def _entries(customer_id: int, after: date | None, date_to: date):
+    zero = literal(0, Numeric(14, 2))
+    invoices = select(
+        literal('invoice').label('type'),
+        literal(0).label('sort_key'),
+        Invoice.id.label('id'),
+        Invoice.invoice_number.label('reference'),
+        Invoice.issue_date.label('entry_date'),
+        Invoice.total_amount.label('debit'),
+        zero.label('credit'),
+    ).where(Invoice.customer_id == customer_id, Invoice.issue_date <= date_to)
+    payments = select(
+        literal('payment').label('type'),
+        literal(1).label('sort_key'),
+        Payment.id.label('id'),
+        Payment.reference.label('reference'),
+        Payment.payment_date.label('entry_date'),
+        zero.label('debit'),
+        Payment.amount.label('credit'),
+    ).where(Payment.customer_id == customer_id, Payment.payment_date <= date_to)
+    if after is not None:
+        invoices = invoices.where(Invoice.issue_date > after)
+        payments = payments.where(Payment.payment_date > after)
+    return union_all(invoices, payments).subquery('entries')
+
+
+def customer_statement(
+    db: Session,
+    customer_id: int,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> dict:
+    date_to = date_to or datetime.utcnow().date()
+    snapshot = None
+    if date_from is not None:
+        snapshot = (
+            db.query(CustomerBalanceSnapshot)
+            .filter(CustomerBalanceSnapshot.customer_id == customer_id, CustomerBalanceSnapshot.balance_date < date_from)
+            .order_by(CustomerBalanceSnapshot.balance_date.desc())
+            .first()
+        )
+    base_balance = _money(snapshot.balance) if snapshot else Decimal('0.00')
+    base = literal(base_balance, Numeric(14, 2))
+
+    entries = _entries(customer_id, snapshot.balance_date if snapshot else None, date_to)
+    signed = entries.c.debit - entries.c.credit
+    before = entries.c.entry_date < date_from if date_from is not None else false()
+    in_range = entries.c.entry_date >= date_from if date_from is not None else true()
+    opening = base + func.coalesce(func.sum(case((before, signed), else_=0)).over(), 0)
+    closing = base + func.coalesce(func.sum(signed).over(), 0)
+    order = (entries.c.entry_date, entries.c.sort_key, entries.c.id)
+    ledger = select(
+        entries,
+        type_coerce(base + func.sum(signed).over(order_by=order), Numeric(14, 2)).label('balance'),
+        type_coerce(opening, Numeric(14, 2)).label('opening_balance'),
+        type_coerce(closing, Numeric(14, 2)).label('closing_balance'),
+        in_range.label('in_range'),
+    ).subquery('ledger')
+    rows = db.execute(
+        select(ledger, func.count().over().label('total_lines'))
+        .where(ledger.c.in_range)
+        .order_by(ledger.c.entry_date, ledger.c.sort_key, ledger.c.id)
+        .limit(limit)
+        .offset(offset)
+    ).all()
+
+    if rows:
+        opening_balance, closing_balance, total_lines = rows[0].opening_balance, rows[0].closing_balance, rows[0].total_lines
+    else:
+        # Past the last page (or nothing in range): the balances still come from one aggregate.
+        totals = db.execute(
+            select(
+                func.coalesce(func.sum(case((before, signed), else_=0)), 0),
+                func.coalesce(func.sum(signed), 0),
+                func.count(case((in_range, 1))),
+            )
+        ).one()
+        opening_balance = base_balance + _money(totals[0])
+        closing_balance = base_balance + _money(totals[1])
+        total_lines = totals[2]
+
+    return {
+        'generated_at': datetime.utcnow(),
+        'customer_id': customer_id,
+        'period_start': date_from,
+        'period_end': date_to,
+        'opening_balance': _money(opening_balance),
+        'closing_balance': _money(closing_balance),
+        'total_lines': total_lines,
+        'limit': limit,
+        'offset': offset,
+        'lines': [
+            {
+                'type': row.type,
+                'id': row.id,
+                'reference': row.reference,
+                'date': (row.entry_date if isinstance(row.entry_date, date) else date.fromisoformat(row.entry_date)).isoformat(),
+                'debit': str(_money(row.debit)),
+                'credit': str(_money(row.credit)),
+                'balance': str(_money(row.balance)),
+            }
+            for row in rows
+        ],
+    }
+
+
+def full_statement(db: Session, customer_id: int, date_from: date | None, date_to: date | None) -> dict:
+    """Every line of a statement, fetched page by page."""
+    statement = customer_statement(db, customer_id, date_from, date_to, FULL_STATEMENT_PAGE_SIZE, 0)
+    while len(statement['lines']) < statement['total_lines']:
+        page = customer_statement(db, customer_id, date_from, date_to, FULL_STATEMENT_PAGE_SIZE, len(statement['lines']))
+        if not page['lines']:
+            break
+        statement['lines'] += page['lines']
+    return statement
+
+
+def snapshot_customer_balances(db: Session, balance_date: date) -> int:
+    """Write every customer's balance at the close of ``balance_date``; the caller commits."""
+    invoiced = (
+        select(Invoice.customer_id, func.sum(Invoice.total_amount).label('amount'))
+        .where(Invoice.issue_date <= balance_date)
+        .group_by(Invoice.customer_id)
+        .subquery('invoiced')
+    )
+    paid = (
+        select(Payment.customer_id, func.sum(Payment.amount).label('amount'))
+        .where(Payment.payment_date <= balance_date)
+        .group_by(Payment.customer_id)
+        .subquery('paid')
+    )
+    source = (
+        select(
+            Customer.id,
+            literal(balance_date),
+            func.coalesce(invoiced.c.amount, 0) - func.coalesce(paid.c.amount, 0),
+            literal(datetime.utcnow()),
+        )
+        .outerjoin(invoiced, invoiced.c.customer_id == Customer.id)
+        .outerjoin(paid, paid.c.customer_id == Customer.id)
+    )
+    db.execute(delete(CustomerBalanceSnapshot).where(CustomerBalanceSnapshot.balance_date == balance_date))
+    db.execute(
+        insert(CustomerBalanceSnapshot).from_select(['customer_id', 'balance_date', 'balance', 'created_at'], source)
+    )
+    return db.scalar(
+        select(func.count()).select_from(CustomerBalanceSnapshot).where(CustomerBalanceSnapshot.balance_date == balance_date)
+    )
+
+
+def run_balance_snapshots() -> date | None:
+    """Snapshot the last month end once and return it; later runs in the same month return ``None``."""
+    month_end = datetime.utcnow().date().replace(day=1) - timedelta(days=1)
+    db = SessionLocal()
+    try:
+        if db.query(CustomerBalanceSnapshot.customer_id).filter(CustomerBalanceSnapshot.balance_date == month_end).first():
+            return None
+        written = snapshot_customer_balances(db, month_end)
+        db.commit()
+        logger.info('snapshotted %s customer balances at %s', written, month_end)
+        return month_end
+    finally:
+        db.close()
@@ -0,0 +1,25 @@
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from backend.app.db.dialect import upsert_insert
+from backend.app.models.document_sequence import DocumentSequence
+
+
+def reserve_numbers(db: Session, name: str, count: int) -> int:
+    """Reserve ``count`` consecutive numbers from sequence ``name`` and return the first.
+
+    One UPDATE hands out the whole block. The sequence row stays locked until the caller's transaction
+    ends, so numbers are gap-free: a rolled-back block is handed out again.
+    """
+    db.execute(
+        upsert_insert(db, DocumentSequence)
+        .values(name=name, next_value=1)
+        .on_conflict_do_nothing(index_elements=[DocumentSequence.name])
+    )
+    next_value = db.execute(
+        update(DocumentSequence)
+        .where(DocumentSequence.name == name)
+        .values(next_value=DocumentSequence.next_value + count)
+        .returning(DocumentSequence.next_value)
+    ).scalar_one()
+    return next_value - count
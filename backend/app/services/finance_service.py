@@ -16,6 +16,7 @@ ACCOUNT_CODES = {
     'cash': '1000',
     'bank': '1010',
     'accounts_receivable': '1100',
+    'inventory': '1200',
     'accounts_payable': '2000',
     'revenue': '4000',
     'cogs': '5000',
@@ -51,6 +52,7 @@ def ensure_default_chart_of_accounts(db: Session):
         ('1000', 'Cash', 'asset'),
         ('1010', 'Bank', 'asset'),
         ('1100', 'Accounts Receivable', 'asset'),
+        ('1200', 'Inventory', 'asset'),
         ('2000', 'Accounts Payable', 'liability'),
         ('2100', 'Payroll Liability', 'liability'),
         ('3000', 'Owner Equity', 'equity'),
@@ -0,0 +1,135 @@
+"""Group commit: coalesce small concurrent write transactions into one commit.
+
+Callers hand ``GroupCommitWriter.submit`` a function that performs their writes on a session and
+returns a plain result. A single writer thread gathers submissions arriving within ``window_ms`` (up to
+``max_batch``), runs each one inside its own SAVEPOINT so a failing caller only rolls back its own
+writes, and pays for one COMMIT (one WAL flush) for the whole batch.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.app.core.config import settings
+from backend.app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class GroupCommitWriter:
+    def __init__(self, session_factory: sessionmaker, window_ms: float = 5.0, max_batch: int = 100) -> None:
+        self.session_factory = session_factory
+        self.window_seconds = window_ms / 1000
+        self.max_batch = max_batch
+        self.batches = 0
+        self.items = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, work: Callable[[Session], Any]) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='group-commit-writer', daemon=True)
+                self._thread.start()
+        self._queue.put((work, future))
+        return future
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def _collect(self) -> tuple[list, bool]:
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.window_seconds
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect()
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: list[tuple[Callable[[Session], Any], Future]]) -> None:
+        results: list[tuple[Future, Any]] = []
+        db = self.session_factory()
+        try:
+            for work, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                savepoint = db.begin_nested()
+                try:
+                    result = work(db)
+                    db.flush()
+                except Exception as exc:
+                    savepoint.rollback()
+                    future.set_exception(exc)
+                else:
+                    savepoint.commit()
+                    results.append((future, result))
+            db.commit()
+        except Exception as exc:
+            logger.exception('group commit of %s writes failed', len(batch))
+            db.rollback()
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        finally:
+            db.close()
+
+        self.batches += 1
+        self.items += len(batch)
+        for future, result in results:
+            future.set_result(result)
+
+
+_sale_writer: GroupCommitWriter | None = None
+_sale_writer_lock = threading.Lock()
+
+
+def get_sale_writer() -> GroupCommitWriter:
+    global _sale_writer
+    with _sale_writer_lock:
+        if _sale_writer is None:
+            _sale_writer = GroupCommitWriter(
+                SessionLocal,
+                window_ms=settings.group_commit_window_ms,
+                max_batch=settings.group_commit_max_batch,
+            )
+        return _sale_writer
+
+
+def stop_sale_writer() -> None:
+    global _sale_writer
+    with _sale_writer_lock:
+        writer, _sale_writer = _sale_writer, None
+    if writer is not None:
+        writer.stop()
@@ -0,0 +1,104 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.core.ttl_cache import TTLCache
+from backend.app.db.dialect import upsert_insert
+from backend.app.db.session import SessionLocal
+from backend.app.models.idempotency_key import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+CLAIMED = 'claimed'
+IN_PROGRESS = 'in_progress'
+COMPLETED = 'completed'
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    request_hash: str
+    status_code: int | None = None
+    content_type: str | None = None
+    body: bytes | None = None
+
+
+idempotency_cache = TTLCache(maxsize=settings.idempotency_cache_size, ttl_seconds=settings.idempotency_ttl_hours * 3600)
+
+
+def begin(db: Session, scope: str, key: str, request_hash: str) -> tuple[str, StoredResponse]:
+    """Claim ``key`` for this request, or report the state left by whoever claimed it first."""
+    cached = idempotency_cache.get((scope, key))
+    if cached is not None:
+        return COMPLETED, cached
+
+    now = datetime.utcnow()
+    for _ in range(2):
+        stmt = upsert_insert(db, IdempotencyKey).values(
+            scope=scope,
+            key=key,
+            request_hash=request_hash,
+            status=IN_PROGRESS,
+            created_at=now,
+            expires_at=now + timedelta(hours=settings.idempotency_ttl_hours),
+        )
+        claimed = db.execute(stmt.on_conflict_do_nothing(index_elements=['scope', 'key'])).rowcount == 1
+        db.commit()
+        if claimed:
+            return CLAIMED, StoredResponse(request_hash=request_hash)
+
+        row = (
+            db.query(IdempotencyKey)
+            .filter(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+            .populate_existing()
+            .first()
+        )
+        if row is None or row.expires_at <= now:
+            db.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.scope == scope, IdempotencyKey.key == key, IdempotencyKey.expires_at <= now
+                )
+            )
+            db.commit()
+            continue
+        if row.status == IN_PROGRESS:
+            return IN_PROGRESS, StoredResponse(request_hash=row.request_hash)
+        stored = StoredResponse(row.request_hash, row.status_code, row.content_type, row.response_body)
+        idempotency_cache.set((scope, key), stored)
+        return COMPLETED, stored
+    return IN_PROGRESS, StoredResponse(request_hash=request_hash)
+
+
+def complete(db: Session, scope: str, key: str, stored: StoredResponse) -> None:
+    db.query(IdempotencyKey).filter(IdempotencyKey.scope == scope, IdempotencyKey.key == key).update(
+        {
+            IdempotencyKey.status: COMPLETED,
+            IdempotencyKey.status_code: stored.status_code,
+            IdempotencyKey.content_type: stored.content_type,
+            IdempotencyKey.response_body: stored.body,
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+    idempotency_cache.set((scope, key), stored)
+
+
+def abandon(db: Session, scope: str, key: str) -> None:
+    """Drop an in-progress claim so a retry can execute the request again."""
+    db.rollback()
+    db.execute(delete(IdempotencyKey).where(IdempotencyKey.scope == scope, IdempotencyKey.key == key))
+    db.commit()
+
+
+def purge_expired_keys() -> None:
+    db = SessionLocal()
+    try:
+        result = db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= datetime.utcnow()))
+        db.commit()
+        if result.rowcount:
+            logger.info('purged %s expired idempotency keys', result.rowcount)
+    finally:
+        db.close()
@@ -6,14 +6,24 @@ from backend.app.core.config import settings
 
 
 class OpenAIImageEmbeddingService:
-    def __init__(self) -> None:
+    def __init__(self, model: str | None = None) -> None:
         if not settings.openai_api_key:
             raise ValueError('OpenAI API key not configured')
         self.client = OpenAI(api_key=settings.openai_api_key)
-        self.model = settings.openai_embedding_model
+        self.model = model or settings.openai_embedding_model
 
-    def create_embedding(self, image_bytes: bytes, content_type: str) -> list[float]:
+    @staticmethod
+    def _data_url(image_bytes: bytes, content_type: str) -> str:
         image_payload = base64.b64encode(image_bytes).decode('utf-8')
-        data_url = f'data:{content_type};base64,{image_payload}'
-        response = self.client.embeddings.create(model=self.model, input=data_url)
+        return f'data:{content_type};base64,{image_payload}'
+
+    def create_embedding(self, image_bytes: bytes, content_type: str) -> list[float]:
+        response = self.client.embeddings.create(model=self.model, input=self._data_url(image_bytes, content_type))
         return response.data[0].embedding
+
+    def create_embeddings(self, images: list[tuple[bytes, str]]) -> list[list[float]]:
+        if not images:
+            return []
+        inputs = [self._data_url(image_bytes, content_type) for image_bytes, content_type in images]
+        response = self.client.embeddings.create(model=self.model, input=inputs)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
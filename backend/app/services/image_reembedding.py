@@ -0,0 +1,169 @@
+"""Resumable re-embedding of product images into the shadow ``embedding_next`` column.
+
+Run with the target model before switching ``OPENAI_EMBEDDING_MODEL``:
+``python -m backend.app.services.image_reembedding --model <name>``.
+"""
+
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.db.session import SessionLocal
+from backend.app.models.product_image import ProductImage
+from backend.app.models.reembedding_checkpoint import ReembeddingCheckpoint
+from backend.app.services.image_embeddings import OpenAIImageEmbeddingService
+from backend.app.services.image_storage import S3ImageStorageService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReembeddingReport:
+    model: str
+    processed: int
+    total_processed: int
+    elapsed_seconds: float
+    images_per_sec: float
+    completed: bool
+
+
+class ImageReembeddingJob:
+    def __init__(
+        self,
+        db: Session,
+        model: str | None = None,
+        batch_size: int = 64,
+        fetch_concurrency: int = 8,
+        storage_service: S3ImageStorageService | None = None,
+        embedding_service: OpenAIImageEmbeddingService | None = None,
+    ) -> None:
+        if batch_size < 1 or fetch_concurrency < 1:
+            raise ValueError('batch_size and fetch_concurrency must be positive')
+        self.db = db
+        self.model = model or settings.openai_embedding_model
+        self.batch_size = batch_size
+        self.fetch_concurrency = fetch_concurrency
+        self.storage_service = storage_service or S3ImageStorageService()
+        self.embedding_service = embedding_service or OpenAIImageEmbeddingService(model=self.model)
+
+    def _checkpoint(self) -> ReembeddingCheckpoint:
+        checkpoint = self.db.query(ReembeddingCheckpoint).filter(ReembeddingCheckpoint.model == self.model).first()
+        if checkpoint is None:
+            checkpoint = ReembeddingCheckpoint(model=self.model, status='running', last_image_id=0, processed=0)
+            self.db.add(checkpoint)
+            self.db.commit()
+        return checkpoint
+
+    def _embed_rows(self, rows) -> None:
+        with ThreadPoolExecutor(max_workers=self.fetch_concurrency) as pool:
+            payloads = list(pool.map(lambda row: self.storage_service.download_product_image(row.s3_bucket, row.s3_key), rows))
+        vectors = self.embedding_service.create_embeddings(
+            [(payload, row.content_type) for payload, row in zip(payloads, rows)]
+        )
+        if len(vectors) != len(rows):
+            raise RuntimeError('Embedding service returned an unexpected number of vectors')
+        self.db.execute(
+            update(ProductImage),
+            [{'id': row.id, 'embedding_next': vector} for row, vector in zip(rows, vectors)],
+        )
+
+    def _next_rows(self, after_id: int, pending_only: bool = False):
+        query = self.db.query(
+            ProductImage.id,
+            ProductImage.s3_bucket,
+            ProductImage.s3_key,
+            ProductImage.content_type,
+        ).filter(ProductImage.id > after_id)
+        if pending_only:
+            query = query.filter(ProductImage.embedding_next.is_(None))
+        return query.order_by(ProductImage.id.asc()).limit(self.batch_size).all()
+
+    def _swap(self, checkpoint: ReembeddingCheckpoint) -> None:
+        # Images uploaded after the keyset walk passed them were embedded with the old model.
+        after_id = 0
+        while rows := self._next_rows(after_id, pending_only=True):
+            self._embed_rows(rows)
+            after_id = rows[-1].id
+        self.db.execute(
+            update(ProductImage)
+            .where(ProductImage.embedding_next.is_not(None))
+            .values(embedding=ProductImage.embedding_next, embedding_next=None)
+            .execution_options(synchronize_session=False)
+        )
+        checkpoint.status = 'completed'
+        checkpoint.completed_at = datetime.utcnow()
+        checkpoint.updated_at = checkpoint.completed_at
+        self.db.commit()
+
+    def run(self, max_batches: int | None = None) -> ReembeddingReport:
+        checkpoint = self._checkpoint()
+        started = time.perf_counter()
+        processed = 0
+        batches = 0
+
+        while checkpoint.status == 'running' and (max_batches is None or batches < max_batches):
+            rows = self._next_rows(checkpoint.last_image_id)
+            if not rows:
+                self._swap(checkpoint)
+                break
+            self._embed_rows(rows)
+            checkpoint.last_image_id = rows[-1].id
+            checkpoint.processed += len(rows)
+            checkpoint.updated_at = datetime.utcnow()
+            self.db.commit()
+
+            processed += len(rows)
+            batches += 1
+            elapsed = time.perf_counter() - started
+            logger.info(
+                're-embedded %s images for %s (last id %s, %.1f images/sec)',
+                checkpoint.processed,
+                self.model,
+                checkpoint.last_image_id,
+                processed / elapsed if elapsed > 0 else 0.0,
+            )
+
+        elapsed = time.perf_counter() - started
+        return ReembeddingReport(
+            model=self.model,
+            processed=processed,
+            total_processed=checkpoint.processed,
+            elapsed_seconds=elapsed,
+            images_per_sec=processed / elapsed if elapsed > 0 else 0.0,
+            completed=checkpoint.status == 'completed',
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Re-embed product images with a new embedding model.')
+    parser.add_argument('--model', default=settings.openai_embedding_model)
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        report = ImageReembeddingJob(
+            db,
+            model=args.model,
+            batch_size=args.batch_size,
+            fetch_concurrency=args.concurrency,
+        ).run()
+    finally:
+        db.close()
+    print(
+        f'{report.model}: {report.processed} images this run, {report.total_processed} total, '
+        f'{report.images_per_sec:.1f} images/sec, completed={report.completed}'
+    )
+
+
+if __name__ == '__main__':
+    main()
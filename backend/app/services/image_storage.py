@@ -39,3 +39,7 @@ class S3ImageStorageService:
         )
         url = f'https://{self.bucket_name}.s3.{settings.s3_region}.amazonaws.com/{key}'
         return UploadedImage(bucket=self.bucket_name, key=key, url=url)
+
+    def download_product_image(self, bucket: str, key: str) -> bytes:
+        response = self.client.get_object(Bucket=bucket, Key=key)
+        return response['Body'].read()
@@ -0,0 +1,117 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+from fastapi import HTTPException
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.app.models.customer import Customer
+from backend.app.models.order import Order, OrderItem
+from backend.app.models.product import Product
+from backend.app.schemas.order import OrderCreate
+from backend.app.services import stock_reservation
+
+CENT = Decimal('0.01')
+
+
+def _item_rows(payload: OrderCreate) -> list[dict]:
+    return [
+        {
+            'product_id': item.product_id,
+            'quantity': item.quantity,
+            'unit_price': item.unit_price,
+            'line_total': (item.quantity * item.unit_price).quantize(CENT, rounding=ROUND_HALF_UP),
+        }
+        for item in payload.items
+    ]
+
+
+def _new_order(payload: OrderCreate, item_rows: list[dict]) -> Order:
+    subtotal = sum((row['line_total'] for row in item_rows), Decimal('0'))
+    return Order(
+        order_number=payload.order_number,
+        customer_id=payload.customer_id,
+        tax_amount=payload.tax_amount,
+        discount_amount=payload.discount_amount,
+        currency=payload.currency,
+        subtotal=subtotal,
+        total_amount=subtotal + payload.tax_amount - payload.discount_amount,
+    )
+
+
+def recompute_total(order: Order) -> None:
+    order.total_amount = Decimal(order.subtotal) + Decimal(order.tax_amount) - Decimal(order.discount_amount)
+
+
+def change_status(db: Session, order: Order, status: str) -> None:
+    """Move an order to ``status``, reserving stock on confirmation and settling the hold afterwards."""
+    if status == order.status:
+        return
+    if order.status == 'draft' and status in ('confirmed', 'fulfilled'):
+        stock_reservation.reserve_order_stock(db, order)
+    if status == 'fulfilled':
+        stock_reservation.consume_order_stock(db, order.id)
+    elif status in ('draft', 'cancelled'):
+        stock_reservation.release_order_stock(db, order.id)
+    order.status = status
+
+
+def create_order(db: Session, payload: OrderCreate) -> Order:
+    item_rows = _item_rows(payload)
+    order = _new_order(payload, item_rows)
+    db.add(order)
+    db.flush()
+    if item_rows:
+        db.execute(insert(OrderItem), [{**row, 'order_id': order.id} for row in item_rows])
+    return order
+
+
+def create_order_batch(db: Session, payloads: list[OrderCreate]) -> list[dict]:
+    """Validate a batch with set-based lookups, then insert every accepted order in one transaction."""
+    numbers = {payload.order_number for payload in payloads}
+    existing_numbers = {row[0] for row in db.query(Order.order_number).filter(Order.order_number.in_(numbers))}
+    customer_ids = {
+        row[0]
+        for row in db.query(Customer.id).filter(Customer.id.in_({payload.customer_id for payload in payloads}))
+    }
+    product_ids = {
+        row[0]
+        for row in db.query(Product.id).filter(
+            Product.id.in_({item.product_id for payload in payloads for item in payload.items})
+        )
+    }
+
+    results: list[dict] = []
+    accepted: list[tuple[dict, Order, list[dict]]] = []
+    seen_numbers: set[str] = set()
+    for payload in payloads:
+        result = {'order_number': payload.order_number, 'status': 'created', 'order_id': None, 'detail': None}
+        results.append(result)
+        missing_products = sorted({item.product_id for item in payload.items} - product_ids)
+        if payload.order_number in existing_numbers or payload.order_number in seen_numbers:
+            result.update(status='duplicate', detail='Order number already exists')
+        elif payload.customer_id not in customer_ids:
+            result.update(status='failed', detail='Customer not found')
+        elif not payload.items:
+            result.update(status='failed', detail='Order has no items')
+        elif missing_products:
+            result.update(status='failed', detail=f'Unknown product ids: {missing_products}')
+        else:
+            item_rows = _item_rows(payload)
+            accepted.append((result, _new_order(payload, item_rows), item_rows))
+        seen_numbers.add(payload.order_number)
+
+    if accepted:
+        db.add_all([order for _, order, _ in accepted])
+        try:
+            db.flush()
+            db.execute(
+                insert(OrderItem),
+                [{**row, 'order_id': order.id} for _, order, item_rows in accepted for row in item_rows],
+            )
+        except IntegrityError as exc:
+            db.rollback()
+            raise HTTPException(status_code=409, detail='Batch conflicts with concurrent writes; retry') from exc
+        for result, order, _ in accepted:
+            result['order_id'] = order.id
+    return results
@@ -0,0 +1,210 @@
+"""Invoice and statement PDFs rendered in a worker pool and cached by content hash.
+
+A document is first reduced to its underlying data (the invoice and its order lines, or a statement's
+balances and lines). The SHA-256 of that data, plus ``RENDER_VERSION``, is both the cache file name and
+the ``ETag``, so a client holding the current PDF gets a ``304`` without any rendering, and unchanged
+documents are never rendered twice. Rendering runs in a process pool so API workers only wait on it;
+concurrent requests for the same document share one render.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from fastapi import Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.db.session import SessionLocal
+from backend.app.models.client import Invoice
+from backend.app.models.customer import Customer
+from backend.app.models.order import Order, OrderItem
+from backend.app.models.product import Product
+from backend.app.services.catalog_cache import etag_matches
+from backend.app.services.customer_statements import full_statement, run_balance_snapshots
+from backend.app.services.pdf_writer import render_pdf
+
+logger = logging.getLogger(__name__)
+
+RENDER_VERSION = 1
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def content_hash(data: dict) -> str:
+    payload = json.dumps({'version': RENDER_VERSION, 'data': data}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class PdfRenderer:
+    """Content-addressed PDF files on disk, filled by a lazily started process pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._pending: dict[str, Future] = {}
+
+    def path(self, digest: str) -> str:
+        return os.path.join(settings.pdf_cache_dir, f'{digest}.pdf')
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawned workers only import the stdlib-only writer, and never inherit the API's threads.
+            self._pool = ProcessPoolExecutor(
+                max_workers=settings.pdf_render_workers, mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._pool
+
+    def _store(self, digest: str, rendered: Future, stored: Future) -> None:
+        try:
+            os.makedirs(settings.pdf_cache_dir, exist_ok=True)
+            temporary = f'{self.path(digest)}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(temporary, 'wb') as handle:
+                handle.write(rendered.result())
+            os.replace(temporary, self.path(digest))
+        except Exception as exc:
+            logger.exception('rendering pdf %s failed', digest)
+            stored.set_exception(exc)
+        else:
+            stored.set_result(self.path(digest))
+        finally:
+            with self._lock:
+                self._pending.pop(digest, None)
+
+    def submit(self, digest: str, title: str, lines: list[str]) -> Future | None:
+        """Queue a render unless the file exists; concurrent callers share the in-flight future."""
+        if os.path.exists(self.path(digest)):
+            return None
+        with self._lock:
+            stored = self._pending.get(digest)
+            if stored is not None:
+                return stored
+            stored = self._pending[digest] = Future()
+            rendered = self._executor().submit(render_pdf, title, lines)
+        # Outside the lock: the callback takes it and runs inline if the render has already finished.
+        rendered.add_done_callback(lambda done: self._store(digest, done, stored))
+        return stored
+
+    def ensure(self, digest: str, title: str, lines: list[str]) -> str:
+        future = self.submit(digest, title, lines)
+        if future is not None:
+            future.result(timeout=settings.pdf_render_timeout_seconds)
+        return self.path(digest)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+pdf_renderer = PdfRenderer()
+
+
+def _iter_file(path: str) -> Iterator[bytes]:
+    with open(path, 'rb') as handle:
+        while chunk := handle.read(STREAM_CHUNK_SIZE):
+            yield chunk
+
+
+def pdf_response(data: dict, title: str, lines: list[str], file_name: str, if_none_match: str | None) -> Response:
+    digest = content_hash(data)
+    etag = f'"{digest}"'
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    path = pdf_renderer.ensure(digest, title, lines)
+    headers['Content-Disposition'] = f'attachment; filename="{file_name}"'
+    headers['Content-Length'] = str(os.path.getsize(path))
+    return StreamingResponse(_iter_file(path), media_type='application/pdf', headers=headers)
+
+
+def _money(value) -> str:
+    return f'{Decimal(value or 0):,.2f}'
+
+
+def invoice_document(db: Session, invoice: Invoice) -> tuple[dict, str, list[str]]:
+    customer = db.get(Customer, invoice.customer_id)
+    items = (
+        db.query(Order.order_number, Product.name, OrderItem.quantity, OrderItem.unit_price, OrderItem.line_total)
+        .join(OrderItem, OrderItem.order_id == Order.id)
+        .join(Product, Product.id == OrderItem.product_id)
+        .filter(or_(Order.invoice_id == invoice.id, Order.id == invoice.order_id))
+        .order_by(Order.id.asc(), OrderItem.id.asc())
+        .all()
+    )
+    data = {
+        'invoice_number': invoice.invoice_number,
+        'customer': customer.full_name if customer else None,
+        'issue_date': invoice.issue_date,
+        'due_date': invoice.due_date,
+        'total_amount': _money(invoice.total_amount),
+        'paid_amount': _money(invoice.paid_amount),
+        'status': invoice.status,
+        'items': [[order_number, name, str(quantity), _money(price), _money(total)] for order_number, name, quantity, price, total in items],
+    }
+    lines = [
+        f"Bill to: {data['customer'] or '-'}",
+        f"Issued: {invoice.issue_date}    Due: {invoice.due_date}    Status: {invoice.status}",
+        '',
+        f"{'Order':<14}{'Item':<30}{'Qty':>8}{'Price':>12}{'Total':>12}",
+    ]
+    lines += [f'{order:<14}{name[:29]:<30}{qty:>8}{price:>12}{total:>12}' for order, name, qty, price, total in data['items']]
+    lines += ['', f"{'Total':<64}{data['total_amount']:>12}", f"{'Paid':<64}{data['paid_amount']:>12}"]
+    return data, f'Invoice {invoice.invoice_number}', lines
+
+
+def statement_document(statement: dict) -> tuple[dict, str, list[str]]:
+    data = {key: value for key, value in statement.items() if key not in ('generated_at', 'limit', 'offset')}
+    period = f"{statement['period_start'] or 'beginning'} to {statement['period_end']}"
+    lines = [
+        f'Period: {period}',
+        f"Opening balance: {_money(statement['opening_balance'])}",
+        '',
+        f"{'Date':<12}{'Type':<10}{'Reference':<20}{'Debit':>12}{'Credit':>12}{'Balance':>12}",
+    ]
+    lines += [
+        f"{line['date']:<12}{line['type']:<10}{(line['reference'] or '')[:19]:<20}"
+        f"{_money(line['debit']):>12}{_money(line['credit']):>12}{_money(line['balance']):>12}"
+        for line in statement['lines']
+    ]
+    lines += ['', f"Closing balance: {_money(statement['closing_balance'])}"]
+    return data, f"Statement for customer {statement['customer_id']}", lines
+
+
+def pregenerate_month_end_statements(db: Session, month_end: date | None = None) -> int:
+    """Queue every customer's statement for the month ending ``month_end`` and wait for the batch."""
+    month_end = month_end or datetime.utcnow().date().replace(day=1) - timedelta(days=1)
+    month_start = month_end.replace(day=1)
+    futures = []
+    customer_ids = db.query(Customer.id).order_by(Customer.id.asc()).all()
+    for (customer_id,) in customer_ids:
+        data, title, lines = statement_document(full_statement(db, customer_id, month_start, month_end))
+        future = pdf_renderer.submit(content_hash(data), title, lines)
+        if future is not None:
+            futures.append(future)
+    wait(futures, timeout=settings.pdf_render_timeout_seconds * max(len(futures), 1))
+    return len(customer_ids)
+
+
+def run_month_end_statements(month_end: date | None = None) -> None:
+    db = SessionLocal()
+    try:
+        generated = pregenerate_month_end_statements(db, month_end)
+        logger.info('pre-generated %s month-end statements', generated)
+    finally:
+        db.close()
+
+
+def run_month_end_close() -> None:
+    """Snapshot balances at the last month end and pre-generate that month's statements, once a month."""
+    month_end = run_balance_snapshots()
+    if month_end is not None:
+        run_month_end_statements(month_end)
@@ -0,0 +1,38 @@
+"""Dependency-free text PDF writer; kept to the stdlib so render workers start quickly."""
+
+LINES_PER_PAGE = 48
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def render_pdf(title: str, lines: list[str]) -> bytes:
+    """Lay out ``lines`` of monospaced text under ``title`` as a minimal multi-page PDF."""
+    pages = [lines[start : start + LINES_PER_PAGE] for start in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', b'', b'<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>']
+    page_ids = []
+    for number, page_lines in enumerate(pages, start=1):
+        text = [f'BT /F1 14 Tf 50 800 Td ({_escape(title)}) Tj ET', 'BT /F1 9 Tf 11 TL 50 775 Td']
+        text += [f'({_escape(line)}) \'' for line in page_lines]
+        text += ['ET', f'BT /F1 8 Tf 50 30 Td (Page {number} of {len(pages)}) Tj ET']
+        stream = '\n'.join(text).encode('latin-1', errors='replace')
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>'
+            % (len(objects))
+        )
+        page_ids.append(len(objects))
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects[1] = f'<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>'.encode()
+
+    body = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for object_id, content in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += b'%d 0 obj\n%s\nendobj\n' % (object_id, content)
+    xref = len(body)
+    body += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    body += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    body += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(body)
@@ -0,0 +1,132 @@
+"""Frequently-bought-together associations mined from order baskets.
+
+A basket is the set of distinct products on one confirmed or fulfilled order. The rebuild computes the
+product co-occurrence counts (the sparse ``Xᵀ·X`` of the basket/product incidence matrix) as a self-join
+inside the database, scores each pair by confidence ``P(B|A)`` and lift ``P(B|A) / P(B)``, and keeps the
+top ``top_n`` associations per product with one ``INSERT ... SELECT``. Readers hit the primary key.
+"""
+
+import logging
+from datetime import datetime
+
+from sqlalchemy import Float, and_, cast, delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.db.session import SessionLocal
+from backend.app.models.order import Order, OrderItem
+from backend.app.models.product import Product
+from backend.app.models.product_association import ProductAssociation
+
+logger = logging.getLogger(__name__)
+
+BASKET_STATUSES = ('confirmed', 'fulfilled')
+
+
+def rebuild_product_associations(
+    db: Session,
+    top_n: int | None = None,
+    min_pair_count: int | None = None,
+    max_basket_size: int | None = None,
+) -> int:
+    """Replace every stored association; the caller commits. Returns the number of rows written."""
+    top_n = top_n or settings.product_associations_top_n
+    min_pair_count = min_pair_count or settings.product_associations_min_pair_count
+    max_basket_size = max_basket_size or settings.product_associations_max_basket_size
+
+    baskets = (
+        select(OrderItem.order_id, OrderItem.product_id)
+        .join(Order, Order.id == OrderItem.order_id)
+        .where(Order.status.in_(BASKET_STATUSES))
+        .distinct()
+        .cte('baskets')
+    )
+    total_baskets = db.scalar(select(func.count(func.distinct(baskets.c.order_id))))
+    if not total_baskets:
+        db.execute(delete(ProductAssociation))
+        return 0
+
+    support = (
+        select(baskets.c.product_id, func.count().label('orders')).group_by(baskets.c.product_id).cte('support')
+    )
+    # Pairs grow with the square of the basket size, so bulk/wholesale orders are left out of the pair counts.
+    sizes = select(baskets.c.order_id).group_by(baskets.c.order_id).having(
+        func.count().between(2, max_basket_size)
+    ).cte('pair_baskets')
+    eligible = (
+        select(baskets.c.order_id, baskets.c.product_id)
+        .join(sizes, sizes.c.order_id == baskets.c.order_id)
+        .cte('eligible')
+    )
+    left, right = eligible.alias('a'), eligible.alias('b')
+    pairs = (
+        select(
+            left.c.product_id.label('product_id'),
+            right.c.product_id.label('associated_product_id'),
+            func.count().label('pair_count'),
+        )
+        .select_from(left.join(right, and_(left.c.order_id == right.c.order_id, left.c.product_id != right.c.product_id)))
+        .group_by(left.c.product_id, right.c.product_id)
+        .having(func.count() >= min_pair_count)
+        .cte('pairs')
+    )
+    antecedent, consequent = support.alias('sa'), support.alias('sb')
+    confidence = cast(pairs.c.pair_count, Float) / antecedent.c.orders
+    lift = confidence * total_baskets / consequent.c.orders
+    scored = (
+        select(
+            pairs.c.product_id,
+            pairs.c.associated_product_id,
+            pairs.c.pair_count,
+            confidence.label('confidence'),
+            lift.label('lift'),
+            func.row_number()
+            .over(
+                partition_by=pairs.c.product_id,
+                order_by=(lift.desc(), pairs.c.pair_count.desc(), pairs.c.associated_product_id.asc()),
+            )
+            .label('rank'),
+        )
+        .join(antecedent, antecedent.c.product_id == pairs.c.product_id)
+        .join(consequent, consequent.c.product_id == pairs.c.associated_product_id)
+        .subquery('scored')
+    )
+    source = select(
+        scored.c.product_id,
+        scored.c.associated_product_id,
+        scored.c.rank,
+        scored.c.pair_count,
+        scored.c.confidence,
+        scored.c.lift,
+        literal(datetime.utcnow()),
+    ).where(scored.c.rank <= top_n)
+
+    db.execute(delete(ProductAssociation))
+    db.execute(
+        insert(ProductAssociation).from_select(
+            ['product_id', 'associated_product_id', 'rank', 'pair_count', 'confidence', 'lift', 'updated_at'],
+            source,
+        )
+    )
+    return db.scalar(select(func.count()).select_from(ProductAssociation))
+
+
+def run_product_associations() -> None:
+    db = SessionLocal()
+    try:
+        written = rebuild_product_associations(db)
+        db.commit()
+        logger.info('rebuilt %s product associations', written)
+    finally:
+        db.close()
+
+
+def frequently_bought_together(db: Session, product_id: int, limit: int = 5) -> list[tuple[ProductAssociation, Product]]:
+    return (
+        db.query(ProductAssociation, Product)
+        .join(Product, Product.id == ProductAssociation.associated_product_id)
+        .filter(ProductAssociation.product_id == product_id, Product.is_active.is_(True))
+        .order_by(ProductAssociation.rank.asc())
+        .limit(limit)
+        .all()
+    )
@@ -0,0 +1,143 @@
+import csv
+import io
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from backend.app.db.dialect import upsert_insert
+from backend.app.db.session import SessionLocal
+from backend.app.models.product import Product
+from backend.app.models.product_import_job import ProductImportJob
+from backend.app.schemas.product import ProductCreate
+from backend.app.services.catalog_cache import catalog_cache
+
+CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+UPDATABLE_COLUMNS = ('name', 'category', 'description', 'unit_cost', 'unit_price', 'is_active')
+
+
+@dataclass
+class ProductImportResult:
+    total_rows: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def fail(self, row_number: int, sku: str | None, detail: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row_number, 'sku': sku, 'detail': detail})
+
+
+def parse_product_rows(content_type: str | None, body: bytes) -> list[dict]:
+    if content_type and 'csv' in content_type:
+        reader = csv.DictReader(io.StringIO(body.decode('utf-8-sig')))
+        return [{key.strip(): value for key, value in row.items() if key and value not in ('', None)} for row in reader]
+
+    try:
+        payload = json.loads(body or b'[]')
+    except json.JSONDecodeError as exc:
+        raise HTTPException(status_code=400, detail='Body must be a JSON array or CSV') from exc
+    if isinstance(payload, dict):
+        payload = payload.get('products', [])
+    if not isinstance(payload, list) or not all(isinstance(row, dict) for row in payload):
+        raise HTTPException(status_code=400, detail='Body must be a JSON array of products')
+    return payload
+
+
+def _upsert_chunk(db: Session, client_id: str, rows: list[tuple[int, dict]], result: ProductImportResult) -> None:
+    products: dict[str, tuple[int, ProductCreate]] = {}
+    for row_number, row in rows:
+        try:
+            product = ProductCreate.model_validate(row)
+        except ValidationError as exc:
+            result.fail(row_number, row.get('sku'), exc.errors()[0]['msg'])
+            continue
+        # A single INSERT ... ON CONFLICT cannot touch the same row twice, so the last duplicate wins.
+        products[product.sku] = (row_number, product)
+    if not products:
+        return
+
+    owners = dict(db.query(Product.sku, Product.client_id).filter(Product.sku.in_(products.keys())).all())
+    values = []
+    for sku, (row_number, product) in products.items():
+        owner = owners.get(sku)
+        if owner is not None and owner != client_id:
+            result.fail(row_number, sku, 'SKU belongs to another client')
+            continue
+        if owner is None:
+            result.created += 1
+        else:
+            result.updated += 1
+        values.append({**product.model_dump(), 'client_id': client_id, 'created_at': datetime.utcnow()})
+    if not values:
+        return
+
+    stmt = upsert_insert(db, Product).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Product.sku],
+        set_={column: stmt.excluded[column] for column in UPDATABLE_COLUMNS},
+        where=Product.client_id == stmt.excluded.client_id,
+    )
+    db.execute(stmt)
+
+
+def upsert_products(
+    db: Session,
+    client_id: str,
+    rows: list[dict],
+    chunk_size: int = CHUNK_SIZE,
+    on_progress: Callable[[int, ProductImportResult], None] | None = None,
+) -> ProductImportResult:
+    result = ProductImportResult(total_rows=len(rows))
+    numbered = list(enumerate(rows, start=1))
+    for start in range(0, len(numbered), chunk_size):
+        _upsert_chunk(db, client_id, numbered[start : start + chunk_size], result)
+        catalog_cache.bump(db, client_id)
+        db.commit()
+        if on_progress:
+            on_progress(min(start + chunk_size, len(numbered)), result)
+    return result
+
+
+def create_import_job(db: Session, client_id: str, total_rows: int) -> ProductImportJob:
+    job = ProductImportJob(id=str(uuid4()), client_id=client_id, status='queued', total_rows=total_rows)
+    db.add(job)
+    db.commit()
+    return job
+
+
+def run_import_job(job_id: str, client_id: str, rows: list[dict]) -> None:
+    db = SessionLocal()
+    try:
+        job = db.query(ProductImportJob).filter(ProductImportJob.id == job_id).one()
+        job.status = 'running'
+        db.commit()
+
+        def record_progress(processed: int, result: ProductImportResult) -> None:
+            job.processed_rows = processed
+            job.created_count = result.created
+            job.updated_count = result.updated
+            job.failed_count = result.failed
+            db.commit()
+
+        try:
+            result = upsert_products(db, client_id, rows, on_progress=record_progress)
+        except Exception as exc:
+            db.rollback()
+            job.status = 'failed'
+            job.errors_json = json.dumps([{'detail': str(exc)}])
+        else:
+            job.status = 'completed'
+            job.errors_json = json.dumps(result.errors)
+        job.finished_at = datetime.utcnow()
+        db.commit()
+    finally:
+        db.close()
@@ -0,0 +1,58 @@
+from sqlalchemy import case, func, literal, or_
+from sqlalchemy.orm import Session
+
+from backend.app.db.dialect import is_postgresql
+from backend.app.models.product import Product
+
+
+def _like_escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class ProductSearchService:
+    """Tenant-scoped catalog lookup ranked as: exact SKU, SKU/name prefix, then best substring/trigram match.
+
+    On Postgres the filters hit the ``pg_trgm`` GIN indexes from migration ``20261027_06``.
+    """
+
+    def search(self, db: Session, client_id: str, query: str, limit: int = 20, include_inactive: bool = False) -> list:
+        term = query.strip().lower()
+        if not term:
+            return []
+        prefix = f'{_like_escape(term)}%'
+        contains = f'%{_like_escape(term)}%'
+        name = func.lower(Product.name)
+        sku = func.lower(Product.sku)
+
+        matches = [
+            Product.name.ilike(contains, escape='\\'),
+            Product.sku.ilike(contains, escape='\\'),
+            Product.category.ilike(contains, escape='\\'),
+        ]
+        tier = case(
+            (sku == term, 0),
+            (sku.like(prefix, escape='\\'), 1),
+            (name.like(prefix, escape='\\'), 2),
+            else_=3,
+        )
+        if is_postgresql(db):
+            # ``%`` lets the trigram index also catch misspellings that a substring match misses.
+            matches.append(Product.name.op('%')(term))
+            score = func.greatest(
+                func.similarity(Product.name, term),
+                func.similarity(Product.sku, term),
+                func.similarity(Product.category, term),
+            )
+        else:
+            score = literal(0.0)
+
+        filters = [Product.client_id == client_id, or_(*matches)]
+        if not include_inactive:
+            filters.append(Product.is_active.is_(True))
+        return (
+            db.query(Product)
+            .filter(*filters)
+            .order_by(tier.asc(), score.desc(), func.length(Product.name).asc(), Product.id.asc())
+            .limit(limit)
+            .all()
+        )
@@ -0,0 +1,117 @@
+"""Returned units, refund value and return rate per product and per day.
+
+Returns are aggregated with one join across ``return_items``/``order_items`` (scoped to a tenant through
+the product) and set against the units sold in the same window from the ``sales_daily`` rollup, so the
+rate matches the dashboard's sales KPIs. Summaries share the rollup's short-lived ``summary_cache``.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import Date, cast, func
+from sqlalchemy.orm import Session
+
+from backend.app.db.dialect import is_postgresql
+from backend.app.models.order import OrderItem
+from backend.app.models.product import Product
+from backend.app.models.return_order import ReturnItem, ReturnOrder
+from backend.app.models.sales_daily import SalesDaily
+from backend.app.services.sales_rollup import ALL_CLIENTS, summary_cache
+
+
+def _money(value) -> Decimal:
+    return Decimal(value or 0).quantize(Decimal('0.01'))
+
+
+def _rate(returned: Decimal, sold: int) -> float:
+    return float(returned / sold * 100) if sold else 0.0
+
+
+def _as_date(value) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def _build_returns_summary(db: Session, client_id: str, days: int, today: date) -> dict:
+    window_start = today - timedelta(days=days - 1)
+    all_clients = client_id == ALL_CLIENTS
+    day = cast(ReturnOrder.created_at, Date) if is_postgresql(db) else func.date(ReturnOrder.created_at)
+    returned_rows = (
+        db.query(
+            OrderItem.product_id,
+            Product.name,
+            day,
+            func.sum(ReturnItem.quantity),
+            func.sum(ReturnItem.refund_amount),
+            func.count(func.distinct(ReturnOrder.id)),
+        )
+        .select_from(ReturnItem)
+        .join(OrderItem, OrderItem.id == ReturnItem.order_item_id)
+        .join(ReturnOrder, ReturnOrder.id == ReturnItem.return_id)
+        .join(Product, Product.id == OrderItem.product_id)
+        .filter(ReturnOrder.created_at >= datetime.combine(window_start, datetime.min.time()))
+        .filter(*([] if all_clients else [Product.client_id == client_id]))
+        .group_by(OrderItem.product_id, Product.name, day)
+        .all()
+    )
+    sold_rows = (
+        db.query(SalesDaily.product_id, SalesDaily.day, func.sum(SalesDaily.units))
+        .filter(SalesDaily.day >= window_start, SalesDaily.day <= today)
+        .filter(*([] if all_clients else [SalesDaily.client_id == client_id]))
+        .group_by(SalesDaily.product_id, SalesDaily.day)
+        .all()
+    )
+
+    products: dict[int, dict] = {}
+    periods: dict[date, dict] = {}
+
+    def product_bucket(product_id: int, name: str | None) -> dict:
+        return products.setdefault(
+            product_id,
+            {'product_id': product_id, 'product_name': name, 'returned_units': Decimal('0'), 'refund_value': Decimal('0'), 'units_sold': 0},
+        )
+
+    def period_bucket(bucket_day: date) -> dict:
+        return periods.setdefault(
+            bucket_day,
+            {'day': bucket_day, 'return_count': 0, 'returned_units': Decimal('0'), 'refund_value': Decimal('0'), 'units_sold': 0},
+        )
+
+    for product_id, name, return_day, units, refund, count in returned_rows:
+        for bucket in (product_bucket(product_id, name), period_bucket(_as_date(return_day))):
+            bucket['returned_units'] += Decimal(units or 0)
+            bucket['refund_value'] += _money(refund)
+        periods[_as_date(return_day)]['return_count'] += int(count)
+    for product_id, sold_day, units in sold_rows:
+        if product_id in products:
+            products[product_id]['units_sold'] += int(units)
+        if _as_date(sold_day) in periods:
+            periods[_as_date(sold_day)]['units_sold'] += int(units)
+
+    returned_units = sum((bucket['returned_units'] for bucket in products.values()), Decimal('0'))
+    refund_value = sum((bucket['refund_value'] for bucket in products.values()), Decimal('0'))
+    units_sold = sum(int(units) for _, _, units in sold_rows)
+    for bucket in (*products.values(), *periods.values()):
+        bucket['return_rate'] = _rate(bucket['returned_units'], bucket['units_sold'])
+
+    return {
+        'client_id': client_id,
+        'window_start': window_start,
+        'window_end': today,
+        'generated_at': datetime.utcnow(),
+        'returned_units': returned_units,
+        'refund_value': refund_value,
+        'units_sold': units_sold,
+        'return_rate': _rate(returned_units, units_sold),
+        'products': sorted(products.values(), key=lambda bucket: (-bucket['returned_units'], bucket['product_id'])),
+        'periods': [periods[key] for key in sorted(periods)],
+    }
+
+
+def get_returns_summary(db: Session, client_id: str = ALL_CLIENTS, days: int = 30, today: date | None = None) -> dict:
+    today = today or datetime.utcnow().date()
+    key = ('returns', client_id, days, today)
+    summary = summary_cache.get(key)
+    if summary is None:
+        summary = _build_returns_summary(db, client_id, days, today)
+        summary_cache.set(key, summary)
+    return summary
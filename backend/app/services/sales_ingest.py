@@ -0,0 +1,198 @@
+"""Bulk ingestion of POS sales uploaded as CSV or NDJSON.
+
+Rows are validated in memory, products and tenants are resolved with one lookup, and the surviving rows
+are merged into ``sales`` with ``ON CONFLICT (client_id, external_id) DO NOTHING`` so a terminal can
+re-upload a day without double counting. On PostgreSQL the rows are streamed into a temporary staging
+table with ``COPY`` first; other dialects insert in chunks. Inserted sales reach stock, the outbox and
+the daily rollup in the same transaction, in bulk.
+"""
+
+import csv
+import io
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from fastapi import HTTPException
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Session
+
+from backend.app.db.dialect import is_postgresql, upsert_insert
+from backend.app.models.product import Product
+from backend.app.models.sale import Sale
+from backend.app.services.sales_posting import record_sale_events
+from backend.app.services.sales_rollup import add_sales_to_rollup
+from backend.app.services.stock_reservation import deduct_stock
+
+CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+SALE_COLUMNS = ('client_id', 'external_id', 'product_id', 'qty', 'selling_price', 'sale_date')
+
+
+class SaleIngestRow(BaseModel):
+    client_id: str = Field(min_length=1, max_length=100)
+    external_id: str = Field(min_length=1, max_length=100)
+    product_id: int | None = None
+    sku: str | None = None
+    qty: int = Field(gt=0)
+    selling_price: Decimal = Field(ge=0, max_digits=12, decimal_places=2)
+    sale_date: datetime | None = None
+
+    @field_validator('sale_date')
+    @classmethod
+    def as_naive_utc(cls, value: datetime | None) -> datetime | None:
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    @model_validator(mode='after')
+    def needs_product(self):
+        if self.product_id is None and not self.sku:
+            raise ValueError('product_id or sku is required')
+        return self
+
+
+@dataclass
+class SalesIngestResult:
+    total_rows: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def fail(self, row_number: int, external_id: str | None, detail: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row_number, 'external_id': external_id, 'detail': detail})
+
+
+def parse_sales_rows(content_type: str | None, body: bytes) -> list[dict]:
+    text_body = body.decode('utf-8-sig')
+    if content_type and 'csv' in content_type:
+        reader = csv.DictReader(io.StringIO(text_body))
+        return [{key.strip(): value for key, value in row.items() if key and value not in ('', None)} for row in reader]
+
+    rows = []
+    for line_number, line in enumerate(text_body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise HTTPException(status_code=400, detail=f'Line {line_number} is not valid JSON') from exc
+        if not isinstance(row, dict):
+            raise HTTPException(status_code=400, detail=f'Line {line_number} must be a JSON object')
+        rows.append(row)
+    return rows
+
+
+def _copy_merge(db: Session, rows: list[dict]) -> list:
+    db.execute(
+        text(
+            'CREATE TEMP TABLE IF NOT EXISTS sales_staging ('
+            'client_id varchar(100), external_id varchar(100), product_id integer, qty integer, '
+            'selling_price numeric(12, 2), sale_date timestamp) ON COMMIT DROP'
+        )
+    )
+    db.execute(text('TRUNCATE sales_staging'))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([row[column] for column in SALE_COLUMNS])
+    buffer.seek(0)
+    cursor = db.connection().connection.driver_connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY sales_staging ({', '.join(SALE_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+    return db.execute(
+        text(
+            f"INSERT INTO sales ({', '.join(SALE_COLUMNS)}, created_at) "
+            f"SELECT {', '.join(SALE_COLUMNS)}, now() FROM sales_staging "
+            'ON CONFLICT (client_id, external_id) DO NOTHING '
+            'RETURNING id, client_id, external_id, product_id, qty, selling_price, sale_date'
+        )
+    ).all()
+
+
+def _insert_merge(db: Session, rows: list[dict]) -> list:
+    inserted = []
+    now = datetime.utcnow()
+    for start in range(0, len(rows), CHUNK_SIZE):
+        stmt = (
+            upsert_insert(db, Sale)
+            .values([{**row, 'created_at': now} for row in rows[start : start + CHUNK_SIZE]])
+            .on_conflict_do_nothing(index_elements=[Sale.client_id, Sale.external_id])
+            .returning(
+                Sale.id, Sale.client_id, Sale.external_id, Sale.product_id, Sale.qty, Sale.selling_price, Sale.sale_date
+            )
+        )
+        inserted.extend(db.execute(stmt).all())
+    return inserted
+
+
+def ingest_sales(db: Session, rows: list[dict]) -> SalesIngestResult:
+    """Validate and merge one upload in a single transaction; the caller commits."""
+    result = SalesIngestResult(total_rows=len(rows))
+    sales: dict[tuple[str, str], tuple[int, SaleIngestRow]] = {}
+    for row_number, row in enumerate(rows, start=1):
+        try:
+            sale = SaleIngestRow.model_validate(row)
+        except ValidationError as exc:
+            result.fail(row_number, row.get('external_id'), exc.errors()[0]['msg'])
+            continue
+        key = (sale.client_id, sale.external_id)
+        if key in sales:
+            result.duplicates += 1
+            continue
+        sales[key] = (row_number, sale)
+    if not sales:
+        return result
+
+    product_ids = {sale.product_id for _, sale in sales.values() if sale.product_id is not None}
+    skus = {sale.sku for _, sale in sales.values() if sale.product_id is None}
+    products = (
+        db.query(Product.id, Product.sku, Product.client_id, Product.unit_cost)
+        .filter(or_(Product.id.in_(product_ids), Product.sku.in_(skus)))
+        .all()
+    )
+    by_id = {product.id: product for product in products}
+    by_sku = {product.sku: product for product in products}
+
+    now = datetime.utcnow()
+    staged = []
+    for row_number, sale in sales.values():
+        product = by_id.get(sale.product_id) if sale.product_id is not None else by_sku.get(sale.sku)
+        if product is None or product.client_id != sale.client_id:
+            result.fail(row_number, sale.external_id, 'Product not found for client')
+            continue
+        staged.append(
+            {
+                'client_id': sale.client_id,
+                'external_id': sale.external_id,
+                'product_id': product.id,
+                'qty': sale.qty,
+                'selling_price': sale.selling_price,
+                'sale_date': sale.sale_date or now,
+            }
+        )
+    if not staged:
+        return result
+
+    inserted = _copy_merge(db, staged) if is_postgresql(db) else _insert_merge(db, staged)
+    result.inserted = len(inserted)
+    result.duplicates += len(staged) - len(inserted)
+    if not inserted:
+        return result
+
+    quantities: dict[int, Decimal] = defaultdict(Decimal)
+    for sale in inserted:
+        quantities[sale.product_id] += sale.qty
+    unit_costs = {product.id: product.unit_cost for product in products}
+    deduct_stock(db, quantities)
+    record_sale_events(db, inserted, unit_costs)
+    add_sales_to_rollup(db, inserted, unit_costs)
+    return result
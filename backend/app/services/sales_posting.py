@@ -0,0 +1,255 @@
+"""Post recorded sales to the stock ledger and general ledger from the transactional outbox.
+
+``record_sale_event`` is called in the sale's own transaction. The posting worker later claims pending
+events in batches and writes one ``out`` stock movement per sale plus one aggregated revenue entry and
+one aggregated COGS entry per sale date, so the request path stays a couple of inserts long.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.db.session import SessionLocal
+from backend.app.models.outbox import OutboxEvent
+from backend.app.models.sale import Sale
+from backend.app.models.stock_movement import StockMovement
+from backend.app.services.finance_service import (
+    ACCOUNT_CODES,
+    _get_account_by_code,
+    create_balanced_journal_entry,
+    ensure_default_chart_of_accounts,
+)
+
+logger = logging.getLogger(__name__)
+
+SALE_RECORDED = 'sale.recorded'
+MAX_ATTEMPTS = 5
+
+
+class PostingStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.events = 0
+        self.last_batch_size = 0
+        self.last_batch_seconds = 0.0
+        self.last_posted_at: datetime | None = None
+
+    def record(self, size: int, seconds: float) -> None:
+        with self._lock:
+            self.batches += 1
+            self.events += size
+            self.last_batch_size = size
+            self.last_batch_seconds = seconds
+            self.last_posted_at = datetime.utcnow()
+
+
+posting_stats = PostingStats()
+
+
+def _sale_payload(sale, unit_cost: Decimal) -> str:
+    return json.dumps(
+        {
+            'sale_id': sale.id,
+            'client_id': sale.client_id,
+            'product_id': sale.product_id,
+            'qty': sale.qty,
+            'selling_price': str(sale.selling_price),
+            'unit_cost': str(unit_cost),
+            'sale_date': sale.sale_date.date().isoformat(),
+        }
+    )
+
+
+def record_sale_event(db: Session, sale: Sale, unit_cost: Decimal) -> None:
+    db.add(OutboxEvent(topic=SALE_RECORDED, payload_json=_sale_payload(sale, unit_cost)))
+
+
+def record_sale_events(db: Session, sales: list, unit_costs: dict[int, Decimal]) -> None:
+    """Queue many inserted sales (rows with the ``Sale`` columns) with one multi-row insert."""
+    if sales:
+        db.execute(
+            insert(OutboxEvent),
+            [
+                {'topic': SALE_RECORDED, 'payload_json': _sale_payload(sale, unit_costs[sale.product_id])}
+                for sale in sales
+            ],
+        )
+
+
+def _post(db: Session, events: list[OutboxEvent]) -> None:
+    sales = [json.loads(event.payload_json) for event in events]
+    db.execute(
+        insert(StockMovement),
+        [
+            {
+                'product_id': sale['product_id'],
+                'movement_type': 'out',
+                'quantity': sale['qty'],
+                'reason': 'sale',
+                'reference_type': 'sale',
+                'reference_id': str(sale['sale_id']),
+            }
+            for sale in sales
+        ],
+    )
+
+    revenue_by_date: dict[str, Decimal] = defaultdict(Decimal)
+    cost_by_date: dict[str, Decimal] = defaultdict(Decimal)
+    for sale in sales:
+        revenue_by_date[sale['sale_date']] += (Decimal(sale['selling_price']) * sale['qty']).quantize(Decimal('0.01'))
+        cost_by_date[sale['sale_date']] += (Decimal(sale['unit_cost']) * sale['qty']).quantize(Decimal('0.01'))
+
+    ensure_default_chart_of_accounts(db)
+    cash = _get_account_by_code(db, ACCOUNT_CODES['cash'])
+    revenue = _get_account_by_code(db, ACCOUNT_CODES['revenue'])
+    cogs = _get_account_by_code(db, ACCOUNT_CODES['cogs'])
+    inventory = _get_account_by_code(db, ACCOUNT_CODES['inventory'])
+    reference_id = f'{events[0].id}-{events[-1].id}'
+    for sale_date in sorted(revenue_by_date):
+        entry_date = date.fromisoformat(sale_date)
+        count = sum(1 for sale in sales if sale['sale_date'] == sale_date)
+        create_balanced_journal_entry(
+            db,
+            entry_date=entry_date,
+            description=f'Sales revenue ({count} sales)',
+            reference_type='sales_batch',
+            reference_id=reference_id,
+            created_by=None,
+            lines=[
+                {'account_id': cash.id, 'debit': revenue_by_date[sale_date], 'credit': Decimal('0')},
+                {'account_id': revenue.id, 'debit': Decimal('0'), 'credit': revenue_by_date[sale_date]},
+            ],
+        )
+        if cost_by_date[sale_date]:
+            create_balanced_journal_entry(
+                db,
+                entry_date=entry_date,
+                description=f'Cost of goods sold ({count} sales)',
+                reference_type='sales_batch',
+                reference_id=reference_id,
+                created_by=None,
+                lines=[
+                    {'account_id': cogs.id, 'debit': cost_by_date[sale_date], 'credit': Decimal('0')},
+                    {'account_id': inventory.id, 'debit': Decimal('0'), 'credit': cost_by_date[sale_date]},
+                ],
+            )
+
+    db.execute(
+        update(OutboxEvent)
+        .where(OutboxEvent.id.in_([event.id for event in events]))
+        .values(processed_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _claim(db: Session, limit: int) -> list[OutboxEvent]:
+    return (
+        db.query(OutboxEvent)
+        .filter(
+            OutboxEvent.topic == SALE_RECORDED,
+            OutboxEvent.processed_at.is_(None),
+            OutboxEvent.attempts < MAX_ATTEMPTS,
+        )
+        .order_by(OutboxEvent.id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+
+def _post_one(db: Session, event_id: int) -> int:
+    event = (
+        db.query(OutboxEvent)
+        .filter(OutboxEvent.id == event_id, OutboxEvent.processed_at.is_(None))
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+    if event is None:
+        db.rollback()
+        return 0
+    try:
+        _post(db, [event])
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        logger.exception('posting sale event %s failed', event_id)
+        db.query(OutboxEvent).filter(OutboxEvent.id == event_id).update(
+            {OutboxEvent.attempts: OutboxEvent.attempts + 1, OutboxEvent.last_error: str(exc)[:1000]},
+            synchronize_session=False,
+        )
+        db.commit()
+        return 0
+    return 1
+
+
+def post_pending_sales(db: Session, limit: int | None = None) -> int:
+    """Post one batch of pending sale events and return how many were posted."""
+    started = time.perf_counter()
+    events = _claim(db, limit or settings.sales_posting_batch_size)
+    if not events:
+        db.rollback()
+        return 0
+    event_ids = [event.id for event in events]
+    try:
+        _post(db, events)
+        db.commit()
+        posted = len(event_ids)
+    except Exception:
+        db.rollback()
+        # Post one by one so a single bad event cannot hold back the rest of the batch.
+        posted = sum(_post_one(db, event_id) for event_id in event_ids)
+    posting_stats.record(posted, time.perf_counter() - started)
+    return posted
+
+
+def run_sales_posting() -> None:
+    db = SessionLocal()
+    try:
+        while post_pending_sales(db):
+            pass
+    finally:
+        db.close()
+
+
+def sales_posting_metrics(db: Session) -> dict:
+    now = datetime.utcnow()
+    pending, oldest = (
+        db.query(func.count(OutboxEvent.id), func.min(OutboxEvent.created_at))
+        .filter(OutboxEvent.topic == SALE_RECORDED, OutboxEvent.processed_at.is_(None))
+        .one()
+    )
+    failed = (
+        db.query(func.count(OutboxEvent.id))
+        .filter(
+            OutboxEvent.topic == SALE_RECORDED,
+            OutboxEvent.processed_at.is_(None),
+            OutboxEvent.attempts >= MAX_ATTEMPTS,
+        )
+        .scalar()
+    )
+    posted_last_minute = (
+        db.query(func.count(OutboxEvent.id))
+        .filter(OutboxEvent.topic == SALE_RECORDED, OutboxEvent.processed_at >= now - timedelta(minutes=1))
+        .scalar()
+    )
+    return {
+        'pending_events': pending,
+        'failed_events': failed,
+        'lag_seconds': (now - oldest).total_seconds() if oldest else 0.0,
+        'posted_last_minute': posted_last_minute,
+        'events_per_second': posted_last_minute / 60,
+        'worker_batches': posting_stats.batches,
+        'worker_events': posting_stats.events,
+        'last_batch_size': posting_stats.last_batch_size,
+        'last_batch_seconds': posting_stats.last_batch_seconds,
+        'last_posted_at': posting_stats.last_posted_at,
+    }
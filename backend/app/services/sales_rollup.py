@@ -0,0 +1,207 @@
+"""``sales_daily`` rollup by (client_id, day, product_id) and the KPI summary served from it.
+
+Sales add themselves to the rollup in their own transaction, so the rollup is always consistent with
+``sales``; ``rebuild_sales_daily`` recomputes it from scratch (cost at the product's current unit cost).
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import Date, case, cast, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.core.ttl_cache import TTLCache
+from backend.app.db.dialect import is_postgresql, upsert_insert
+from backend.app.models.product import Product
+from backend.app.models.sale import Sale
+from backend.app.models.sales_daily import SalesDaily
+
+ALL_CLIENTS = '__all__'
+
+summary_cache = TTLCache(maxsize=1024, ttl_seconds=settings.sales_summary_ttl_seconds)
+
+
+def add_sales_to_rollup(db: Session, sales: list, unit_costs: dict[int, Decimal]) -> None:
+    """Fold sales (``Sale`` objects or rows with its columns) into the rollup with one upsert per chunk."""
+    now = datetime.utcnow()
+    buckets: dict[tuple, dict] = {}
+    for sale in sales:
+        key = (sale.client_id, sale.sale_date.date(), sale.product_id)
+        bucket = buckets.setdefault(
+            key,
+            {
+                'client_id': key[0],
+                'day': key[1],
+                'product_id': key[2],
+                'sale_count': 0,
+                'units': 0,
+                'revenue': Decimal('0'),
+                'cost': Decimal('0'),
+                'updated_at': now,
+            },
+        )
+        bucket['sale_count'] += 1
+        bucket['units'] += sale.qty
+        bucket['revenue'] += (Decimal(str(sale.selling_price)) * sale.qty).quantize(Decimal('0.01'))
+        bucket['cost'] += (Decimal(unit_costs[sale.product_id]) * sale.qty).quantize(Decimal('0.01'))
+
+    # Rows are upserted in key order so concurrent uploads lock shared buckets in the same order.
+    values = [buckets[key] for key in sorted(buckets)]
+    for start in range(0, len(values), 1000):
+        stmt = upsert_insert(db, SalesDaily).values(values[start : start + 1000])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SalesDaily.client_id, SalesDaily.day, SalesDaily.product_id],
+            set_={
+                'sale_count': SalesDaily.sale_count + stmt.excluded.sale_count,
+                'units': SalesDaily.units + stmt.excluded.units,
+                'revenue': SalesDaily.revenue + stmt.excluded.revenue,
+                'cost': SalesDaily.cost + stmt.excluded.cost,
+                'updated_at': now,
+            },
+        )
+        db.execute(stmt)
+
+
+def add_sale_to_rollup(db: Session, sale: Sale, unit_cost: Decimal) -> None:
+    add_sales_to_rollup(db, [sale], {sale.product_id: unit_cost})
+
+
+def rebuild_sales_daily(db: Session, client_id: str | None = None) -> int:
+    """Recompute the rollup with one INSERT ... SELECT; the caller commits."""
+    day = cast(Sale.sale_date, Date) if is_postgresql(db) else func.date(Sale.sale_date)
+    source = (
+        select(
+            Sale.client_id,
+            day,
+            Sale.product_id,
+            func.count(Sale.id),
+            func.sum(Sale.qty),
+            func.sum(Sale.qty * Sale.selling_price),
+            func.sum(Sale.qty * Product.unit_cost),
+            func.now() if is_postgresql(db) else func.current_timestamp(),
+        )
+        .join(Product, Product.id == Sale.product_id)
+        .group_by(Sale.client_id, day, Sale.product_id)
+    )
+    purge = delete(SalesDaily)
+    if client_id is not None:
+        source = source.where(Sale.client_id == client_id)
+        purge = purge.where(SalesDaily.client_id == client_id)
+    db.execute(purge)
+    result = db.execute(
+        insert(SalesDaily).from_select(
+            ['client_id', 'day', 'product_id', 'sale_count', 'units', 'revenue', 'cost', 'updated_at'],
+            source,
+        )
+    )
+    summary_cache.clear()
+    return result.rowcount
+
+
+def _money(value) -> Decimal:
+    return Decimal(value or 0).quantize(Decimal('0.01'))
+
+
+def _build_summary(db: Session, client_id: str, days: int, today: date) -> dict:
+    week_start = today - timedelta(days=today.weekday())
+    month_start = today.replace(day=1)
+    window_start = today - timedelta(days=days - 1)
+    velocity_start = today - timedelta(days=29)
+    scope = [] if client_id == ALL_CLIENTS else [SalesDaily.client_id == client_id]
+
+    def since(start: date, column):
+        return func.coalesce(func.sum(case((SalesDaily.day >= start, column), else_=0)), 0)
+
+    totals = (
+        db.query(
+            since(today, SalesDaily.revenue),
+            since(week_start, SalesDaily.revenue),
+            since(week_start, SalesDaily.revenue - SalesDaily.cost),
+            since(month_start, SalesDaily.revenue),
+            since(month_start, SalesDaily.revenue - SalesDaily.cost),
+            func.coalesce(func.sum(SalesDaily.revenue), 0),
+            func.coalesce(func.sum(SalesDaily.cost), 0),
+            func.coalesce(func.sum(SalesDaily.units), 0),
+            func.coalesce(func.sum(SalesDaily.sale_count), 0),
+        )
+        .filter(*scope)
+        .one()
+    )
+    today_revenue, week_revenue, week_profit, mtd_revenue, month_profit, revenue, cost, units, sale_count = totals
+    gross_profit = _money(revenue) - _money(cost)
+
+    products = (
+        db.query(
+            SalesDaily.product_id,
+            Product.name,
+            func.sum(SalesDaily.units),
+            func.sum(SalesDaily.revenue),
+            func.sum(SalesDaily.cost),
+            since(velocity_start, SalesDaily.units),
+        )
+        .join(Product, Product.id == SalesDaily.product_id)
+        .filter(*scope)
+        .group_by(SalesDaily.product_id, Product.name)
+        .order_by(func.sum(SalesDaily.revenue).desc())
+        .all()
+    )
+    daily = (
+        db.query(
+            SalesDaily.day,
+            func.sum(SalesDaily.sale_count),
+            func.sum(SalesDaily.revenue),
+            func.sum(SalesDaily.revenue - SalesDaily.cost),
+        )
+        .filter(*scope, SalesDaily.day >= window_start)
+        .group_by(SalesDaily.day)
+        .order_by(SalesDaily.day.asc())
+        .all()
+    )
+
+    return {
+        'client_id': client_id,
+        'generated_at': datetime.utcnow(),
+        'kpis': {
+            'today_revenue': _money(today_revenue),
+            'week_revenue': _money(week_revenue),
+            'week_profit': _money(week_profit),
+            'mtd_revenue': _money(mtd_revenue),
+            'month_profit': _money(month_profit),
+            'gross_revenue': _money(revenue),
+            'gross_profit': gross_profit,
+            'gross_margin': float(gross_profit / _money(revenue) * 100) if revenue else 0.0,
+            'units_sold': int(units),
+            'sale_count': int(sale_count),
+        },
+        'products': [
+            {
+                'product_id': product_id,
+                'product_name': name,
+                'units': int(product_units),
+                'units_last_30_days': int(recent_units),
+                'revenue': _money(product_revenue),
+                'profit': _money(product_revenue) - _money(product_cost),
+            }
+            for product_id, name, product_units, product_revenue, product_cost, recent_units in products
+        ],
+        'daily': [
+            {
+                'day': day if isinstance(day, date) else date.fromisoformat(day),
+                'order_count': int(count),
+                'revenue': _money(day_revenue),
+                'profit': _money(day_profit),
+            }
+            for day, count, day_revenue, day_profit in daily
+        ],
+    }
+
+
+def get_sales_summary(db: Session, client_id: str, days: int = 30, today: date | None = None) -> dict:
+    today = today or datetime.utcnow().date()
+    key = (client_id, days, today)
+    summary = summary_cache.get(key)
+    if summary is None:
+        summary = _build_summary(db, client_id, days, today)
+        summary_cache.set(key, summary)
+    return summary
@@ -0,0 +1,228 @@
+"""Per-product stock levels and order reservations.
+
+Every path that changes ``inventory_levels`` locks the affected rows with ``SELECT ... FOR UPDATE`` in
+ascending ``product_id`` order, so concurrent checkouts touching overlapping products queue on the rows
+they share instead of deadlocking. Products without an ``inventory_levels`` row are not stock-tracked.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from fastapi import HTTPException
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.db.dialect import upsert_insert
+from backend.app.db.session import SessionLocal
+from backend.app.models.inventory import InventoryLevel, StockReservation
+from backend.app.models.order import Order, OrderItem
+from backend.app.models.stock_movement import StockMovement
+
+logger = logging.getLogger(__name__)
+
+MOVEMENT_SIGNS = {'in': 1, 'return_in': 1, 'out': -1, 'return_out': -1, 'adjustment': 1}
+
+
+def _lock_levels(db: Session, product_ids) -> dict[int, InventoryLevel]:
+    levels = (
+        db.query(InventoryLevel)
+        .filter(InventoryLevel.product_id.in_(sorted(set(product_ids))))
+        .order_by(InventoryLevel.product_id.asc())
+        .with_for_update()
+        .populate_existing()
+        .all()
+    )
+    return {level.product_id: level for level in levels}
+
+
+def apply_movement(db: Session, product_id: int, movement_type: str, quantity: Decimal) -> None:
+    """Fold a manual stock movement into the product's level, creating the level on first use."""
+    delta = Decimal(quantity) * MOVEMENT_SIGNS[movement_type]
+    now = datetime.utcnow()
+    stmt = upsert_insert(db, InventoryLevel).values(product_id=product_id, on_hand=delta, reserved=0, updated_at=now)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[InventoryLevel.product_id],
+        set_={'on_hand': InventoryLevel.on_hand + delta, 'updated_at': now},
+    )
+    db.execute(stmt)
+
+
+def take_stock(
+    db: Session,
+    quantities: dict[int, Decimal],
+    reference_type: str,
+    reference_id: str,
+    reason: str,
+    hold: bool = False,
+    record_movements: bool = True,
+) -> dict[int, Decimal]:
+    """Decrement ``on_hand`` for tracked products, raising 409 if any of them is short.
+
+    With ``hold`` the taken quantity is also counted in ``reserved`` until it is consumed or released.
+    Pass ``record_movements=False`` when the ``out`` movements are written later, e.g. by sales posting.
+    Returns the quantities that were taken from tracked products; on 409 the caller must roll back.
+    """
+    levels = _lock_levels(db, quantities)
+    shortages = [
+        {'product_id': product_id, 'requested': str(quantities[product_id]), 'available': str(level.on_hand)}
+        for product_id, level in levels.items()
+        if level.on_hand < quantities[product_id]
+    ]
+    if shortages:
+        raise HTTPException(status_code=409, detail={'message': 'Insufficient stock', 'shortages': shortages})
+
+    now = datetime.utcnow()
+    taken = {}
+    for product_id in levels:
+        quantity = quantities[product_id]
+        # Arithmetic stays in SQL and is guarded, so stock cannot go negative even where FOR UPDATE is a no-op.
+        values = {'on_hand': InventoryLevel.on_hand - quantity, 'updated_at': now}
+        if hold:
+            values['reserved'] = InventoryLevel.reserved + quantity
+        result = db.execute(
+            update(InventoryLevel)
+            .where(InventoryLevel.product_id == product_id, InventoryLevel.on_hand >= quantity)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise HTTPException(
+                status_code=409,
+                detail={'message': 'Insufficient stock', 'shortages': [{'product_id': product_id}]},
+            )
+        taken[product_id] = quantity
+    if not record_movements:
+        return taken
+    db.add_all(
+        StockMovement(
+            product_id=product_id,
+            movement_type='out',
+            quantity=quantity,
+            reason=reason,
+            reference_type=reference_type,
+            reference_id=reference_id,
+        )
+        for product_id, quantity in taken.items()
+    )
+    return taken
+
+
+def deduct_stock(db: Session, quantities: dict[int, Decimal]) -> None:
+    """Decrement ``on_hand`` for tracked products without a shortage check.
+
+    For sales that already happened elsewhere, such as offline POS uploads: a shortfall shows up as negative
+    stock in the levels report rather than rejecting a sale that cannot be undone.
+    """
+    levels = _lock_levels(db, quantities)
+    now = datetime.utcnow()
+    for product_id in levels:
+        db.execute(
+            update(InventoryLevel)
+            .where(InventoryLevel.product_id == product_id)
+            .values(on_hand=InventoryLevel.on_hand - quantities[product_id], updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def reserve_order_stock(db: Session, order: Order, ttl: timedelta | None = None) -> list[StockReservation]:
+    rows = (
+        db.query(OrderItem.product_id, func.sum(OrderItem.quantity))
+        .filter(OrderItem.order_id == order.id)
+        .group_by(OrderItem.product_id)
+        .all()
+    )
+    taken = take_stock(
+        db,
+        {product_id: Decimal(quantity) for product_id, quantity in rows},
+        reference_type='order',
+        reference_id=str(order.id),
+        reason='reserved at confirmation',
+        hold=True,
+    )
+    expires_at = datetime.utcnow() + (ttl or timedelta(minutes=settings.stock_reservation_ttl_minutes))
+    reservations = [
+        StockReservation(order_id=order.id, product_id=product_id, quantity=quantity, expires_at=expires_at)
+        for product_id, quantity in taken.items()
+    ]
+    db.add_all(reservations)
+    return reservations
+
+
+def _settle(db: Session, reservations: list[StockReservation], status: str) -> None:
+    _lock_levels(db, [reservation.product_id for reservation in reservations])
+    now = datetime.utcnow()
+    returned = []
+    for reservation in sorted(reservations, key=lambda reservation: reservation.product_id):
+        values = {'reserved': InventoryLevel.reserved - reservation.quantity, 'updated_at': now}
+        if status != 'consumed':
+            values['on_hand'] = InventoryLevel.on_hand + reservation.quantity
+            returned.append(reservation)
+        db.execute(
+            update(InventoryLevel)
+            .where(InventoryLevel.product_id == reservation.product_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        reservation.status = status
+    db.add_all(
+        StockMovement(
+            product_id=reservation.product_id,
+            movement_type='in',
+            quantity=reservation.quantity,
+            reason=f'reservation {status}',
+            reference_type='order',
+            reference_id=str(reservation.order_id),
+        )
+        for reservation in returned
+    )
+
+
+def _active_reservations(db: Session, order_id: int) -> list[StockReservation]:
+    return (
+        db.query(StockReservation)
+        .filter(StockReservation.order_id == order_id, StockReservation.status == 'active')
+        .order_by(StockReservation.product_id.asc())
+        .with_for_update()
+        .all()
+    )
+
+
+def consume_order_stock(db: Session, order_id: int) -> None:
+    _settle(db, _active_reservations(db, order_id), 'consumed')
+
+
+def release_order_stock(db: Session, order_id: int) -> None:
+    _settle(db, _active_reservations(db, order_id), 'released')
+
+
+def release_expired_reservations(db: Session, now: datetime | None = None, limit: int = 500) -> int:
+    """Return expired holds to stock and move their orders back to draft; the caller commits."""
+    cutoff = now or datetime.utcnow()
+    expired = (
+        db.query(StockReservation)
+        .filter(StockReservation.status == 'active', StockReservation.expires_at <= cutoff)
+        .order_by(StockReservation.id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not expired:
+        return 0
+    _settle(db, expired, 'expired')
+    order_ids = {reservation.order_id for reservation in expired}
+    db.query(Order).filter(Order.id.in_(order_ids), Order.status == 'confirmed').update(
+        {Order.status: 'draft'}, synchronize_session=False
+    )
+    return len(expired)
+
+
+def sweep_expired_reservations() -> None:
+    db = SessionLocal()
+    try:
+        while released := release_expired_reservations(db):
+            db.commit()
+            logger.info('released %s expired stock reservations', released)
+    finally:
+        db.close()
@@ -62,6 +62,9 @@ class WhatsAppService:
             'message_text': inbound_message['text'],
             'message_id': inbound_message['message_id'],
         }
+        for key in ('product_name', 'bundle_products', 'customer_segment'):
+            if inbound_message.get(key):
+                payload[key] = inbound_message[key]
         return self.orchestrator.route(payload)
 
     @staticmethod
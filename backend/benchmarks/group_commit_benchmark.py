@@ -0,0 +1,66 @@
+"""Sale insert throughput with one commit per sale versus the group-commit writer.
+
+    python -m backend.benchmarks.group_commit_benchmark --sales 2000 --workers 32 --window-ms 5
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import backend.app.db.base  # noqa: F401  (registers every model)
+from backend.app.api.ui_api import SaleCreateRequest, _record_sale
+from backend.app.core.config import settings
+from backend.app.models.product import Product
+from backend.app.services.group_commit import GroupCommitWriter
+
+
+def _measure(label: str, sales: int, workers: int, record_one) -> None:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda _: record_one(), range(sales)))
+    elapsed = time.perf_counter() - started
+    print(f'{label:>14}: {sales} sales in {elapsed:.2f}s ({sales / elapsed:.0f} sales/s)')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', default=settings.database_url)
+    parser.add_argument('--sales', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=32)
+    parser.add_argument('--window-ms', type=float, default=settings.group_commit_window_ms)
+    parser.add_argument('--max-batch', type=int, default=settings.group_commit_max_batch)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, pool_size=args.workers, max_overflow=0)
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    client_id = f'bench-{uuid4().hex[:8]}'
+    with Session() as db:
+        product = Product(sku=client_id, name='Bench product', client_id=client_id, unit_cost='1.00', unit_price='2.00')
+        db.add(product)
+        db.commit()
+        payload = SaleCreateRequest(client_id=client_id, product_id=product.id, qty=1, selling_price=2.0)
+
+    def commit_per_sale():
+        with Session() as db:
+            _record_sale(db, payload)
+            db.commit()
+
+    writer = GroupCommitWriter(Session, window_ms=args.window_ms, max_batch=args.max_batch)
+
+    def group_commit():
+        writer.submit(lambda db: _record_sale(db, payload)).result(timeout=60)
+
+    _measure('commit per sale', args.sales, args.workers, commit_per_sale)
+    try:
+        _measure('group commit', args.sales, args.workers, group_commit)
+    finally:
+        writer.stop()
+    print(f'group commit used {writer.batches} transactions ({writer.items / max(writer.batches, 1):.1f} sales each)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Concurrent checkout benchmark for order-confirmation stock reservations.
+
+Creates one product with ``--stock`` units on hand and ``--orders`` single-unit draft orders, then confirms
+all orders from ``--workers`` threads at once. Exactly ``--stock`` confirmations must succeed and the
+product must end with zero on hand; anything else is an oversell (or a lost update).
+
+    python -m backend.benchmarks.stock_reservation_benchmark --orders 500 --stock 200 --workers 64
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import backend.app.db.base  # noqa: F401  (registers every model)
+from backend.app.core.config import settings
+from backend.app.models.customer import Customer
+from backend.app.models.inventory import InventoryLevel
+from backend.app.models.order import Order
+from backend.app.models.product import Product
+from backend.app.schemas.order import OrderCreate, OrderItemIn
+from backend.app.services import order_service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', default=settings.database_url)
+    parser.add_argument('--orders', type=int, default=500)
+    parser.add_argument('--stock', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=64)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, pool_size=args.workers, max_overflow=0)
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    run = uuid4().hex[:8]
+
+    with Session() as db:
+        customer = Customer(full_name=f'Bench {run}', email=f'bench-{run}@example.com')
+        product = Product(sku=f'BENCH-{run}', name='Bench product', unit_cost='1.00', unit_price='2.00')
+        db.add_all([customer, product])
+        db.flush()
+        db.add(InventoryLevel(product_id=product.id, on_hand=args.stock, reserved=0))
+        order_ids = [
+            order_service.create_order(
+                db,
+                OrderCreate(
+                    order_number=f'BENCH-{run}-{index}',
+                    customer_id=customer.id,
+                    items=[OrderItemIn(product_id=product.id, quantity=Decimal('1'), unit_price=Decimal('2.00'))],
+                ),
+            ).id
+            for index in range(args.orders)
+        ]
+        db.commit()
+        product_id = product.id
+
+    def confirm(order_id: int) -> bool:
+        with Session() as db:
+            order = db.query(Order).filter(Order.id == order_id).with_for_update().one()
+            try:
+                order_service.change_status(db, order, 'confirmed')
+            except HTTPException:
+                db.rollback()
+                return False
+            db.commit()
+            return True
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        confirmed = sum(pool.map(confirm, order_ids))
+    elapsed = time.perf_counter() - started
+
+    with Session() as db:
+        level = db.get(InventoryLevel, product_id)
+        on_hand, reserved = level.on_hand, level.reserved
+
+    print(
+        f'{args.orders} checkouts on {args.workers} workers in {elapsed:.2f}s '
+        f'({args.orders / elapsed:.0f}/s): confirmed={confirmed} on_hand={on_hand} reserved={reserved}'
+    )
+    if confirmed != min(args.orders, args.stock) or on_hand != max(args.stock - args.orders, 0) or reserved != confirmed:
+        raise SystemExit('stock invariant violated')
+
+
+if __name__ == '__main__':
+    main()
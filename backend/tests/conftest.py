@@ -8,6 +8,7 @@ from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[2]
 os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+os.environ.setdefault('BACKGROUND_WORKERS_ENABLED', 'false')
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
@@ -23,6 +24,9 @@ from backend.app.models.accounting import Account
 from backend.app.models.customer import Customer
 from backend.app.models.order import Order, OrderItem
 from backend.app.models.product import Product
+from backend.app.services.catalog_cache import catalog_cache
+from backend.app.services.idempotency import idempotency_cache
+from backend.app.services.sales_rollup import summary_cache
 
 
 @pytest.fixture()
@@ -49,6 +53,9 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_db
+    catalog_cache.clear()
+    idempotency_cache.clear()
+    summary_cache.clear()
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
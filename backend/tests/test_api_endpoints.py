@@ -259,3 +259,436 @@ def test_webhook_verify_and_sessions_logs(
     logs_response = client.get('/api/v1/sessions/logs', headers=auth_headers)
     assert logs_response.status_code == 200
     assert logs_response.json()[0]['actor'] == 'tester'
+
+
+def test_ui_products_catalog_etag_and_not_modified(client: TestClient, db_session):
+    from sqlalchemy import event
+
+    first = client.get('/products', params={'client_id': 'etag_client'})
+    assert first.status_code == 200
+    assert first.json() == []
+    etag = first.headers['ETag']
+
+    statements: list[str] = []
+
+    def listener(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db_session.get_bind(), 'before_cursor_execute', listener)
+    try:
+        not_modified = client.get('/products', params={'client_id': 'etag_client'}, headers={'If-None-Match': etag})
+    finally:
+        event.remove(db_session.get_bind(), 'before_cursor_execute', listener)
+    assert not_modified.status_code == 304
+    assert statements == []
+
+    created = client.post('/products', json={'client_id': 'etag_client', 'name': 'Tea', 'category': 'Drinks', 'cost': 1, 'price': 2})
+    assert created.status_code == 201
+
+    refreshed = client.get('/products', params={'client_id': 'etag_client'}, headers={'If-None-Match': etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers['ETag'] != etag
+    assert [row['name'] for row in refreshed.json()] == ['Tea']
+
+
+def test_products_bulk_upsert_by_sku(client: TestClient, auth_headers: dict[str, str], db_session):
+    from backend.app.models.product import Product
+
+    db_session.add(Product(sku='OTHER-1', name='Other', client_id='other_client', unit_cost='1.00', unit_price='2.00'))
+    db_session.commit()
+
+    created = client.post(
+        '/api/v1/products/bulk',
+        headers=auth_headers,
+        json=[
+            {'sku': 'BULK-1', 'name': 'Bulk One', 'unit_cost': '1.00', 'unit_price': '2.00'},
+            {'sku': 'BULK-2', 'name': 'Bulk Two', 'unit_cost': '3.00', 'unit_price': '4.00'},
+            {'sku': 'OTHER-1', 'name': 'Hijack', 'unit_cost': '1.00', 'unit_price': '2.00'},
+            {'sku': 'BULK-3', 'name': 'Missing prices'},
+        ],
+    )
+    assert created.status_code == 200
+    body = created.json()
+    assert (body['status'], body['created'], body['updated'], body['failed']) == ('completed', 2, 0, 2)
+    assert {error['sku'] for error in body['errors']} == {'OTHER-1', 'BULK-3'}
+
+    csv_body = 'sku,name,category,unit_cost,unit_price\nBULK-1,Bulk One v2,Tools,1.50,2.50\nBULK-4,Bulk Four,,5.00,6.00\n'
+    updated = client.post(
+        '/api/v1/products/bulk',
+        headers={**auth_headers, 'Content-Type': 'text/csv'},
+        content=csv_body,
+    )
+    assert updated.status_code == 200
+    assert (updated.json()['created'], updated.json()['updated'], updated.json()['failed']) == (1, 1, 0)
+
+    products = {row['sku']: row for row in client.get('/api/v1/products', headers=auth_headers).json()}
+    assert products['BULK-1']['name'] == 'Bulk One v2'
+    assert products['BULK-1']['category'] == 'Tools'
+    assert products['OTHER-1']['name'] == 'Other'
+    assert 'BULK-4' in products
+
+    missing = client.get('/api/v1/products/bulk/unknown-job', headers=auth_headers)
+    assert missing.status_code == 404
+
+
+def test_products_search_ranks_prefix_matches_and_scopes_tenant(client: TestClient, auth_headers: dict[str, str], db_session):
+    from backend.app.models.product import Product
+
+    db_session.add_all(
+        [
+            Product(sku='TEA-001', name='Green Tea', category='Drinks', unit_cost='1.00', unit_price='2.00'),
+            Product(sku='MUG-7', name='Teapot', category='Kitchen', unit_cost='5.00', unit_price='9.00'),
+            Product(sku='CUP-2', name='Steamed cups', category='Kitchen', unit_cost='1.00', unit_price='2.00'),
+            Product(sku='TEA-X', name='Tea 50%', client_id='other_client', unit_cost='1.00', unit_price='2.00'),
+        ]
+    )
+    db_session.commit()
+
+    response = client.get('/api/v1/products/search', params={'q': 'tea'}, headers=auth_headers)
+    assert response.status_code == 200
+    assert [row['sku'] for row in response.json()] == ['TEA-001', 'MUG-7', 'CUP-2']
+
+    assert client.get('/api/v1/products/search', params={'q': '50%'}, headers=auth_headers).json() == []
+    assert client.get('/api/v1/products/search', params={'q': ''}, headers=auth_headers).status_code == 422
+
+    ui_response = client.get('/products/search', params={'client_id': 'other_client', 'q': '50%'})
+    assert [row['sku'] for row in ui_response.json()] == ['TEA-X']
+
+
+def test_orders_batch_reports_status_per_order(
+    client: TestClient, auth_headers: dict[str, str], order_fixture_data: dict[str, int], product_fixture_data: dict[str, int]
+):
+    def order(number: str, product_id: int, customer_id: int = product_fixture_data['customer_id']) -> dict:
+        return {
+            'order_number': number,
+            'customer_id': customer_id,
+            'tax_amount': '1.00',
+            'items': [
+                {'product_id': product_id, 'quantity': '3', 'unit_price': '15.00'},
+                {'product_id': product_id, 'quantity': '0.5', 'unit_price': '9.99'},
+            ],
+        }
+
+    response = client.post(
+        '/api/v1/orders/batch',
+        headers=auth_headers,
+        json={
+            'orders': [
+                order('ORD-B-1', product_fixture_data['product_id']),
+                order('ORD-FIX-001', product_fixture_data['product_id']),
+                order('ORD-B-2', 999),
+                order('ORD-B-1', product_fixture_data['product_id']),
+                order('ORD-B-3', product_fixture_data['product_id'], customer_id=999),
+            ]
+        },
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert (body['created'], body['failed']) == (1, 4)
+    assert [row['status'] for row in body['results']] == ['created', 'duplicate', 'failed', 'duplicate', 'failed']
+
+    created = next(row for row in client.get('/api/v1/orders', headers=auth_headers).json() if row['order_number'] == 'ORD-B-1')
+    assert created['id'] == body['results'][0]['order_id']
+    assert created['subtotal'] == '50.00'
+    assert created['total_amount'] == '51.00'
+
+    patched = client.patch(
+        f"/api/v1/orders/{created['id']}",
+        headers={**auth_headers, 'X-2FA-Code': '123456'},
+        json={'discount_amount': '6.00'},
+    )
+    assert patched.json()['total_amount'] == '45.00'
+
+
+def test_order_confirmation_reserves_stock_and_sweeper_releases_it(
+    client: TestClient, auth_headers: dict[str, str], product_fixture_data: dict[str, int], db_session
+):
+    from datetime import datetime, timedelta
+
+    from backend.app.services.stock_reservation import release_expired_reservations
+
+    product_id = product_fixture_data['product_id']
+    restock = {'product_id': product_id, 'movement_type': 'in', 'quantity': '5', 'reason': 'restock'}
+    assert client.post('/api/v1/inventory/adjustments', headers=auth_headers, json=restock).status_code == 200
+
+    def place(number: str, quantity: str) -> int:
+        response = client.post(
+            '/api/v1/orders',
+            headers=auth_headers,
+            json={
+                'order_number': number,
+                'customer_id': product_fixture_data['customer_id'],
+                'items': [{'product_id': product_id, 'quantity': quantity, 'unit_price': '15.00'}],
+            },
+        )
+        return response.json()['id']
+
+    def set_status(order_id: int, status: str):
+        return client.patch(
+            f'/api/v1/orders/{order_id}', headers={**auth_headers, 'X-2FA-Code': '123456'}, json={'status': status}
+        )
+
+    def level() -> dict:
+        return client.get('/api/v1/inventory/levels', headers=auth_headers).json()[0]
+
+    first, second = place('ORD-RES-1', '2'), place('ORD-RES-2', '4')
+    assert set_status(first, 'confirmed').status_code == 200
+    assert (level()['on_hand'], level()['reserved']) == ('3.000', '2.000')
+
+    oversell = set_status(second, 'confirmed')
+    assert oversell.status_code == 409
+    assert oversell.json()['detail']['shortages'][0]['product_id'] == product_id
+    db_session.rollback()
+
+    assert set_status(first, 'cancelled').status_code == 200
+    assert (level()['on_hand'], level()['reserved']) == ('5.000', '0.000')
+
+    assert set_status(second, 'confirmed').status_code == 200
+    assert release_expired_reservations(db_session, now=datetime.utcnow() + timedelta(days=1)) == 1
+    db_session.commit()
+    assert (level()['on_hand'], level()['reserved']) == ('5.000', '0.000')
+    orders = {row['id']: row['status'] for row in client.get('/api/v1/orders', headers=auth_headers).json()}
+    assert orders[second] == 'draft'
+
+    movements = [(row['movement_type'], row['quantity']) for row in client.get('/api/v1/inventory/movements', headers=auth_headers).json()]
+    assert movements.count(('out', '2.000')) == 1 and movements.count(('out', '4.000')) == 1
+
+
+def test_idempotency_key_replays_first_response(
+    client: TestClient, auth_headers: dict[str, str], product_fixture_data: dict[str, int], db_session
+):
+    from backend.app.models.sale import Sale
+
+    sale = {'client_id': 'demo_client', 'product_id': product_fixture_data['product_id'], 'qty': 1, 'selling_price': 15}
+    first = client.post('/sales', json=sale, headers={'Idempotency-Key': 'sale-1'})
+    replay = client.post('/sales', json=sale, headers={'Idempotency-Key': 'sale-1'})
+    assert first.status_code == replay.status_code == 201
+    assert replay.json() == first.json()
+    assert replay.headers['Idempotent-Replayed'] == 'true'
+    assert db_session.query(Sale).count() == 1
+
+    mismatch = client.post('/sales', json={**sale, 'qty': 2}, headers={'Idempotency-Key': 'sale-1'})
+    assert mismatch.status_code == 422
+
+    order = {
+        'order_number': 'ORD-IDEM-1',
+        'customer_id': product_fixture_data['customer_id'],
+        'items': [{'product_id': product_fixture_data['product_id'], 'quantity': '1', 'unit_price': '15.00'}],
+    }
+    headers = {**auth_headers, 'Idempotency-Key': 'order-1'}
+    created = client.post('/api/v1/orders', json=order, headers=headers)
+    assert client.post('/api/v1/orders', json=order, headers=headers).json()['id'] == created.json()['id']
+    assert len(client.get('/api/v1/orders', headers=auth_headers).json()) == 1
+
+
+def test_sales_are_posted_to_stock_and_ledger_through_outbox(
+    client: TestClient, auth_headers: dict[str, str], product_fixture_data: dict[str, int], db_session
+):
+    from backend.app.models.accounting import Account, JournalEntry, JournalLine
+    from backend.app.models.stock_movement import StockMovement
+    from backend.app.services.sales_posting import post_pending_sales
+
+    sale = {'client_id': 'demo_client', 'product_id': product_fixture_data['product_id'], 'qty': 2, 'selling_price': 15}
+    for _ in range(3):
+        assert client.post('/sales', json=sale).status_code == 201
+    assert db_session.query(StockMovement).count() == 0
+
+    metrics = client.get('/api/v1/reports/sales-posting', headers=auth_headers).json()
+    assert metrics['pending_events'] == 3
+
+    assert post_pending_sales(db_session) == 3
+    assert post_pending_sales(db_session) == 0
+    assert db_session.query(StockMovement).filter(StockMovement.reference_type == 'sale').count() == 3
+    assert db_session.query(JournalEntry).filter(JournalEntry.reference_type == 'sales_batch').count() == 2
+
+    def balance(code: str):
+        return sum(
+            line.debit - line.credit
+            for line in db_session.query(JournalLine).join(Account).filter(Account.code == code)
+        )
+
+    assert balance('4000') == -90
+    assert balance('5000') == 60
+    assert balance('1200') == -60
+
+    metrics = client.get('/api/v1/reports/sales-posting', headers=auth_headers).json()
+    assert (metrics['pending_events'], metrics['posted_last_minute']) == (0, 3)
+
+
+def test_sales_summary_reads_daily_rollup_and_rebuild_matches(
+    client: TestClient, product_fixture_data: dict[str, int], db_session
+):
+    from backend.app.models.sales_daily import SalesDaily
+    from backend.app.services.sales_rollup import rebuild_sales_daily, summary_cache
+
+    sale = {'client_id': 'demo_client', 'product_id': product_fixture_data['product_id'], 'qty': 2, 'selling_price': 15}
+    for _ in range(3):
+        assert client.post('/sales', json=sale).status_code == 201
+    assert db_session.query(SalesDaily).count() == 1
+
+    summary = client.get('/sales/summary', params={'client_id': 'demo_client'}).json()
+    assert summary['kpis']['today_revenue'] == 90
+    assert summary['kpis']['gross_profit'] == 30
+    assert (summary['kpis']['units_sold'], summary['kpis']['sale_count']) == (6, 3)
+    assert summary['products'][0]['units_last_30_days'] == 6
+    assert [(day['order_count'], day['revenue']) for day in summary['daily']] == [(3, 90)]
+    assert client.get('/sales/summary', params={'client_id': 'other'}).json()['products'] == []
+
+    incremental = [(row.day, row.sale_count, row.units, row.revenue, row.cost) for row in db_session.query(SalesDaily)]
+    summary_cache.clear()
+    assert rebuild_sales_daily(db_session) == 1
+    db_session.commit()
+    db_session.expire_all()
+    rebuilt = [(row.day, row.sale_count, row.units, row.revenue, row.cost) for row in db_session.query(SalesDaily)]
+    assert rebuilt == incremental
+
+
+def test_bulk_sales_ingest_dedups_on_external_id(client: TestClient, product_fixture_data: dict[str, int], db_session):
+    import json
+    from decimal import Decimal
+
+    from backend.app.models.outbox import OutboxEvent
+    from backend.app.models.sales_daily import SalesDaily
+
+    csv_body = (
+        'client_id,external_id,sku,qty,selling_price,sale_date\n'
+        'demo_client,POS1-1,FIXTURE-SKU-1,2,15,2026-10-18T10:00:00\n'
+        'demo_client,POS1-2,FIXTURE-SKU-1,1,14.50,2026-10-18T11:00:00\n'
+        'demo_client,POS1-2,FIXTURE-SKU-1,1,14.50,2026-10-18T11:00:00\n'
+        'other_client,POS1-3,FIXTURE-SKU-1,1,15,2026-10-18T12:00:00\n'
+        'demo_client,POS1-4,FIXTURE-SKU-1,0,15,\n'
+    )
+    response = client.post('/sales/bulk', content=csv_body, headers={'Content-Type': 'text/csv'})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body['total_rows'], body['inserted'], body['duplicates'], body['failed']) == (5, 2, 1, 2)
+    assert [error['external_id'] for error in body['errors']] == ['POS1-4', 'POS1-3']
+
+    ndjson = '\n'.join(
+        json.dumps(row)
+        for row in [
+            {'client_id': 'demo_client', 'external_id': 'POS1-1', 'product_id': product_fixture_data['product_id'], 'qty': 2, 'selling_price': 15},
+            {'client_id': 'demo_client', 'external_id': 'POS1-5', 'product_id': product_fixture_data['product_id'], 'qty': 3, 'selling_price': 15},
+        ]
+    )
+    body = client.post('/sales/bulk', content=ndjson, headers={'Content-Type': 'application/x-ndjson'}).json()
+    assert (body['inserted'], body['duplicates']) == (1, 1)
+
+    assert db_session.query(OutboxEvent).count() == 3
+    rollup = {row.day.isoformat(): (row.sale_count, row.units, row.revenue) for row in db_session.query(SalesDaily)}
+    assert rollup['2026-10-18'] == (2, 3, Decimal('44.50'))
+
+
+def test_product_associations_rank_co_purchased_products(
+    client: TestClient, auth_headers: dict[str, str], product_fixture_data: dict[str, int], db_session
+):
+    from backend.app.models.order import Order, OrderItem
+    from backend.app.models.product import Product
+    from backend.app.services.product_associations import rebuild_product_associations
+
+    base_id = product_fixture_data['product_id']
+    cable, case, stand = (
+        Product(sku=f'FBT-{name}', name=name, unit_cost='1.00', unit_price='2.00') for name in ('Cable', 'Case', 'Stand')
+    )
+    db_session.add_all([cable, case, stand])
+    db_session.flush()
+    baskets = [
+        ('confirmed', [base_id, cable.id]),
+        ('fulfilled', [base_id, cable.id, case.id]),
+        ('confirmed', [base_id, cable.id]),
+        ('confirmed', [base_id, case.id]),
+        ('confirmed', [stand.id]),
+        ('cancelled', [base_id, stand.id]),
+        ('cancelled', [base_id, stand.id]),
+    ]
+    for number, (status, product_ids) in enumerate(baskets):
+        order = Order(order_number=f'FBT-{number}', customer_id=product_fixture_data['customer_id'], status=status)
+        db_session.add(order)
+        db_session.flush()
+        db_session.add_all(
+            OrderItem(order_id=order.id, product_id=product_id, quantity=1, unit_price=2, line_total=2)
+            for product_id in product_ids
+        )
+    db_session.commit()
+
+    assert rebuild_product_associations(db_session, top_n=5, min_pair_count=2) == 4
+    db_session.commit()
+
+    response = client.get(f'/api/v1/products/{base_id}/associations', headers=auth_headers)
+    assert response.status_code == 200
+    rows = response.json()
+    assert [(row['name'], row['pair_count']) for row in rows] == [('Cable', 3), ('Case', 2)]
+    assert rows[0]['confidence'] == 0.75
+    assert rows[0]['lift'] == 1.25
+
+    reverse = client.get(f'/api/v1/products/{cable.id}/associations', headers=auth_headers).json()
+    assert [row['product_id'] for row in reverse] == [base_id]
+
+
+def test_customer_segments_score_recency_frequency_and_monetary(
+    client: TestClient, auth_headers: dict[str, str], product_fixture_data: dict[str, int], db_session
+):
+    from datetime import date
+
+    from backend.app.models.client import Invoice, Payment
+    from backend.app.models.customer import Customer
+    from backend.app.models.order import Order
+    from backend.app.services.customer_segments import rebuild_customer_segments
+
+    regular, lapsed, silent = (
+        Customer(full_name=name, phone_e164=f'+1555000000{index}') for index, name in enumerate(('Regular', 'Lapsed', 'Silent'))
+    )
+    db_session.add_all([regular, lapsed, silent])
+    db_session.flush()
+    for number in range(4):
+        db_session.add(Order(order_number=f'RFM-R{number}', customer_id=regular.id, status='fulfilled'))
+    db_session.add(Order(order_number='RFM-L0', customer_id=lapsed.id, status='fulfilled'))
+    db_session.add(Order(order_number='RFM-S0', customer_id=silent.id, status='cancelled'))
+    db_session.add_all(
+        [
+            Invoice(invoice_number='RFM-I1', customer_id=regular.id, issue_date=date(2026, 10, 1), due_date=date(2026, 10, 15), total_amount=500),
+            Payment(customer_id=regular.id, amount=500, payment_date=date(2026, 10, 10), payment_method='cash'),
+            Payment(customer_id=lapsed.id, amount=40, payment_date=date(2025, 12, 1), payment_method='cash'),
+        ]
+    )
+    db_session.commit()
+
+    assert rebuild_customer_segments(db_session, as_of=date(2026, 10, 20)) == 4
+    db_session.commit()
+
+    response = client.get(f'/api/v1/reports/customer-segments/{regular.id}', headers=auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body['recency_days'], body['frequency'], body['segment']) == (10, 5, 'champion')
+    assert (body['recency_score'], body['frequency_score'], body['monetary_score']) == (5, 5, 5)
+
+    lapsed_row = client.get(f'/api/v1/reports/customer-segments/{lapsed.id}', headers=auth_headers).json()
+    assert (lapsed_row['recency_score'], lapsed_row['frequency_score'], lapsed_row['segment']) == (3, 3, 'needs_attention')
+    silent_row = client.get(f'/api/v1/reports/customer-segments/{silent.id}', headers=auth_headers).json()
+    assert (silent_row['recency_days'], silent_row['frequency_score'], silent_row['segment']) == (None, 1, 'hibernating')
+
+    hibernating = client.get('/api/v1/reports/customer-segments', params={'segment': 'hibernating'}, headers=auth_headers)
+    assert silent.id in [row['customer_id'] for row in hibernating.json()]
+
+
+def test_returns_summary_aggregates_units_refunds_and_rate(
+    client: TestClient, auth_headers: dict[str, str], order_fixture_data: dict[str, int], product_fixture_data: dict[str, int]
+):
+    sale = {'client_id': 'demo_client', 'product_id': product_fixture_data['product_id'], 'qty': 4, 'selling_price': 15}
+    assert client.post('/sales', json=sale).status_code == 201
+    created = client.post(
+        '/api/v1/returns',
+        headers=auth_headers,
+        json={
+            'order_id': order_fixture_data['order_id'],
+            'items': [{'order_item_id': order_fixture_data['order_item_id'], 'quantity': '1', 'refund_amount': '15.00'}],
+        },
+    )
+    assert created.status_code == 200
+
+    summary = client.get('/api/v1/returns/summary', headers=auth_headers, params={'client_id': 'demo_client'}).json()
+    assert (float(summary['returned_units']), float(summary['refund_value'])) == (1.0, 15.0)
+    assert (summary['units_sold'], summary['return_rate']) == (4, 25.0)
+    assert [(row['product_id'], row['return_rate']) for row in summary['products']] == [(product_fixture_data['product_id'], 25.0)]
+    assert [(row['return_count'], row['units_sold']) for row in summary['periods']] == [(1, 4)]
+    assert client.get('/api/v1/returns/summary', headers=auth_headers, params={'client_id': 'other'}).json()['products'] == []
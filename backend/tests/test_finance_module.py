@@ -203,3 +203,195 @@ def test_rbac_financial_access_enforcement(client, db_session):
 
     owner_read_response = client.get('/api/v1/finance/reports/pnl?start_date=2026-01-01&end_date=2026-01-31', headers=headers_owner)
     assert owner_read_response.status_code == 200
+
+
+def test_billing_run_invoices_fulfilled_orders_per_customer(client, db_session):
+    headers, _ = _auth_headers_for(client, db_session, 'billing_owner', 'billing@example.com', 'owner')
+    _setup_accounts(db_session)
+    first = Customer(full_name='Billing One', email='bill1@example.com')
+    second = Customer(full_name='Billing Two', email='bill2@example.com')
+    db_session.add_all([first, second])
+    db_session.flush()
+    db_session.add_all(
+        [
+            Order(order_number='BILL-1', customer_id=first.id, status='fulfilled', total_amount=Decimal('100.00')),
+            Order(order_number='BILL-2', customer_id=first.id, status='fulfilled', total_amount=Decimal('50.00')),
+            Order(order_number='BILL-3', customer_id=second.id, status='fulfilled', total_amount=Decimal('20.00')),
+            Order(order_number='BILL-4', customer_id=second.id, status='confirmed', total_amount=Decimal('99.00')),
+        ]
+    )
+    db_session.commit()
+
+    response = client.post('/api/v1/finance/billing-runs', json={'issue_date': '2026-10-31'}, headers=headers)
+    assert response.status_code == 200
+    run = response.json()
+    assert (run['status'], run['invoices_created'], run['orders_billed']) == ('completed', 2, 3)
+    assert Decimal(str(run['amount_billed'])) == Decimal('170.00')
+
+    invoices = db_session.query(Invoice).order_by(Invoice.invoice_number).all()
+    assert [(invoice.invoice_number, invoice.total_amount) for invoice in invoices] == [
+        ('INV-00000001', Decimal('150.00')),
+        ('INV-00000002', Decimal('20.00')),
+    ]
+    assert invoices[0].due_date == date(2026, 11, 30)
+    assert db_session.query(Order).filter(Order.invoice_id.is_(None)).count() == 1
+    receivable = sum(
+        line.debit - line.credit
+        for line in db_session.query(JournalLine).join(Account).filter(Account.code == '1100')
+    )
+    assert receivable == Decimal('170.00')
+    from backend.app.models.customer_balance import CustomerBalance
+
+    assert db_session.get(CustomerBalance, first.id).outstanding == Decimal('150.00')
+
+    again = client.post('/api/v1/finance/billing-runs', json={'issue_date': '2026-10-31'}, headers=headers).json()
+    assert again['invoices_created'] == 0
+    assert client.get(f"/api/v1/finance/billing-runs/{run['id']}", headers=headers).json()['invoices_created'] == 2
+
+
+def test_client_statement_range_uses_snapshot_opening_balance_and_pages(client, db_session):
+    from backend.app.services.customer_statements import snapshot_customer_balances
+
+    headers, _ = _auth_headers_for(client, db_session, 'statement_owner', 'statement@example.com', 'owner')
+    customer = Customer(full_name='Statement Customer', email='statement@example.com')
+    db_session.add(customer)
+    db_session.flush()
+    db_session.add_all(
+        [
+            Invoice(
+                invoice_number=f'INV-S-{day}',
+                customer_id=customer.id,
+                issue_date=date(2026, month, day),
+                due_date=date(2026, month, day),
+                total_amount=amount,
+            )
+            for month, day, amount in [(1, 10, '100.00'), (2, 3, '50.00'), (2, 20, '30.00')]
+        ]
+        + [
+            Payment(customer_id=customer.id, amount='40.00', payment_date=date(2026, 1, 20), payment_method='cash'),
+            Payment(customer_id=customer.id, amount='25.00', payment_date=date(2026, 2, 3), payment_method='cash'),
+        ]
+    )
+    db_session.commit()
+    assert snapshot_customer_balances(db_session, date(2026, 1, 31)) == 1
+    db_session.commit()
+
+    params = {'from': '2026-02-01', 'to': '2026-02-28', 'limit': 2}
+    statement = client.get('/api/v1/client/statement', params=params, headers=headers).json()
+    assert (Decimal(statement['opening_balance']), Decimal(statement['closing_balance'])) == (Decimal('60.00'), Decimal('115.00'))
+    assert statement['total_lines'] == 3
+    assert [(line['type'], line['balance']) for line in statement['lines']] == [('invoice', '110.00'), ('payment', '85.00')]
+
+    last_page = client.get('/api/v1/client/statement', params={**params, 'offset': 2}, headers=headers).json()
+    assert [line['balance'] for line in last_page['lines']] == ['115.00']
+    past_end = client.get('/api/v1/client/statement', params={**params, 'offset': 5}, headers=headers).json()
+    assert (past_end['lines'], Decimal(past_end['opening_balance']), past_end['total_lines']) == ([], Decimal('60.00'), 3)
+
+    full = client.get('/api/v1/client/statement', headers=headers).json()
+    assert (Decimal(full['opening_balance']), full['total_lines']) == (Decimal('0.00'), 5)
+
+
+def test_customer_balance_projection_tracks_invoices_payments_and_aging(client, db_session):
+    from backend.app.models.customer_balance import CustomerBalance
+    from backend.app.services.customer_balances import rebuild_customer_balances
+
+    headers, _ = _auth_headers_for(client, db_session, 'aging_owner', 'aging@example.com', 'owner')
+    customer = Customer(full_name='Aging Customer', email='aging-customer@example.com')
+    db_session.add(customer)
+    db_session.flush()
+    db_session.add_all(
+        [
+            Invoice(invoice_number='INV-AG-1', customer_id=customer.id, issue_date=date(2026, 1, 1), due_date=date(2026, 1, 31), total_amount='100.00'),
+            Invoice(invoice_number='INV-AG-2', customer_id=customer.id, issue_date=date(2026, 3, 1), due_date=date(2026, 3, 31), total_amount='80.00'),
+        ]
+    )
+    db_session.commit()
+    balance = db_session.get(CustomerBalance, customer.id)
+    assert (balance.outstanding, balance.open_invoices, balance.oldest_open_due_date) == (Decimal('180.00'), 2, date(2026, 1, 31))
+
+    first = db_session.query(Invoice).filter(Invoice.invoice_number == 'INV-AG-1').one()
+    first.paid_amount, first.status = Decimal('100.00'), 'paid'
+    db_session.add(Payment(customer_id=customer.id, invoice_id=first.id, amount='100.00', payment_date=date(2026, 2, 1), payment_method='cash'))
+    db_session.commit()
+    db_session.refresh(balance)
+    assert (balance.paid_total, balance.outstanding, balance.oldest_open_due_date) == (Decimal('100.00'), Decimal('80.00'), date(2026, 3, 31))
+
+    aging = client.get('/api/v1/finance/reports/ar-aging', params={'as_of_date': '2026-05-15'}, headers=headers).json()
+    assert [(row['customer_id'], row['days_past_due'], row['bucket']) for row in aging['rows']] == [(customer.id, 45, '31_60')]
+    assert Decimal(aging['buckets']['31_60']) == Decimal('80.00')
+
+    projected = [(row.customer_id, row.invoiced_total, row.outstanding) for row in db_session.query(CustomerBalance)]
+    assert rebuild_customer_balances(db_session) == 1
+    db_session.commit()
+    db_session.expire_all()
+    assert [(row.customer_id, row.invoiced_total, row.outstanding) for row in db_session.query(CustomerBalance)] == projected
+
+
+def test_portal_invoice_download_uses_linked_customer_and_keyed_lookup(client, db_session, tmp_path, monkeypatch):
+    from sqlalchemy import event
+
+    from backend.app.core.config import settings
+
+    monkeypatch.setattr(settings, 'pdf_cache_dir', str(tmp_path))
+    headers, user = _auth_headers_for(client, db_session, 'portal_user', 'portal@example.com', 'employee')
+    mine = Customer(full_name='Portal Customer', email=user.email)
+    other = Customer(full_name='Other Customer', email='other-portal@example.com')
+    db_session.add_all([mine, other])
+    db_session.flush()
+    own_invoice = Invoice(invoice_number='INV-P-1', customer_id=mine.id, issue_date=date(2026, 1, 1), due_date=date(2026, 1, 31), total_amount='10.00')
+    other_invoice = Invoice(invoice_number='INV-P-2', customer_id=other.id, issue_date=date(2026, 1, 1), due_date=date(2026, 1, 31), total_amount='10.00')
+    db_session.add_all([own_invoice, other_invoice])
+    db_session.commit()
+
+    assert client.get(f'/api/v1/client/invoices/{own_invoice.id}/download', headers=headers).status_code == 200
+    db_session.refresh(user)
+    assert user.customer_id == mine.id
+
+    statements: list[str] = []
+
+    def listener(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db_session.get_bind(), 'before_cursor_execute', listener)
+    try:
+        response = client.get(f'/api/v1/client/invoices/{own_invoice.id}/download', headers=headers)
+    finally:
+        event.remove(db_session.get_bind(), 'before_cursor_execute', listener)
+    assert 'invoice_INV-P-1.pdf' in response.headers['Content-Disposition']
+    # User with roles, the scoped invoice, then the customer and order lines printed on the PDF.
+    assert len(statements) == 4
+    assert client.get(f'/api/v1/client/invoices/{other_invoice.id}/download', headers=headers).status_code == 404
+
+
+def test_invoice_and_statement_pdfs_are_cached_by_content_hash(client, db_session, tmp_path, monkeypatch):
+    from backend.app.core.config import settings
+    from backend.app.services.pdf_documents import pregenerate_month_end_statements
+
+    monkeypatch.setattr(settings, 'pdf_cache_dir', str(tmp_path))
+    headers, user = _auth_headers_for(client, db_session, 'pdf_user', 'pdf@example.com', 'employee')
+    customer = Customer(full_name='Pdf Customer', email=user.email)
+    db_session.add(customer)
+    db_session.flush()
+    invoice = Invoice(invoice_number='INV-PDF-1', customer_id=customer.id, issue_date=date(2026, 9, 1), due_date=date(2026, 9, 30), total_amount='42.00')
+    db_session.add(invoice)
+    db_session.commit()
+
+    first = client.get(f'/api/v1/client/invoices/{invoice.id}/download', headers=headers)
+    assert first.status_code == 200
+    assert first.headers['content-type'] == 'application/pdf'
+    assert first.content.startswith(b'%PDF-') and b'INV-PDF-1' in first.content
+    etag = first.headers['ETag']
+    assert (tmp_path / f'{etag.strip(chr(34))}.pdf').exists()
+
+    cached = client.get(f'/api/v1/client/invoices/{invoice.id}/download', headers={**headers, 'If-None-Match': etag})
+    assert cached.status_code == 304
+
+    invoice.paid_amount = Decimal('42.00')
+    db_session.commit()
+    changed = client.get(f'/api/v1/client/invoices/{invoice.id}/download', headers={**headers, 'If-None-Match': etag})
+    assert changed.status_code == 200 and changed.headers['ETag'] != etag
+
+    statement = client.get('/api/v1/client/statement/download', params={'from': '2026-09-01', 'to': '2026-09-30'}, headers=headers)
+    assert statement.status_code == 200 and statement.content.startswith(b'%PDF-')
+    assert pregenerate_month_end_statements(db_session, date(2026, 9, 30)) == 1
+    assert len(list(tmp_path.glob('*.pdf'))) == 3
@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.models.inventory import InventoryLevel
+from backend.app.models.sale import Sale
+from backend.app.services import group_commit
+from backend.app.services.group_commit import GroupCommitWriter
+
+
+def test_group_commit_isolates_failures_and_batches_commits(db_session, product_fixture_data):
+    writer = GroupCommitWriter(sessionmaker(bind=db_session.get_bind()), window_ms=50, max_batch=100)
+
+    def insert_sale(qty: int):
+        def work(db):
+            if qty < 0:
+                raise HTTPException(status_code=400, detail='negative')
+            sale = Sale(client_id='demo_client', product_id=product_fixture_data['product_id'], qty=qty, selling_price=1)
+            db.add(sale)
+            db.flush()
+            return sale.id
+
+        return writer.submit(work)
+
+    try:
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            futures = list(pool.map(insert_sale, [1] * 19 + [-1]))
+        ids = [future.result(timeout=5) for future in futures[:-1]]
+        with pytest.raises(HTTPException):
+            futures[-1].result(timeout=5)
+    finally:
+        writer.stop()
+
+    assert len(set(ids)) == 19
+    assert db_session.query(Sale).count() == 19
+    assert writer.items == 20
+    assert writer.batches < 20
+
+
+def test_ui_sale_uses_group_commit_writer_when_enabled(client: TestClient, db_session, product_fixture_data, monkeypatch):
+    writer = GroupCommitWriter(sessionmaker(bind=db_session.get_bind()), window_ms=1)
+    monkeypatch.setattr(group_commit, '_sale_writer', writer)
+    monkeypatch.setattr(group_commit.settings, 'group_commit_enabled', True)
+    db_session.add(InventoryLevel(product_id=product_fixture_data['product_id'], on_hand=1, reserved=0))
+    db_session.commit()
+
+    sale = {'client_id': 'demo_client', 'product_id': product_fixture_data['product_id'], 'qty': 1, 'selling_price': 15}
+    try:
+        created = client.post('/sales', json=sale)
+        oversold = client.post('/sales', json=sale)
+    finally:
+        writer.stop()
+
+    assert created.status_code == 201
+    assert oversold.status_code == 409
+    assert writer.items == 2
+    assert db_session.query(Sale).count() == 1
@@ -0,0 +1,70 @@
+from backend.app.models.product import Product
+from backend.app.models.product_image import ProductImage
+from backend.app.models.reembedding_checkpoint import ReembeddingCheckpoint
+from backend.app.services.image_reembedding import ImageReembeddingJob
+
+
+class FakeStorage:
+    def __init__(self):
+        self.downloads = []
+
+    def download_product_image(self, bucket, key):
+        self.downloads.append(key)
+        return key.encode('utf-8')
+
+
+class FakeEmbeddings:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def create_embeddings(self, images):
+        self.batch_sizes.append(len(images))
+        return [[0.5] * 1536 for _ in images]
+
+
+def _seed_images(db_session, count: int) -> None:
+    product = Product(sku='EMB-1', name='Embedded', unit_cost='1.00', unit_price='2.00')
+    db_session.add(product)
+    db_session.flush()
+    for index in range(count):
+        db_session.add(
+            ProductImage(
+                product_id=product.id,
+                file_name=f'{index}.png',
+                content_type='image/png',
+                s3_bucket='bucket',
+                s3_key=f'images/{index}.png',
+                s3_url=f'https://example.com/{index}.png',
+                embedding=[0.0] * 1536,
+            )
+        )
+    db_session.commit()
+
+
+def test_reembedding_job_resumes_from_checkpoint_and_swaps_shadow_column(db_session):
+    _seed_images(db_session, 5)
+    storage = FakeStorage()
+    embeddings = FakeEmbeddings()
+
+    first = ImageReembeddingJob(
+        db_session, model='new-model', batch_size=2, storage_service=storage, embedding_service=embeddings
+    ).run(max_batches=1)
+    assert first.processed == 2
+    assert first.completed is False
+
+    second = ImageReembeddingJob(
+        db_session, model='new-model', batch_size=2, storage_service=storage, embedding_service=embeddings
+    ).run()
+    assert second.processed == 3
+    assert second.total_processed == 5
+    assert second.completed is True
+    assert embeddings.batch_sizes == [2, 2, 1]
+    assert len(storage.downloads) == 5
+
+    db_session.expire_all()
+    images = db_session.query(ProductImage).all()
+    assert all(image.embedding_next is None for image in images)
+    assert all(float(image.embedding[0]) == 0.5 for image in images)
+    checkpoint = db_session.query(ReembeddingCheckpoint).filter(ReembeddingCheckpoint.model == 'new-model').one()
+    assert checkpoint.status == 'completed'
+    assert checkpoint.last_image_id == images[-1].id
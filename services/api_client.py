@@ -6,6 +6,7 @@ import requests
 class EasyEcomApiClient:
     def __init__(self, base_url: str | None = None):
         self.base_url = (base_url or os.getenv('API_BASE_URL', 'http://localhost/api')).rstrip('/')
+        self._product_cache: dict[str, tuple[str, list[dict]]] = {}
 
     def _url(self, path: str) -> str:
         return f"{self.base_url}{path}"
@@ -20,7 +21,24 @@ class EasyEcomApiClient:
         return response.json()
 
     def get_products(self, client_id: str) -> list[dict]:
-        response = requests.get(self._url('/products'), params={'client_id': client_id}, timeout=10)
+        cached = self._product_cache.get(client_id)
+        headers = {'If-None-Match': cached[0]} if cached else {}
+        response = requests.get(self._url('/products'), params={'client_id': client_id}, headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        response.raise_for_status()
+        products = response.json()
+        etag = response.headers.get('ETag')
+        if etag:
+            self._product_cache[client_id] = (etag, products)
+        return products
+
+    def search_products(self, client_id: str, query: str, limit: int = 20) -> list[dict]:
+        response = requests.get(
+            self._url('/products/search'),
+            params={'client_id': client_id, 'q': query, 'limit': limit},
+            timeout=10,
+        )
         response.raise_for_status()
         return response.json()
 
@@ -38,6 +56,11 @@ class EasyEcomApiClient:
         response.raise_for_status()
         return response.json()
 
+    def get_sales_summary(self, client_id: str, days: int = 30) -> dict:
+        response = requests.get(self._url('/sales/summary'), params={'client_id': client_id, 'days': days}, timeout=10)
+        response.raise_for_status()
+        return response.json()
+
     def create_sale(self, client_id: str, product_id: int, qty: int, selling_price: float) -> dict:
         response = requests.post(
             self._url('/sales'),
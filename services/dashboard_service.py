@@ -7,12 +7,27 @@ from urllib import error, parse, request
 
 import pandas as pd
 
-from ai_agents.discount_supervisor import DiscountSupervisor
-
+from ai_agents.promotion_rules import (
+    APPROVE,
+    EXECUTIVE_APPROVAL,
+    REJECT,
+    SUPERVISOR_REVIEW,
+    PromotionRules,
+    compile_rules,
+)
+
+# Catalog rows carry cost but no list price, so governance scenarios assume this starting margin.
+BASELINE_MARGIN_PCT = 35.0
+GOVERNANCE_STATUS = {
+    APPROVE: "approved",
+    SUPERVISOR_REVIEW: "escalated",
+    EXECUTIVE_APPROVAL: "escalated",
+    REJECT: "rejected",
+}
 MOVEMENT_TYPES = ["in", "out", "adjustment", "return_in", "return_out"]
 DASHBOARD_API_ENDPOINTS = [
     {"label": "Profit & loss", "path": "/api/v1/reports/profit-loss", "params_key": "profit_loss"},
-    {"label": "Returns", "path": "/api/v1/returns", "params_key": "returns"},
+    {"label": "Returns", "path": "/api/v1/returns/summary", "params_key": "returns"},
     {"label": "Stock aging", "path": "/api/v1/reports/stock-aging", "params_key": "stock_aging"},
     {"label": "Inventory movements", "path": "/api/v1/inventory/movements", "params_key": "movements"},
     {"label": "Session logs", "path": "/api/v1/sessions/logs", "params_key": "session_logs"},
@@ -33,7 +48,7 @@ def _coerce_sales_frame(df_sales: pd.DataFrame) -> pd.DataFrame:
     return frame
 
 
-def compute_executive_kpis(df_products: pd.DataFrame, df_sales: pd.DataFrame, returns_payload: list[dict]) -> dict:
+def compute_executive_kpis(df_products: pd.DataFrame, df_sales: pd.DataFrame, returns_payload: dict | list[dict]) -> dict:
     sales = _coerce_sales_frame(df_sales)
     now = pd.Timestamp.now()
     day_start = now.normalize()
@@ -45,23 +60,7 @@ def compute_executive_kpis(df_products: pd.DataFrame, df_sales: pd.DataFrame, re
             return 0.0
         return float(sales.loc[sales["date"] >= start, column].sum())
 
-    inventory_value = float(pd.to_numeric(df_products.get("total_cost", 0), errors="coerce").fillna(0).sum())
     sold_units = float(pd.to_numeric(sales.get("quantity_sold", 0), errors="coerce").fillna(0).sum())
-    on_hand_units = float(pd.to_numeric(df_products.get("quantity", 0), errors="coerce").fillna(0).sum())
-    available_units = sold_units + on_hand_units
-    sell_through = (sold_units / available_units * 100) if available_units > 0 else 0
-
-    refund_value = 0.0
-    return_rate = 0.0
-    if returns_payload:
-        returned_units = 0.0
-        for item in returns_payload:
-            qty = float(item.get("quantity", 0) or 0)
-            price = float(item.get("unit_price", 0) or 0)
-            returned_units += qty
-            refund_value += qty * price
-        return_rate = (returned_units / sold_units * 100) if sold_units > 0 else 0
-
     total_revenue = float(sales["total_sale"].sum()) if not sales.empty else 0.0
     total_profit = float(sales["profit"].sum()) if not sales.empty else 0.0
 
@@ -77,12 +76,53 @@ def compute_executive_kpis(df_products: pd.DataFrame, df_sales: pd.DataFrame, re
         "mtd_revenue": mtd_revenue,
         "gross_profit": total_profit,
         "gross_margin": (total_profit / total_revenue * 100) if total_revenue > 0 else 0,
+        **_stock_and_returns_kpis(df_products, sold_units, returns_payload),
+        "week_profit": week_profit,
+        "month_profit": month_profit,
+    }
+
+
+def kpis_from_summary(df_products: pd.DataFrame, summary: dict, returns_payload: dict | list[dict]) -> dict:
+    """Same shape as ``compute_executive_kpis``, taken from the ``/sales/summary`` rollup."""
+    kpis = summary.get("kpis", {})
+    return {
+        "today_revenue": float(kpis.get("today_revenue", 0) or 0),
+        "week_revenue": float(kpis.get("week_revenue", 0) or 0),
+        "mtd_revenue": float(kpis.get("mtd_revenue", 0) or 0),
+        "gross_profit": float(kpis.get("gross_profit", 0) or 0),
+        "gross_margin": float(kpis.get("gross_margin", 0) or 0),
+        **_stock_and_returns_kpis(df_products, float(kpis.get("units_sold", 0) or 0), returns_payload),
+        "week_profit": float(kpis.get("week_profit", 0) or 0),
+        "month_profit": float(kpis.get("month_profit", 0) or 0),
+    }
+
+
+def _stock_and_returns_kpis(df_products: pd.DataFrame, sold_units: float, returns_payload: dict | list[dict]) -> dict:
+    inventory_value = float(pd.to_numeric(df_products.get("total_cost", 0), errors="coerce").fillna(0).sum())
+    on_hand_units = float(pd.to_numeric(df_products.get("quantity", 0), errors="coerce").fillna(0).sum())
+    available_units = sold_units + on_hand_units
+    sell_through = (sold_units / available_units * 100) if available_units > 0 else 0
+
+    refund_value = 0.0
+    return_rate = 0.0
+    if isinstance(returns_payload, dict):
+        # ``/returns/summary`` already aggregated the window server-side.
+        refund_value = float(returns_payload.get("refund_value", 0) or 0)
+        return_rate = float(returns_payload.get("return_rate", 0) or 0)
+    elif returns_payload:
+        returned_units = 0.0
+        for item in returns_payload:
+            qty = float(item.get("quantity", 0) or 0)
+            price = float(item.get("unit_price", 0) or 0)
+            returned_units += qty
+            refund_value += qty * price
+        return_rate = (returned_units / sold_units * 100) if sold_units > 0 else 0
+
+    return {
         "inventory_value": inventory_value,
         "sell_through": sell_through,
         "return_rate": return_rate,
         "refund_value": refund_value,
-        "week_profit": week_profit,
-        "month_profit": month_profit,
     }
 
 
@@ -125,6 +165,55 @@ def sales_performance_frames(df_sales: pd.DataFrame) -> dict[str, pd.DataFrame |
     }
 
 
+def sales_frames_from_summary(summary: dict) -> dict[str, pd.DataFrame | float]:
+    """Same shape as ``sales_performance_frames``, built from the per-product and daily rollups."""
+    products = pd.DataFrame(summary.get("products", []))
+    if products.empty:
+        return sales_performance_frames(pd.DataFrame())
+
+    products = products.rename(columns={"revenue": "total_sale"})
+    for column in ["total_sale", "profit"]:
+        products[column] = pd.to_numeric(products[column], errors="coerce").fillna(0)
+    products["margin_pct"] = (products["profit"] / products["total_sale"].replace(0, pd.NA) * 100).fillna(0)
+    product_profit = products[["product_name", "profit", "total_sale", "margin_pct"]].sort_values("profit", ascending=False)
+
+    daily_orders = pd.DataFrame(summary.get("daily", []), columns=["day", "order_count", "revenue", "profit"])
+    daily_orders["revenue"] = pd.to_numeric(daily_orders["revenue"], errors="coerce").fillna(0)
+    daily_orders["aov"] = (daily_orders["revenue"] / daily_orders["order_count"].replace(0, pd.NA)).fillna(0)
+
+    kpis = summary.get("kpis", {})
+    order_count = int(kpis.get("sale_count", 0) or 0)
+    gross_revenue = float(kpis.get("gross_revenue", 0) or 0)
+    return {
+        "revenue_by_product": products[["product_name", "total_sale"]].sort_values("total_sale", ascending=False),
+        "profit_by_product": product_profit,
+        "margin_distribution": product_profit[["product_name", "margin_pct"]],
+        "top_profit": product_profit.head(10),
+        "bottom_profit": product_profit.sort_values("profit", ascending=True).head(10),
+        "daily_orders": daily_orders[["day", "order_count", "revenue", "aov"]],
+        "aov": gross_revenue / order_count if order_count else 0.0,
+        "order_count": order_count,
+    }
+
+
+def recent_sales_from_summary(summary: dict) -> pd.DataFrame:
+    """Collapse the rollup's 30-day unit counts into a sales frame ``inventory_health_frames`` can read."""
+    rows = [
+        {
+            "date": pd.Timestamp.now(),
+            "product_name": product["product_name"],
+            "quantity_sold": product.get("units_last_30_days", 0),
+            "total_sale": 0,
+            "profit": 0,
+            "unit_price": 0,
+            "unit_cost": 0,
+            "cost_of_goods_sold": 0,
+        }
+        for product in summary.get("products", [])
+    ]
+    return pd.DataFrame(rows)
+
+
 def inventory_health_frames(df_products: pd.DataFrame, df_sales: pd.DataFrame, stock_aging_rows: list[dict]) -> dict:
     products = df_products.copy()
     days_remaining_columns = ["product_name", "quantity", "quantity_sold", "daily_velocity", "days_remaining"]
@@ -169,53 +258,33 @@ def discount_governance_snapshot(df_products: pd.DataFrame, profile: dict) -> tu
     if products.empty:
         return pd.DataFrame(), {"approved": 0, "rejected": 0, "escalated": 0}
 
-    supervisor = DiscountSupervisor()
-    rows = []
+    rules = compile_rules(PromotionRules.from_profile(profile))
     max_discount = float(profile.get("max_discount_pct", 0) or 0)
     commission_pct = float(profile.get("sales_commission_pct", 0) or 0)
 
     products["unit_cost"] = pd.to_numeric(products["unit_cost"], errors="coerce").fillna(0)
-    products = products[products["unit_cost"] > 0].copy()
+    products = products[products["unit_cost"] > 0]
+    if products.empty:
+        return pd.DataFrame(), {"approved": 0, "rejected": 0, "escalated": 0}
 
     scenario_discounts = [max(2.0, max_discount * 0.3), max(5.0, max_discount * 0.7), max(max_discount + 3, 20.0)]
-    for _, row in products.head(8).iterrows():
-        baseline_margin = 35.0
-        for requested in scenario_discounts:
-            decision = supervisor.evaluate(
-                {
-                    "product_name": row["product_name"],
-                    "current_margin_pct": baseline_margin,
-                    "requested_discount_pct": requested,
-                    "client_context": profile,
-                }
-            )
-            action = decision["action"]
-            status = "approved"
-            if action == "reject_discount":
-                status = "rejected"
-            elif action in {"executive_approval_required", "supervisor_review_required"}:
-                status = "escalated"
-
-            post_margin = float(decision["metadata"]["post_discount_margin"])
-            commission_impact = max(0.0, requested) * commission_pct / 100
-            rows.append(
-                {
-                    "product_name": row["product_name"],
-                    "requested_discount_pct": round(requested, 2),
-                    "policy_max_discount_pct": max_discount,
-                    "post_discount_margin_pct": round(post_margin, 2),
-                    "status": status,
-                    "commission_impact_pct": round(commission_impact, 2),
-                }
-            )
-
-    snapshot = pd.DataFrame(rows)
-    counts = {
-        "approved": int((snapshot["status"] == "approved").sum()) if not snapshot.empty else 0,
-        "rejected": int((snapshot["status"] == "rejected").sum()) if not snapshot.empty else 0,
-        "escalated": int((snapshot["status"] == "escalated").sum()) if not snapshot.empty else 0,
-    }
-    return snapshot, counts
+    snapshot = pd.DataFrame(
+        {
+            "product_name": products["product_name"].repeat(len(scenario_discounts)).to_numpy(),
+            "requested_discount_pct": scenario_discounts * len(products),
+        }
+    )
+    categories = products["category"].repeat(len(scenario_discounts)).to_numpy() if "category" in products else None
+    decisions = rules.evaluate(BASELINE_MARGIN_PCT, snapshot["requested_discount_pct"].to_numpy(), categories)
+
+    snapshot["requested_discount_pct"] = snapshot["requested_discount_pct"].round(2)
+    snapshot["policy_max_discount_pct"] = max_discount
+    snapshot["post_discount_margin_pct"] = decisions["post_discount_margin"].round(2)
+    snapshot["status"] = pd.Series(decisions["action"]).map(GOVERNANCE_STATUS).to_numpy()
+    snapshot["commission_impact_pct"] = (snapshot["requested_discount_pct"].clip(lower=0) * commission_pct / 100).round(2)
+
+    counts = snapshot["status"].value_counts()
+    return snapshot, {status: int(counts.get(status, 0)) for status in ("approved", "rejected", "escalated")}
 
 
 def _request_json(path: str, params: dict | None = None) -> list[dict] | dict | None:
@@ -238,10 +307,16 @@ def _request_json(path: str, params: dict | None = None) -> list[dict] | dict |
         return None
 
 
-def load_api_dashboard_context() -> dict:
+def load_sales_summary(client_id) -> dict | None:
+    summary = _request_json("/sales/summary", {"client_id": str(client_id)})
+    return summary if isinstance(summary, dict) else None
+
+
+def load_api_dashboard_context(client_id: str | None = None) -> dict:
     today = datetime.now().strftime("%Y-%m-%d")
     query_params = {
         "profit_loss": {"period_start": today, "period_end": today},
+        "returns": {"client_id": str(client_id)} if client_id is not None else None,
         "stock_aging": {"as_of_date": today},
     }
     endpoint_payloads = {
@@ -268,7 +343,7 @@ def load_api_dashboard_context() -> dict:
 
     return {
         "profit_loss": profit_loss if isinstance(profit_loss, dict) else {},
-        "returns": returns if isinstance(returns, list) else [],
+        "returns": returns if isinstance(returns, dict) else {},
         "stock_aging_rows": stock_aging_rows,
         "movements": movements if isinstance(movements, list) else [],
         "session_logs": session_logs if isinstance(session_logs, list) else [],
@@ -4,7 +4,7 @@ from services.dashboard_service import load_api_dashboard_context
 def test_load_api_dashboard_context_tracks_dashboard_endpoints(monkeypatch):
     payload_by_path = {
         "/api/v1/reports/profit-loss": {"profit": "10.00"},
-        "/api/v1/returns": [{"id": 1}],
+        "/api/v1/returns/summary": {"return_rate": 12.5, "refund_value": "15.00"},
         "/api/v1/reports/stock-aging": {"rows": [{"sku": "SKU-1"}]},
         "/api/v1/inventory/movements": [],
         "/api/v1/sessions/logs": [{"id": 2}],
@@ -22,3 +22,60 @@ def test_load_api_dashboard_context_tracks_dashboard_endpoints(monkeypatch):
     assert all(status["connected"] for status in context["endpoint_statuses"])
     assert context["api_connected"] is True
     assert context["stock_aging_rows"] == [{"sku": "SKU-1"}]
+    assert context["returns"]["return_rate"] == 12.5
+
+
+def test_summary_helpers_match_frame_shapes():
+    import pandas as pd
+
+    from services.dashboard_service import inventory_health_frames, kpis_from_summary, recent_sales_from_summary, sales_frames_from_summary
+
+    summary = {
+        "kpis": {"today_revenue": "90.00", "gross_revenue": "90.00", "gross_profit": "30.00", "gross_margin": 33.3, "units_sold": 6, "sale_count": 3},
+        "products": [{"product_id": 1, "product_name": "Mug", "units": 6, "units_last_30_days": 6, "revenue": "90.00", "profit": "30.00"}],
+        "daily": [{"day": "2026-10-19", "order_count": 3, "revenue": "90.00", "profit": "30.00"}],
+    }
+    products = pd.DataFrame([{"product_name": "Mug", "quantity": 4, "total_cost": 40}])
+
+    kpis = kpis_from_summary(products, summary, [{"quantity": 3, "unit_price": 15}])
+    assert kpis["today_revenue"] == 90.0
+    assert kpis["sell_through"] == 60.0
+    assert kpis["return_rate"] == 50.0
+    assert kpis_from_summary(products, summary, {"return_rate": 12.5, "refund_value": "15.00"})["refund_value"] == 15.0
+
+    frames = sales_frames_from_summary(summary)
+    assert frames["order_count"] == 3
+    assert frames["aov"] == 30.0
+    assert frames["daily_orders"]["aov"].tolist() == [30.0]
+
+    inventory = inventory_health_frames(products, recent_sales_from_summary(summary), [])
+    assert inventory["days_remaining"]["daily_velocity"].tolist() == [0.2]
+
+
+def test_compiled_promotion_rules_match_discount_supervisor():
+    from ai_agents.discount_supervisor import DiscountSupervisor
+    from ai_agents.promotion_rules import PromotionRules, compile_rules
+
+    profile = {"max_discount_pct": 15, "minimum_margin_pct": 25, "discount_excluded_categories": "Clearance"}
+    margins = [35.0, 35.0, 35.0, 30.0, 30.0, 50.0]
+    requested = [4.0, 12.0, 18.0, 8.0, 8.0, 5.0]
+    overrides = [False, False, False, False, True, False]
+    rules = compile_rules(PromotionRules.from_profile(profile))
+    result = rules.evaluate(margins, requested, ["Mugs", "Mugs", "Mugs", "Mugs", "Mugs", " clearance"], overrides)
+
+    supervisor = DiscountSupervisor()
+    expected = [
+        supervisor.evaluate(
+            {
+                "current_margin_pct": margin,
+                "requested_discount_pct": discount,
+                "minimum_margin_pct": 25,
+                "strategic_override": override,
+                "client_context": profile,
+            }
+        )["action"]
+        for margin, discount, override in zip(margins[:5], requested[:5], overrides[:5])
+    ]
+    assert result["action"][:5].tolist() == expected
+    assert result["action"][5] == "reject_discount"
+    assert compile_rules(PromotionRules.from_profile(profile)) is rules
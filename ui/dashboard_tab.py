@@ -10,7 +10,11 @@ from services.dashboard_service import (
     compute_executive_kpis,
     discount_governance_snapshot,
     inventory_health_frames,
+    kpis_from_summary,
     load_api_dashboard_context,
+    load_sales_summary,
+    recent_sales_from_summary,
+    sales_frames_from_summary,
     sales_performance_frames,
     summarize_movements,
 )
@@ -52,10 +56,16 @@ def render_dashboard_tab(client_id, include_finance: bool = True):
         st.write(f"**Return policy:** {profile.get('return_refund_policy', 'N/A')}")
 
     df_products = load_products(client_id)
-    df_sales = load_sales(client_id)
-    api_context = load_api_dashboard_context()
-
-    kpis = compute_executive_kpis(df_products, df_sales, api_context["returns"])
+    api_context = load_api_dashboard_context(client_id)
+    sales_summary = load_sales_summary(client_id)
+    if sales_summary is not None:
+        df_sales = recent_sales_from_summary(sales_summary)
+        kpis = kpis_from_summary(df_products, sales_summary, api_context["returns"])
+        sales_frames = sales_frames_from_summary(sales_summary)
+    else:
+        df_sales = load_sales(client_id)
+        kpis = compute_executive_kpis(df_products, df_sales, api_context["returns"])
+        sales_frames = sales_performance_frames(df_sales)
 
     if include_finance:
         st.subheader("Executive KPI strip")
@@ -69,7 +79,6 @@ def render_dashboard_tab(client_id, include_finance: bool = True):
         st.markdown("---")
 
         st.subheader("Sales performance")
-        sales_frames = sales_performance_frames(df_sales)
 
         left, right = st.columns(2)
         if not sales_frames["revenue_by_product"].empty:
@@ -116,7 +125,7 @@ def render_dashboard_tab(client_id, include_finance: bool = True):
         c1.metric("Total SKUs", len(df_products))
         c2.metric("Low-stock SKUs", int((df_products.get("quantity", 0) <= 5).sum()) if not df_products.empty else 0)
         c3.metric("Out-of-stock SKUs", int((df_products.get("quantity", 0) <= 0).sum()) if not df_products.empty else 0)
-        c4.metric("Orders (records)", len(df_sales))
+        c4.metric("Orders (records)", sales_frames["order_count"])
 
     st.markdown("---")
     st.subheader("Inventory health & risk")
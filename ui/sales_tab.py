@@ -7,17 +7,20 @@ from services.api_client import EasyEcomApiClient
 api_client = EasyEcomApiClient()
 
 
-def render_sales_tab(client_id: str, include_finance: bool = True):
-    st.subheader('Sales Entry')
+def _render_sale_entry(client_id: str):
+    query = st.text_input('Find product', placeholder='Name, SKU or category')
+    if not query.strip():
+        st.info('Type at least one character to search the catalog.')
+        return
 
     try:
-        products = api_client.get_products(client_id)
+        products = api_client.search_products(client_id, query.strip())
     except Exception as exc:
-        st.error(f'Could not load products: {exc}')
+        st.error(f'Could not search products: {exc}')
         return
 
     if not products:
-        st.warning('No products available. Add products first.')
+        st.warning('No products match your search.')
         return
 
     product_options = {f"{p['name']} (#{p['id']})": p for p in products}
@@ -35,6 +38,11 @@ def render_sales_tab(client_id: str, include_finance: bool = True):
         except Exception as exc:
             st.error(f'Failed to record sale: {exc}')
 
+
+def render_sales_tab(client_id: str, include_finance: bool = True):
+    st.subheader('Sales Entry')
+    _render_sale_entry(client_id)
+
     st.markdown('---')
     st.subheader('Sales')
     try: